@@ -0,0 +1,127 @@
+import random
+
+import pytest
+import pytest_asyncio
+import sqlalchemy
+
+from benchmarks.conftest import Author, Book, Publisher, base_ormar_config
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def books_in_db(num_models: int):
+    """
+    Inserts rows with core inserts in chunks, as building models for
+    the largest tables would dominate the setup time.
+    """
+    authors = [Author(name=f"author {i}", score=i % 100) for i in range(100)]
+    await Author.objects.bulk_create(authors)
+    publisher = await Publisher(name="Publisher", prestige=5).save()
+    author_ids = [author.id for author in await Author.objects.all()]
+    table = Book.ormar_config.table
+    async with base_ormar_config.database.get_query_executor() as executor:
+        for start in range(0, num_models, 10_000):
+            rows = [
+                {
+                    "author": random.choice(author_ids),
+                    "publisher": publisher.id,
+                    "title": f"book {i}",
+                    "year": 1900 + i % 100,
+                }
+                for i in range(start, min(start + 10_000, num_models))
+            ]
+            await executor.execute_many(table.insert(), rows)
+    return num_models
+
+
+async def legacy_count(queryset) -> int:
+    """
+    Count shape used before - full select wrapped in a subquery
+    and grouped by primary key in another one.
+    """
+    expr = queryset.build_select_expression().alias("subquery_for_count")
+    expr = sqlalchemy.func.count().select().select_from(expr)
+    expr = expr.group_by("id").alias("subquery_for_group")
+    expr = sqlalchemy.func.count().select().select_from(expr)
+    async with base_ormar_config.database.get_query_executor() as executor:
+        return await executor.fetch_val(expr)
+
+
+@pytest.mark.parametrize("num_models", [10_000, 1_000_000])
+async def test_count_plain(aio_benchmark, num_models: int, books_in_db: int):
+    @aio_benchmark
+    async def count():
+        return await Book.objects.filter(year__gte=1950).count()
+
+    assert count() == num_models // 2
+
+
+@pytest.mark.parametrize("num_models", [10_000, 1_000_000])
+async def test_count_plain_legacy(aio_benchmark, num_models: int, books_in_db: int):
+    @aio_benchmark
+    async def count():
+        return await legacy_count(Book.objects.filter(year__gte=1950))
+
+    assert count() == num_models // 2
+
+
+@pytest.mark.parametrize("num_models", [10_000, 1_000_000])
+async def test_count_foreign_key_join(aio_benchmark, num_models: int, books_in_db: int):
+    @aio_benchmark
+    async def count():
+        return await Book.objects.select_related(["author", "publisher"]).count()
+
+    assert count() == num_models
+
+
+@pytest.mark.parametrize("num_models", [10_000, 1_000_000])
+async def test_count_foreign_key_join_legacy(
+    aio_benchmark, num_models: int, books_in_db: int
+):
+    @aio_benchmark
+    async def count():
+        return await legacy_count(Book.objects.select_related(["author", "publisher"]))
+
+    assert count() == num_models
+
+
+@pytest.mark.parametrize("num_models", [10_000, 1_000_000])
+async def test_count_reverse_join(aio_benchmark, num_models: int, books_in_db: int):
+    @aio_benchmark
+    async def count():
+        return await Author.objects.filter(books__year__gte=1990).count()
+
+    assert count() == 100
+
+
+@pytest.mark.parametrize("num_models", [10_000, 1_000_000])
+async def test_count_reverse_join_legacy(
+    aio_benchmark, num_models: int, books_in_db: int
+):
+    @aio_benchmark
+    async def count():
+        return await legacy_count(Author.objects.filter(books__year__gte=1990))
+
+    assert count() == 100
+
+
+@pytest.mark.parametrize("num_models", [10_000, 1_000_000])
+async def test_exists(aio_benchmark, num_models: int, books_in_db: int):
+    @aio_benchmark
+    async def exists():
+        return await Book.objects.select_related("author").filter(year=1999).exists()
+
+    assert exists()
+
+
+@pytest.mark.parametrize("num_models", [10_000, 1_000_000])
+async def test_exists_legacy(aio_benchmark, num_models: int, books_in_db: int):
+    @aio_benchmark
+    async def exists():
+        queryset = Book.objects.select_related("author").filter(year=1999)
+        expr = sqlalchemy.exists(queryset.build_select_expression()).select()
+        async with base_ormar_config.database.get_query_executor() as executor:
+            return await executor.fetch_val(expr)
+
+    assert exists()
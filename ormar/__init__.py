@@ -24,6 +24,8 @@ from ormar.protocols import QuerySetProtocol, RelationProtocol  # noqa: I001
 from importlib.metadata import version
 
 from ormar.decorators import (  # noqa: I100
+    post_bulk_create,
+    post_bulk_delete,
     post_bulk_update,
     post_delete,
     post_relation_add,
@@ -74,8 +76,41 @@ from ormar.fields import (
 
 # noqa: I100
 from ormar.databases.connection import DatabaseConnection
-from ormar.models import ExcludableItems, Extra, Model, OrmarConfig
-from ormar.queryset import NullsOrdering, OrderAction, QuerySet, and_, or_
+from ormar.databases.query_cache import (
+    InMemoryQueryCache,
+    QueryCacheBackend,
+    SQLiteQueryCache,
+)
+from ormar.databases.request_cache import (
+    RequestCache,
+    RequestCacheMiddleware,
+    request_cache,
+)
+from ormar.models import (
+    ExcludableItems,
+    Extra,
+    IdentityMap,
+    Model,
+    ModelCache,
+    OrmarConfig,
+    UnitOfWork,
+    identity_map,
+    unit_of_work,
+)
+from ormar.queryset import (
+    Aggregate,
+    Avg,
+    BatchLoader,
+    Count,
+    Max,
+    Min,
+    Sum,
+    NullsOrdering,
+    OrderAction,
+    QuerySet,
+    and_,
+    or_,
+)
 from ormar.relations import RelationType
 from ormar.signals import Signal
 
@@ -118,6 +153,8 @@ __all__ = [
     "ReferentialAction",
     "QuerySetProtocol",
     "RelationProtocol",
+    "post_bulk_create",
+    "post_bulk_delete",
     "post_bulk_update",
     "post_delete",
     "post_save",
@@ -146,4 +183,22 @@ __all__ = [
     "Extra",
     "OrmarConfig",
     "DatabaseConnection",
+    "UnitOfWork",
+    "unit_of_work",
+    "IdentityMap",
+    "identity_map",
+    "ModelCache",
+    "QueryCacheBackend",
+    "InMemoryQueryCache",
+    "SQLiteQueryCache",
+    "BatchLoader",
+    "RequestCache",
+    "RequestCacheMiddleware",
+    "request_cache",
+    "Aggregate",
+    "Count",
+    "Sum",
+    "Avg",
+    "Min",
+    "Max",
 ]
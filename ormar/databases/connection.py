@@ -9,8 +9,11 @@ from typing import Any, AsyncIterator, Optional
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 
+from ormar.databases.query_cache import InMemoryQueryCache, QueryCacheBackend
 from ormar.databases.query_executor import QueryExecutor
-from ormar.databases.transaction import Transaction
+from ormar.databases.request_cache import get_request_cache
+from ormar.databases.single_flight import SingleFlight
+from ormar.databases.transaction import Transaction, register_transaction_writes
 
 _transaction_connection: ContextVar[Optional[AsyncConnection]] = ContextVar(
     "_transaction_connection", default=None
@@ -27,9 +30,16 @@ class DatabaseConnection:
         Initialize database connection.
 
         :param url: Database URL with an async driver (e.g., postgresql+asyncpg://)
-        :param options: Additional engine options
+        :param options: Additional engine options, `query_cache` sets the backend
+            used by `QuerySet.cache()` (in memory of the process by default,
+            created when cached query is first executed),
+            `single_flight` enables sharing of identical concurrent select queries
         """
         self._force_rollback = options.pop("force_rollback", False)
+        self.query_cache: Optional[QueryCacheBackend] = options.pop("query_cache", None)
+        self.single_flight: Optional[SingleFlight] = (
+            SingleFlight() if options.pop("single_flight", False) else None
+        )
         self._url = url
         # Set reasonable pool defaults if not provided
         if "pool_size" not in options:
@@ -130,7 +140,7 @@ class DatabaseConnection:
 
     @asynccontextmanager
     async def get_query_executor(
-        self, *, transactional: bool = False
+        self, *, transactional: bool = False, detached: bool = False
     ) -> AsyncIterator[QueryExecutor]:
         """
         Get connection, reusing transaction connection if in transaction.
@@ -142,25 +152,68 @@ class DatabaseConnection:
             separately or because the driver (asyncpg) requires a
             transaction for streaming.
         :type transactional: bool
+        :param detached: If True, always use a separate connection from the pool,
+            ignoring the transaction active in current context. Used to run
+            independent statements concurrently (i.e. chunks of bulk operations).
+        :type detached: bool
         :return: QueryExecutor wrapping a connection
         :rtype: QueryExecutor
         """
-        trans_conn = self.get_transaction_connection()
-        if trans_conn is not None:
+        trans_conn = None if detached else self.get_transaction_connection()
+        if detached and transactional:
+            # Own transaction on own connection, not registered in the context
+            # so it does not interfere with other transactions of this task
+            async with self.engine.connect() as detached_conn:
+                async with detached_conn.begin():
+                    executor = QueryExecutor(detached_conn, on_write=self._on_write)
+                    yield executor
+            # invalidate again rows cached before the commit
+            if self.query_cache is not None and executor.written_tables:
+                await self.query_cache.bump_versions(executor.written_tables)
+        elif trans_conn is not None:
             # Inside a transaction - reuse the transaction's connection
-            yield QueryExecutor(trans_conn)
+            yield QueryExecutor(trans_conn, on_write=self._on_write)
         elif transactional:
             async with self.transaction():
                 conn = self.get_transaction_connection()
                 assert conn is not None
-                yield QueryExecutor(conn)
+                yield QueryExecutor(conn, on_write=self._on_write)
         else:
             # Outside transaction: use AUTOCOMMIT view so each statement
             # commits at the driver level with no extra BEGIN/COMMIT
             # round-trip.
             assert self._autocommit_engine is not None
             async with self._autocommit_engine.connect() as conn:
-                yield QueryExecutor(conn)
+                yield QueryExecutor(conn, on_write=self._on_write)
+
+    def get_query_cache(self) -> QueryCacheBackend:
+        """
+        Returns the query cache backend, creating the default in memory one if
+        it was not set. Until then writes do not maintain any table versions.
+
+        :return: query cache backend
+        :rtype: QueryCacheBackend
+        """
+        if self.query_cache is None:
+            self.query_cache = InMemoryQueryCache()
+        return self.query_cache
+
+    async def _on_write(self, tables: set[str]) -> None:
+        """
+        Bumps versions of written tables in the query cache (if used). Inside
+        a transaction the tables are bumped again after the transaction ends, so
+        rows cached by other connections before the commit are not served.
+        Rows of the written tables memoized by active request cache are forgotten.
+
+        :param tables: names of written tables
+        :type tables: set[str]
+        """
+        if self.query_cache is not None:
+            await self.query_cache.bump_versions(tables)
+        register_transaction_writes(tables)
+        request_cache = get_request_cache()
+        if request_cache is not None:
+            request_cache.invalidate(tables)
 
     def get_transaction_connection(self) -> Optional[AsyncConnection]:
         """Get the current transaction connection if in a transaction."""
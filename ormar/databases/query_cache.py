@@ -0,0 +1,283 @@
+"""
+QueryCache module - stores raw rows of select queries and versions of tables,
+used to invalidate cached rows after the tables are written to.
+"""
+
+import abc
+import asyncio
+import pickle  # nosec
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.util import find_tables
+
+from ormar.databases.single_flight import fetch_all_shared, get_query_key
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sqlalchemy.sql import Executable
+
+    from ormar.databases.connection import DatabaseConnection
+
+
+class QueryCacheBackend(abc.ABC):
+    """
+    Base class of query cache backends.
+
+    Backend stores cached entries under string keys and keeps a version counter
+    per table name. Versions are bumped by every write to the table, entries
+    are served only if versions of all tables used in the query did not change
+    since the entry was stored.
+
+    Methods are coroutines, so backends doing I/O (files, network) do not block
+    the event loop.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Returns number of cache hits and misses.
+
+        :return: dict with hits and misses
+        :rtype: dict[str, int]
+        """
+        return {"hits": self.hits, "misses": self.misses}
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Returns not expired entry stored under given key.
+
+        :param key: key of the entry
+        :type key: str
+        :return: stored entry or None
+        :rtype: Optional[Any]
+        """
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Stores the entry under given key.
+
+        :param key: key of the entry
+        :type key: str
+        :param value: entry to store
+        :type value: Any
+        :param ttl: number of seconds after which entry expires
+        :type ttl: Optional[float]
+        """
+
+    @abc.abstractmethod
+    async def get_versions(self, tables: Iterable[str]) -> dict[str, int]:
+        """
+        Returns current versions of given tables.
+
+        :param tables: names of the tables
+        :type tables: Iterable[str]
+        :return: dict of table names and versions
+        :rtype: dict[str, int]
+        """
+
+    @abc.abstractmethod
+    async def bump_versions(self, tables: Iterable[str]) -> None:
+        """
+        Increments versions of given tables, invalidating cached entries
+        of queries using those tables.
+
+        :param tables: names of the tables
+        :type tables: Iterable[str]
+        """
+
+    @abc.abstractmethod
+    async def clear(self) -> None:
+        """
+        Removes all cached entries.
+        """
+
+
+class InMemoryQueryCache(QueryCacheBackend):
+    """
+    Query cache kept in memory of the process, with least recently used
+    entries evicted over `max_entries`.
+    """
+
+    def __init__(self, max_entries: int = 1000) -> None:
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[Optional[float], Any]] = OrderedDict()
+        self._versions: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] is not None and entry[0] < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_versions(self, tables: Iterable[str]) -> dict[str, int]:
+        return {table: self._versions.get(table, 0) for table in tables}
+
+    async def bump_versions(self, tables: Iterable[str]) -> None:
+        for table in tables:
+            self._versions[table] = self._versions.get(table, 0) + 1
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class SQLiteQueryCache(QueryCacheBackend):
+    """
+    Query cache stored in a local SQLite file, that can be shared by
+    multiple worker processes on the same host - writes done in one process
+    bump table versions visible to all of them.
+
+    File access and (un)pickling run in a worker thread, so they do not block
+    the event loop. Entries are pickled, so use a file that is writable only
+    by your application.
+    """
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS ormar_query_cache "
+            "(key TEXT PRIMARY KEY, value BLOB, expires REAL)"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS ormar_table_versions "
+            "(name TEXT PRIMARY KEY, version INTEGER NOT NULL)"
+        )
+
+    async def get(self, key: str) -> Optional[Any]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        await asyncio.to_thread(self._set, key, value, ttl)
+
+    async def get_versions(self, tables: Iterable[str]) -> dict[str, int]:
+        versions = {table: 0 for table in tables}
+        if versions:
+            versions.update(await asyncio.to_thread(self._get_versions, versions))
+        return versions
+
+    async def bump_versions(self, tables: Iterable[str]) -> None:
+        await asyncio.to_thread(self._bump_versions, list(tables))
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._execute, "DELETE FROM ormar_query_cache")
+
+    def _get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires FROM ormar_query_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or (row[1] is not None and row[1] < time.time()):
+            return None
+        return pickle.loads(row[0])  # nosec
+
+    def _set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        expires = time.time() + ttl if ttl is not None else None
+        self._execute(
+            "INSERT OR REPLACE INTO ormar_query_cache VALUES (?, ?, ?)",
+            (key, pickle.dumps(value), expires),
+        )
+
+    def _get_versions(self, tables: Iterable[str]) -> dict[str, int]:
+        names = tuple(tables)
+        placeholders = ", ".join("?" for _ in names)
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT name, version FROM ormar_table_versions "  # nosec
+                f"WHERE name IN ({placeholders})",
+                names,
+            ).fetchall()
+        return dict(rows)
+
+    def _bump_versions(self, tables: list[str]) -> None:
+        with self._lock:
+            self._connection.executemany(
+                "INSERT INTO ormar_table_versions VALUES (?, 1) "
+                "ON CONFLICT(name) DO UPDATE SET version = version + 1",
+                [(table,) for table in tables],
+            )
+
+    def _execute(self, sql: str, parameters: tuple = ()) -> None:
+        with self._lock:
+            self._connection.execute(sql, parameters)
+
+
+def get_written_tables(query: Any) -> set[str]:
+    """
+    Returns names of the tables written by the statement.
+
+    :param query: executed statement
+    :type query: Any
+    :return: set of table names, empty for not insert/update/delete statements
+    :rtype: set[str]
+    """
+    if isinstance(query, UpdateBase):
+        return {query.table.fullname}  # type: ignore
+    return set()
+
+
+async def fetch_all_cached(
+    database: "DatabaseConnection", query: "Executable", ttl: Optional[float] = None
+) -> list[dict]:
+    """
+    Returns rows of the select statement from the query cache of the database,
+    if versions of all tables used in the query did not change since
+    they were cached. Otherwise, the query is executed and rows are cached.
+
+    Versions are read before the query is executed, so rows read concurrently
+    with a write are stored as already stale.
+
+    :param database: database on which query is executed
+    :type database: DatabaseConnection
+    :param query: select statement
+    :type query: Executable
+    :param ttl: number of seconds after which rows expire
+    :type ttl: Optional[float]
+    :return: rows with column names as keys
+    :rtype: list[dict]
+    """
+    backend = database.get_query_cache()
+    key = get_query_key(database=database, query=query)
+    versions = await backend.get_versions(
+        sorted({table.fullname for table in find_tables(query)})  # type: ignore
+    )
+    entry = await backend.get(key)
+    if entry is not None and entry[0] == versions:
+        backend.hits += 1
+        return [dict(row) for row in entry[1]]
+    backend.misses += 1
+    rows = [
+        dict(row)
+        for row in await fetch_all_shared(database=database, query=query, key=key)
+    ]
+    await backend.set(key, (versions, rows), ttl=ttl)
+    return rows
@@ -2,12 +2,26 @@
 QueryExecutor module - executes database queries using SQLAlchemy async API.
 """
 
-from typing import Any, AsyncIterator, List, Mapping, Optional, Sequence, Union
-
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+import sqlalchemy
 from sqlalchemy import RowMapping, text
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncConnection
 from sqlalchemy.sql import Executable
+from sqlalchemy.sql.dml import UpdateBase
+
+from ormar.databases.query_cache import get_written_tables
 
 
 class QueryExecutor:
@@ -16,13 +30,38 @@ class QueryExecutor:
     Provides a databases-compatible interface.
     """
 
-    def __init__(self, connection: AsyncConnection) -> None:
+    def __init__(
+        self,
+        connection: AsyncConnection,
+        on_write: Optional[Callable[[set[str]], Awaitable[None]]] = None,
+    ) -> None:
         """
         Initialize query executor.
 
         :param connection: SQLAlchemy async connection
+        :param on_write: Coroutine function called with names of tables written by
+            executed insert, update and delete statements
         """
         self._connection = connection
+        self._on_write = on_write
+        self.written_tables: set[str] = set()
+
+    async def _register_write(
+        self, query: Any, table: Optional[sqlalchemy.Table] = None
+    ) -> None:
+        """
+        Registers tables written by the executed statement and notifies
+        the on_write callback.
+
+        :param query: executed statement
+        :param table: table written by the statement, required for textual
+            statements where it cannot be read from the statement itself
+        """
+        tables = {table.fullname} if table is not None else get_written_tables(query)
+        if tables:
+            self.written_tables.update(tables)
+            if self._on_write is not None:
+                await self._on_write(tables)
 
     async def fetch_all(self, query: Executable) -> List[Any]:
         """
@@ -32,6 +71,8 @@ class QueryExecutor:
         :return: List of Row objects
         """
         result: CursorResult[Any] = await self._connection.execute(query)
+        if isinstance(query, UpdateBase):
+            await self._register_write(query)
         return list(result.mappings().all())
 
     async def fetch_one(self, query: Executable) -> Optional[RowMapping]:
@@ -42,9 +83,26 @@ class QueryExecutor:
         :return: Single Row object or None
         """
         result: CursorResult[Any] = await self._connection.execute(query)
+        if isinstance(query, UpdateBase):
+            await self._register_write(query)
         row = result.mappings().first()
         return row
 
+    async def fetch_many(
+        self, query: Executable, values: Sequence[Mapping[str, Any]]
+    ) -> List[Any]:
+        """
+        Execute a query with many parameter sets and fetch all returned rows
+        (i.e. INSERT ... RETURNING executed for many rows at once).
+
+        :param query: SQLAlchemy query expression
+        :param values: Sequence of parameter mappings
+        :return: List of Row objects
+        """
+        result: CursorResult[Any] = await self._connection.execute(query, values)
+        await self._register_write(query)
+        return list(result.mappings().all())
+
     async def fetch_val(self, query: Executable, column: int = 0) -> Optional[Any]:
         """
         Execute a query and fetch a single scalar value.
@@ -67,6 +125,7 @@ class QueryExecutor:
             For UPDATE/DELETE, the row count.
         """
         result: CursorResult[Any] = await self._connection.execute(query)
+        await self._register_write(query)
 
         # For INSERT queries, try to get the inserted primary key via the
         # dialect's best-available mechanism (RETURNING on PostgreSQL / SQLite
@@ -87,16 +146,81 @@ class QueryExecutor:
         return result.rowcount if result.rowcount is not None else 0
 
     async def execute_many(
-        self, query: Union[Executable, str], values: Sequence[Mapping[str, Any]]
+        self,
+        query: Union[Executable, str],
+        values: Sequence[Mapping[str, Any]],
+        table: Optional[sqlalchemy.Table] = None,
     ) -> None:
         """
         Execute a query multiple times with different parameter sets.
 
         :param query: SQLAlchemy query expression or SQL string
         :param values: Sequence of parameter mappings
+        :param table: table written by the query, has to be passed for
+            SQL strings so cached rows of the table are invalidated
         """
         exec_query = text(query) if isinstance(query, str) else query
         await self._connection.execute(exec_query, values)
+        await self._register_write(exec_query, table=table)
+
+    @property
+    def supports_copy(self) -> bool:
+        """
+        Check if the connection can bulk load rows with the COPY protocol.
+        Only PostgreSQL with the asyncpg driver exposes it.
+
+        :return: True if copy_records can be used
+        """
+        dialect = self._connection.dialect
+        return dialect.name == "postgresql" and dialect.driver == "asyncpg"
+
+    async def copy_records(
+        self, table: sqlalchemy.Table, rows: Sequence[Mapping[str, Any]]
+    ) -> None:
+        """
+        Load rows into a table with the PostgreSQL COPY protocol, using
+        asyncpg's ``copy_records_to_table`` on the raw driver connection.
+
+        Values are passed through the column types bind processors, the same
+        way as in a regular INSERT. Rows with different sets of keys
+        (i.e. some columns left for database defaults) are copied separately.
+
+        :param table: table to load the rows into
+        :param rows: Sequence of mappings with column names as keys
+        """
+        dialect = self._connection.dialect
+        grouped: dict[tuple[str, ...], list[Mapping[str, Any]]] = {}
+        for row in rows:
+            grouped.setdefault(tuple(row.keys()), []).append(row)
+
+        raw_connection = await self._connection.get_raw_connection()
+        driver_connection: Any = raw_connection.driver_connection
+        if (
+            self._connection.in_transaction()
+            and not driver_connection.is_in_transaction()
+        ):
+            # the driver adapter opens transactions lazily on the first
+            # statement, make sure COPY does not run outside of it
+            await self._connection.execute(text("SELECT 1"))
+        for columns, group in grouped.items():
+            processors = [
+                table.columns[name].type.dialect_impl(dialect).bind_processor(dialect)
+                for name in columns
+            ]
+            records = [
+                tuple(
+                    processor(row[name]) if processor else row[name]
+                    for name, processor in zip(columns, processors)
+                )
+                for row in group
+            ]
+            await driver_connection.copy_records_to_table(
+                table.name,
+                records=records,
+                columns=list(columns),
+                schema_name=table.schema,
+            )
+        await self._register_write(table.insert())
 
     async def iterate(self, query: Executable) -> AsyncIterator[Any]:
         """
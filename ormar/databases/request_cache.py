@@ -0,0 +1,147 @@
+"""
+RequestCache module - memoizes rows of select queries for a scope (i.e. one request).
+"""
+
+from contextvars import ContextVar, Token
+from typing import Any, Optional
+
+from sqlalchemy.sql.util import find_tables
+
+_request_cache: ContextVar[Optional["RequestCache"]] = ContextVar(
+    "_request_cache", default=None
+)
+
+
+def get_request_cache() -> Optional["RequestCache"]:
+    """
+    Returns request cache active in current context.
+
+    :return: active request cache or None
+    :rtype: Optional[RequestCache]
+    """
+    return _request_cache.get()
+
+
+def request_cache() -> "RequestCache":
+    """
+    Returns a request cache that can be used as context manager.
+    If a request cache is already active in current context it's returned
+    instead, so nested scopes share the memoized rows.
+
+    :return: request cache
+    :rtype: RequestCache
+    """
+    return get_request_cache() or RequestCache()
+
+
+class RequestCache:
+    """
+    Memoizes rows of select queries executed inside the scope, so the same query
+    (with the same sql and params) executed again returns the memoized rows.
+
+    Rows of queries using a table are forgotten when the table is written
+    inside the scope. Queries executed inside a transaction are not memoized.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[frozenset[str], list]] = {}
+        self._writes = 0
+        self._depth = 0
+        self._token: Optional[Token] = None
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self) -> "RequestCache":
+        if self._depth == 0:
+            self._token = _request_cache.set(self)
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self._depth -= 1
+        if self._depth:
+            return
+        _request_cache.reset(self._token)  # type: ignore
+        self._token = None
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def writes(self) -> int:
+        """
+        Returns number of writes registered in the scope, used to skip memoizing
+        rows of queries running concurrently with a write.
+
+        :return: number of writes
+        :rtype: int
+        """
+        return self._writes
+
+    def get(self, key: str) -> Optional[list]:
+        """
+        Returns memoized rows of the query with given key.
+
+        :param key: key of the query
+        :type key: str
+        :return: memoized rows or None
+        :rtype: Optional[list]
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return list(entry[1])
+
+    def invalidate(self, tables: set[str]) -> None:
+        """
+        Forgets rows of queries using any of given tables.
+
+        :param tables: names of written tables
+        :type tables: set[str]
+        """
+        self._writes += 1
+        self._entries = {
+            key: entry
+            for key, entry in self._entries.items()
+            if not entry[0].intersection(tables)
+        }
+
+    def set(self, key: str, query: Any, rows: list, writes: int) -> None:
+        """
+        Memoizes rows of the query, unless a write happened since
+        the query was started.
+
+        :param key: key of the query
+        :type key: str
+        :param query: select statement
+        :type query: sqlalchemy.sql.Select
+        :param rows: rows returned by the query
+        :type rows: list
+        :param writes: number of writes when the query was started
+        :type writes: int
+        """
+        if writes != self._writes:
+            return
+        tables = frozenset(table.fullname for table in find_tables(query))
+        self._entries[key] = (tables, list(rows))
+
+
+class RequestCacheMiddleware:
+    """
+    ASGI middleware opening a request cache for each http and websocket request.
+
+    app.add_middleware(ormar.RequestCacheMiddleware)
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+        with request_cache():
+            await self.app(scope, receive, send)
@@ -0,0 +1,130 @@
+"""
+SingleFlight module - shares results of identical queries executed concurrently.
+"""
+
+import asyncio
+import hashlib
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
+
+from ormar.databases.request_cache import get_request_cache
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sqlalchemy.sql import Executable
+
+    from ormar.databases.connection import DatabaseConnection
+
+
+def get_query_key(database: "DatabaseConnection", query: "Executable") -> str:
+    """
+    Builds key of the query from sql compiled for the database dialect and bind params.
+
+    :param database: database on which query is executed
+    :type database: DatabaseConnection
+    :param query: select statement
+    :type query: Executable
+    :return: key of the query
+    :rtype: str
+    """
+    compiled = query.compile(dialect=database.dialect)  # type: ignore
+    params = sorted(compiled.params.items())
+    return hashlib.sha256(f"{compiled}\n{params!r}".encode()).hexdigest()
+
+
+class SingleFlight:
+    """
+    Keeps calls in flight by key, so concurrent calls with the same key
+    await one shared call instead of executing it again.
+
+    Shared call runs in a separate task, so cancelling one of the callers
+    does not cancel it for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Task] = {}
+        self.shared = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Returns result of the call in flight for given key, or executes func
+        if there is none.
+
+        :param key: key identifying the call
+        :type key: str
+        :param func: function returning awaitable to execute
+        :type func: Callable[[], Awaitable[Any]]
+        :return: result of the call
+        :rtype: Any
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key=key, task=done))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        """
+        Removes finished call and retrieves its exception, so it's not reported
+        as never retrieved if all callers were cancelled.
+
+        :param key: key identifying the call
+        :type key: str
+        :param task: finished task
+        :type task: asyncio.Task
+        """
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
+
+
+async def fetch_all_shared(
+    database: "DatabaseConnection", query: "Executable", key: Optional[str] = None
+) -> list:
+    """
+    Executes select statement and returns all rows. If `single_flight` is enabled
+    in the database, outside of transactions concurrent identical queries
+    (with the same sql and params) share one execution and its rows.
+
+    Inside a request cache scope rows are memoized, so the same query
+    executed again in the scope returns memoized rows.
+
+    :param database: database on which query is executed
+    :type database: DatabaseConnection
+    :param query: select statement
+    :type query: Executable
+    :param key: already computed key of the query
+    :type key: Optional[str]
+    :return: database rows
+    :rtype: list
+    """
+
+    async def fetch_all() -> list:
+        async with database.get_query_executor() as executor:
+            return await executor.fetch_all(query)
+
+    single_flight = database.single_flight
+    cache = get_request_cache()
+    if (
+        single_flight is None and cache is None
+    ) or database.get_transaction_connection() is not None:
+        return await fetch_all()
+    key = key or get_query_key(database=database, query=query)
+    if cache is None:
+        return list(await single_flight.do(key=key, func=fetch_all))  # type: ignore
+
+    rows = cache.get(key)
+    if rows is not None:
+        return rows
+    writes = cache.writes
+    if single_flight is None:
+        rows = await fetch_all()
+    else:
+        rows = list(await single_flight.do(key=key, func=fetch_all))
+    cache.set(key=key, query=query, rows=rows, writes=writes)
+    return rows
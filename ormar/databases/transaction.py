@@ -4,7 +4,7 @@ Transaction module - provides transaction management with savepoint support.
 
 from contextvars import ContextVar
 from types import TracebackType
-from typing import TYPE_CHECKING, Optional, Type
+from typing import TYPE_CHECKING, Callable, Optional, Type
 
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncTransaction
 
@@ -12,6 +12,36 @@ if TYPE_CHECKING:  # pragma: no cover
     from ormar.databases.connection import DatabaseConnection
 
 _transaction_depth: ContextVar[int] = ContextVar("_transaction_depth", default=0)
+_transaction_writes: ContextVar[Optional[set[str]]] = ContextVar(
+    "_transaction_writes", default=None
+)
+
+_transaction_callbacks: ContextVar[Optional[list[Callable[[], None]]]] = ContextVar(
+    "_transaction_callbacks", default=None
+)
+
+
+def register_transaction_writes(tables: set[str]) -> None:
+    """
+    Registers tables written inside the transaction active in current context.
+
+    :param tables: names of written tables
+    """
+    written = _transaction_writes.get()
+    if written is not None:
+        written.update(tables)
+
+
+def register_transaction_callback(callback: Callable[[], None]) -> None:
+    """
+    Registers callback called after the transaction active in current context ends
+    (committed or rolled back). Outside of transactions nothing is registered.
+
+    :param callback: function called without arguments
+    """
+    callbacks = _transaction_callbacks.get()
+    if callbacks is not None:
+        callbacks.append(callback)
 
 
 class Transaction:
@@ -47,6 +77,8 @@ class Transaction:
         if self._depth == 0:
             self._connection = await self._database.engine.connect().__aenter__()
             self._database.set_transaction_connection(self._connection)
+            _transaction_writes.set(set())
+            _transaction_callbacks.set([])
             self._transaction = await self._connection.begin()
             # SQLite requires an explicit BEGIN before SAVEPOINTs to prevent
             # RELEASE SAVEPOINT from auto-committing when no outer transaction exists.
@@ -84,3 +116,13 @@ class Transaction:
                 self._database.set_transaction_connection(None)
                 if self._connection is not None:
                     await self._connection.close()
+                # invalidate again rows cached by other connections before commit
+                written = _transaction_writes.get()
+                _transaction_writes.set(None)
+                query_cache = self._database.query_cache
+                if written and query_cache is not None:
+                    await query_cache.bump_versions(written)
+                callbacks = _transaction_callbacks.get()
+                _transaction_callbacks.set(None)
+                for callback in callbacks or []:
+                    callback()
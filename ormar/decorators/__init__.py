@@ -8,6 +8,8 @@ Currently only:
 """
 
 from ormar.decorators.signals import (
+    post_bulk_create,
+    post_bulk_delete,
     post_bulk_update,
     post_delete,
     post_relation_add,
@@ -22,6 +24,8 @@ from ormar.decorators.signals import (
 )
 
 __all__ = [
+    "post_bulk_create",
+    "post_bulk_delete",
     "post_bulk_update",
     "post_delete",
     "post_save",
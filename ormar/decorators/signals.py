@@ -173,6 +173,19 @@ def post_relation_remove(
     return receiver(signal="post_relation_remove", senders=senders)
 
 
+def post_bulk_create(senders: Union[type["Model"], list[type["Model"]]]) -> Callable:
+    """
+    Connect given function to all senders for post_bulk_create signal.
+
+    :param senders: one or a list of "Model" classes
+    that should have the signal receiver registered
+    :type senders: Union[type["Model"], list[type["Model"]]]
+    :return: returns the original function untouched
+    :rtype: Callable
+    """
+    return receiver(signal="post_bulk_create", senders=senders)
+
+
 def post_bulk_update(senders: Union[type["Model"], list[type["Model"]]]) -> Callable:
     """
     Connect given function to all senders for post_bulk_update signal.
@@ -184,3 +197,16 @@ def post_bulk_update(senders: Union[type["Model"], list[type["Model"]]]) -> Call
     :rtype: Callable
     """
     return receiver(signal="post_bulk_update", senders=senders)
+
+
+def post_bulk_delete(senders: Union[type["Model"], list[type["Model"]]]) -> Callable:
+    """
+    Connect given function to all senders for post_bulk_delete signal.
+
+    :param senders: one or a list of "Model" classes
+    that should have the signal receiver registered
+    :type senders: Union[type["Model"], list[type["Model"]]]
+    :return: returns the original function untouched
+    :rtype: Callable
+    """
+    return receiver(signal="post_bulk_delete", senders=senders)
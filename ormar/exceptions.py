@@ -87,3 +87,15 @@ class ModelListEmptyError(AsyncOrmException):
     """
 
     pass
+
+
+class BulkOperationError(AsyncOrmException):
+    """
+    Raised when some of the chunks of a concurrent bulk operation failed.
+    Exceptions raised by the failed chunks are kept in `errors` as a list of
+    (chunk index, exception) tuples.
+    """
+
+    def __init__(self, message: str, errors: list[tuple[int, Exception]]) -> None:
+        super().__init__(message)
+        self.errors = errors
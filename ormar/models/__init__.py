@@ -10,6 +10,9 @@ from ormar.models.model import Model, T  # noqa I100
 from ormar.models.excludable import ExcludableItems  # noqa I100
 from ormar.models.utils import Extra  # noqa I100
 from ormar.models.ormar_config import OrmarConfig  # noqa I100
+from ormar.models.unit_of_work import UnitOfWork, unit_of_work  # noqa I100
+from ormar.models.identity_map import IdentityMap, identity_map  # noqa I100
+from ormar.models.model_cache import ModelCache  # noqa I100
 
 __all__ = [
     "NewBaseModel",
@@ -19,4 +22,9 @@ __all__ = [
     "T",
     "Extra",
     "OrmarConfig",
+    "UnitOfWork",
+    "unit_of_work",
+    "IdentityMap",
+    "identity_map",
+    "ModelCache",
 ]
@@ -0,0 +1,517 @@
+from typing import TYPE_CHECKING, Any, Optional, Union
+from weakref import CallableProxyType
+
+import sqlalchemy
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ormar import ForeignKeyField, Model
+
+INSTANCE_SIGNALS = ("pre_save", "post_save", "pre_update", "post_update")
+
+
+class BulkRelatedSaver:
+    """
+    Saves the tree of related models collected the same way as in
+    `Model.save_related()`, but instead of one upsert per model writes the
+    models with bulk statements.
+
+    Models are split into levels by foreign keys dependencies (each model is
+    saved after models it points to), and each level is written with one bulk
+    insert and one bulk update per model class. Through models of many to many
+    relations are inserted at the end, with one bulk insert per relation.
+    """
+
+    def __init__(self, save_all: bool, follow: bool) -> None:
+        self.save_all = save_all
+        self.follow = follow
+        self._instances: dict[int, "Model"] = {}
+        self._links: list[tuple["Model", "ForeignKeyField", "Model"]] = []
+
+    async def save(self, instance: "Model", relation_map: dict) -> int:
+        """
+        Collects all models that should be saved and saves them in one
+        transaction.
+
+        :param instance: model from which save_related was called
+        :type instance: Model
+        :param relation_map: map of relations to follow
+        :type relation_map: dict
+        :return: number of saved models
+        :rtype: int
+        """
+        self._collect(
+            instance=instance,
+            relation_map=relation_map,
+            previous_model=None,
+            relation_field=None,
+        )
+        if not self._instances:
+            return 0
+        async with instance.ormar_config.database.transaction():
+            for level in resolve_levels(self._instances):
+                for model_cls, instances in group_by_model(level).items():
+                    await self._save_instances(model_cls=model_cls, instances=instances)
+            await self._save_through_instances()
+        return len(self._instances)
+
+    def _collect(
+        self,
+        instance: "Model",
+        relation_map: dict,
+        previous_model: Optional["Model"],
+        relation_field: Optional["ForeignKeyField"],
+    ) -> None:
+        """
+        Follows the relations of the model the same way as save_related does
+        and registers models that should be saved.
+
+        :param instance: current model
+        :type instance: Model
+        :param relation_map: map of relations to follow
+        :type relation_map: dict
+        :param previous_model: previous model from which method came
+        :type previous_model: Optional[Model]
+        :param relation_field: field with relation leading to this model
+        :type relation_field: Optional[ForeignKeyField]
+        """
+        if relation_map:
+            fields_to_visit = {
+                field
+                for field in instance.extract_related_fields()
+                if field.name in relation_map
+            }
+            pre_save = {
+                field
+                for field in fields_to_visit
+                if not field.virtual and not field.is_multi
+            }
+            self._collect_fields(instance, pre_save, relation_map)
+            self._register(instance, previous_model, relation_field)
+            self._collect_fields(instance, fields_to_visit - pre_save, relation_map)
+        else:
+            self._register(instance, previous_model, relation_field)
+
+    def _collect_fields(
+        self,
+        instance: "Model",
+        fields: set["ForeignKeyField"],
+        relation_map: dict,
+    ) -> None:
+        """
+        Registers (and with follow=True collects deeper) related models
+        from given relation fields.
+
+        :param instance: current model
+        :type instance: Model
+        :param fields: relation fields to follow
+        :type fields: set[ForeignKeyField]
+        :param relation_map: map of relations to follow
+        :type relation_map: dict
+        """
+        for field in fields:
+            for value in instance._get_field_values(name=field.name):
+                if self.follow:
+                    self._collect(
+                        instance=value,
+                        relation_map=instance._skip_ellipsis(  # type: ignore
+                            relation_map, field.name, default_return={}
+                        ),
+                        previous_model=instance,
+                        relation_field=field,
+                    )
+                else:
+                    self._register(value, instance, field)
+
+    def _register(
+        self,
+        instance: "Model",
+        previous_model: Optional["Model"],
+        relation_field: Optional["ForeignKeyField"],
+    ) -> None:
+        """
+        Registers the model to save if it's not saved, has no pk or save_all
+        flag is set (and it's not a pk only model).
+
+        If relation leading to the model is a ManyToMany also the through model
+        is registered.
+
+        :param instance: current model
+        :type instance: Model
+        :param previous_model: previous model from which method came
+        :type previous_model: Optional[Model]
+        :param relation_field: field with relation leading to this model
+        :type relation_field: Optional[ForeignKeyField]
+        """
+        if (
+            self.save_all or not instance.pk or not instance.saved
+        ) and not instance.__pk_only__:
+            self._instances.setdefault(
+                get_instance_key(instance), unwrap_proxy(instance)
+            )
+            if relation_field and relation_field.is_multi:
+                self._links.append(
+                    (previous_model, relation_field, instance)  # type: ignore
+                )
+
+    async def _save_instances(
+        self, model_cls: type["Model"], instances: list["Model"]
+    ) -> None:
+        """
+        Saves models of one class. Models without pk or not existing in the
+        database are inserted with one bulk insert, the rest is updated with
+        one bulk update.
+
+        If the model has save or update signals receivers connected, or uses
+        partial updates, models are upserted one by one, as in save_related.
+
+        :param model_cls: class of the models
+        :type model_cls: type[Model]
+        :param instances: models to save
+        :type instances: list[Model]
+        """
+        if requires_instance_writes(model_cls):
+            for instance in instances:
+                await instance.upsert(__force_save__=True)
+            return
+
+        to_insert, to_update = await split_existing(
+            model_cls=model_cls, instances=instances
+        )
+        if to_insert:
+            await insert_instances(model_cls=model_cls, instances=to_insert)
+        if to_update:
+            await update_instances(model_cls=model_cls, instances=to_update)
+
+    async def _save_through_instances(self) -> None:
+        """
+        Saves through models of registered many to many links.
+        Existing links are checked with one query per relation, missing ones
+        are created with one bulk insert, existing ones are updated with
+        through model fields values set on child models with one bulk update
+        per set of updated fields (or one by one if through model requires
+        instance signals).
+        """
+        grouped: dict[tuple[type["Model"], str], list[Any]] = {}
+        for previous_model, relation_field, instance in self._links:
+            grouped.setdefault(
+                (previous_model.__class__, relation_field.name), []
+            ).append((previous_model, relation_field, instance))
+
+        for (model_cls, field_name), links in grouped.items():
+            m2m_field = model_cls.ormar_config.model_fields[field_name]
+            through = m2m_field.through
+            related_field = m2m_field.to.ormar_config.model_fields[
+                m2m_field.get_related_name()
+            ]
+            owner_column = related_field.default_target_field_name()  # type: ignore
+            child_column = related_field.default_source_field_name()  # type: ignore
+            links_filter = {
+                f"{owner_column}__in": list({parent.pk for parent, _, _ in links}),
+                f"{child_column}__in": list({child.pk for _, _, child in links}),
+            }
+            through_pkname = through.ormar_config.pkname
+            rows = await through.objects.filter(**links_filter).values_list(  # type: ignore
+                fields=[owner_column, child_column, through_pkname]
+            )
+            existing = {(owner, child): pk for owner, child, pk in rows}
+            instance_writes = requires_instance_writes(through)
+            created: set[tuple[Any, Any]] = set()
+            new_links = []
+            updated_links: dict[tuple[str, ...], list["Model"]] = {}
+            for parent, field, child in links:
+                if (parent.pk, child.pk) in created:
+                    continue
+                through_kwargs = child._get_through_model_kwargs(
+                    instance=child, previous_model=parent, relation_field=field
+                )
+                if (parent.pk, child.pk) in existing and instance_writes:
+                    await getattr(
+                        parent, field.name
+                    ).queryset_proxy.update_through_instance(child, **through_kwargs)
+                elif (parent.pk, child.pk) in existing:
+                    through_kwargs.pop(through_pkname, None)
+                    if through_kwargs:
+                        updated_links.setdefault(tuple(through_kwargs), []).append(
+                            through(
+                                **{
+                                    through_pkname: existing[(parent.pk, child.pk)],
+                                    owner_column: parent.pk,
+                                    child_column: child.pk,
+                                    **through_kwargs,
+                                }
+                            )
+                        )
+                else:
+                    created.add((parent.pk, child.pk))
+                    new_links.append(
+                        through(
+                            **{
+                                owner_column: parent.pk,
+                                child_column: child.pk,
+                                **through_kwargs,
+                            }
+                        )
+                    )
+            if new_links:
+                await through.objects.bulk_create(new_links)
+            for columns, instances in updated_links.items():
+                await through.objects.bulk_update(instances, columns=list(columns))
+
+
+def requires_instance_writes(model_cls: type["Model"]) -> bool:
+    """
+    Checks if models of given class have to be saved one by one, because they
+    use partial updates or have save or update signals receivers connected.
+
+    Invalidation of the model cache is not taken into account, as bulk writes
+    invalidate it with post_bulk_create and post_bulk_update signals.
+
+    :param model_cls: class of the models
+    :type model_cls: type[Model]
+    :return: result of the check
+    :rtype: bool
+    """
+    if model_cls.ormar_config.partial_updates:
+        return True
+    cache = model_cls.ormar_config.cache
+    internal = [cache.on_model_change] if cache is not None else []
+    signals = model_cls.ormar_config.signals
+    return any(
+        getattr(signals, name).has_receivers_other_than(*internal)
+        for name in INSTANCE_SIGNALS
+    )
+
+
+def unwrap_proxy(instance: Union["Model", CallableProxyType]) -> "Model":
+    """
+    Returns the model instance behind weakref proxy used on one side of the
+    relations (or the model itself if it's not a proxy).
+
+    :param instance: model instance or proxy to it
+    :type instance: Union[Model, CallableProxyType]
+    :return: model instance
+    :rtype: Model
+    """
+    # bound methods accessed through the proxy are bound to the real instance
+    return instance.__repr__.__self__  # type: ignore
+
+
+def get_instance_key(instance: Union["Model", CallableProxyType]) -> int:
+    """
+    Returns identity of the model instance, resolving weakref proxies
+    used on one side of the relations.
+
+    :param instance: model instance or proxy to it
+    :type instance: Union[Model, CallableProxyType]
+    :return: identity of the model instance
+    :rtype: int
+    """
+    return id(unwrap_proxy(instance))
+
+
+def resolve_levels(instances: dict[int, "Model"]) -> list[list["Model"]]:
+    """
+    Splits models into levels, so that each model is in a later level than
+    the models it points to with foreign keys.
+    Related models are matched by identity or by class and primary key.
+    Models with circular foreign keys are put in the last level in the
+    order they were registered.
+
+    :param instances: models keyed by their identity
+    :type instances: dict[int, Model]
+    :return: list of levels of models
+    :rtype: list[list[Model]]
+    """
+    by_pk = {
+        (instance.__class__, instance.pk): key
+        for key, instance in instances.items()
+        if instance.pk is not None
+    }
+    dependencies = {
+        key: _get_dependencies(
+            key=key, instance=instance, instances=instances, by_pk=by_pk
+        )
+        for key, instance in instances.items()
+    }
+    levels = []
+    resolved: set[int] = set()
+    remaining = list(instances)
+    while remaining:
+        level = [key for key in remaining if dependencies[key] <= resolved]
+        if not level:
+            level = remaining
+        resolved.update(level)
+        remaining = [key for key in remaining if key not in resolved]
+        levels.append([instances[key] for key in level])
+    return levels
+
+
+def _get_dependencies(
+    key: int,
+    instance: "Model",
+    instances: dict[int, "Model"],
+    by_pk: dict[tuple[type["Model"], Any], int],
+) -> set[int]:
+    """
+    Returns keys of given models the model points to with foreign keys.
+
+    :param key: key of the model
+    :type key: int
+    :param instance: model to check
+    :type instance: Model
+    :param instances: models keyed by their identity
+    :type instances: dict[int, Model]
+    :param by_pk: keys of the models by their class and primary key
+    :type by_pk: dict[tuple[type[Model], Any], int]
+    :return: keys of the models that have to be saved first
+    :rtype: set[int]
+    """
+    dependencies = set()
+    for name in instance._extract_db_related_names():
+        related = getattr(instance, name)
+        if related is None:
+            continue
+        related_key = get_instance_key(related)
+        if related_key not in instances:
+            related_key = by_pk.get((related.__class__, related.pk), key)
+        if related_key != key:
+            dependencies.add(related_key)
+    return dependencies
+
+
+def group_by_model(instances: list["Model"]) -> dict[type["Model"], list["Model"]]:
+    """
+    Groups models by their class, keeping the order of classes.
+
+    :param instances: models to group
+    :type instances: list[Model]
+    :return: models grouped by class
+    :rtype: dict[type[Model], list[Model]]
+    """
+    grouped: dict[type["Model"], list["Model"]] = {}
+    for instance in instances:
+        grouped.setdefault(instance.__class__, []).append(instance)
+    return grouped
+
+
+async def split_existing(
+    model_cls: type["Model"], instances: list["Model"]
+) -> tuple[list["Model"], list["Model"]]:
+    """
+    Splits models into ones that have to be inserted (without pk or not
+    existing in the database) and ones that have to be updated, checking
+    existing primary keys with one query.
+
+    :param model_cls: class of the models
+    :type model_cls: type[Model]
+    :param instances: models to check
+    :type instances: list[Model]
+    :return: models to insert and models to update
+    :rtype: tuple[list[Model], list[Model]]
+    """
+    pkname = model_cls.ormar_config.pkname
+    to_insert = [instance for instance in instances if instance.pk is None]
+    with_pk = [instance for instance in instances if instance.pk is not None]
+    to_update = []
+    if with_pk:
+        pk_filter = {f"{pkname}__in": [instance.pk for instance in with_pk]}
+        existing = set(
+            await model_cls.objects.filter(**pk_filter).values_list(  # type: ignore
+                fields=pkname, flatten=True
+            )
+        )
+        for instance in with_pk:
+            if instance.pk in existing:
+                to_update.append(instance)
+            else:
+                to_insert.append(instance)
+    return to_insert, to_update
+
+
+async def update_instances(
+    model_cls: type["Model"],
+    instances: list["Model"],
+    columns: Optional[list[str]] = None,
+) -> None:
+    """
+    Updates models of one class with one bulk update.
+    Models with only the primary key column are just marked as saved.
+
+    :param model_cls: class of the models
+    :type model_cls: type[Model]
+    :param instances: models to update
+    :type instances: list[Model]
+    :param columns: names of the fields to update, all if not passed
+    :type columns: Optional[list[str]]
+    """
+    if len(model_cls.ormar_config.table.columns) > 1:
+        await model_cls.objects.bulk_update(instances, columns=columns)
+    else:
+        # only primary key column, nothing to update
+        for instance in instances:
+            instance.set_save_status(True)
+
+
+async def insert_instances(model_cls: type["Model"], instances: list["Model"]) -> None:
+    """
+    Inserts models with bulk insert returning generated primary keys and
+    server defaults, which are set on the models.
+
+    Models with the same set of columns are inserted with one statement
+    executed for many rows, returning rows in the order of models.
+    On backends not supporting that models are saved one by one.
+
+    :param model_cls: class of the models
+    :type model_cls: type[Model]
+    :param instances: models to insert
+    :type instances: list[Model]
+    """
+    database = model_cls.ormar_config.database
+    if not database.dialect.insert_executemany_returning:  # pragma: no cover
+        for instance in instances:
+            await instance.save()
+        return
+
+    pkname = model_cls.ormar_config.pkname
+    table = model_cls.ormar_config.table
+    pk_column = table.c[model_cls.get_column_alias(pkname)]
+    server_default_columns = [
+        table.c[model_cls.get_column_alias(name)]
+        for name, field in model_cls.ormar_config.model_fields.items()
+        if field.server_default is not None and name != pkname
+    ]
+    grouped: dict[tuple[str, ...], list[tuple["Model", dict]]] = {}
+    for instance in instances:
+        values = instance._prepare_insert_values()
+        grouped.setdefault(tuple(values), []).append((instance, values))
+
+    async with database.get_query_executor() as executor:
+        for columns, group in grouped.items():
+            returned = [
+                pk_column,
+                *[c for c in server_default_columns if c.name not in columns],
+            ]
+            pk_known = pk_column.name in columns
+            # SQLite assigns increasing rowids in the order of inserted rows,
+            # so returned rows can be matched by pk instead of falling back
+            # to one statement per row to keep the parameters order
+            rowid_order = (
+                not pk_known
+                and database.dialect.name == "sqlite"
+                and isinstance(pk_column.type, sqlalchemy.Integer)
+            )
+            expr = table.insert().returning(
+                *returned, sort_by_parameter_order=not (pk_known or rowid_order)
+            )
+            rows = await executor.fetch_many(expr, [values for _, values in group])
+            if pk_known:
+                by_pk = {row[pk_column.name]: row for row in rows}
+                rows = [by_pk[values[pk_column.name]] for _, values in group]
+            elif rowid_order:
+                rows = sorted(rows, key=lambda row: row[pk_column.name])
+            for (instance, _), row in zip(group, rows):
+                instance.update_from_dict(
+                    model_cls.translate_aliases_to_columns(dict(row))
+                )
+                instance.set_save_status(True)
+                instance.__setattr_fields__.clear()
@@ -0,0 +1,135 @@
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ormar import Model
+
+_identity_map: ContextVar[Optional["IdentityMap"]] = ContextVar(
+    "_identity_map", default=None
+)
+
+
+def get_identity_map() -> Optional["IdentityMap"]:
+    """
+    Returns identity map active in current context.
+
+    :return: active identity map or None
+    :rtype: Optional[IdentityMap]
+    """
+    return _identity_map.get()
+
+
+def identity_map() -> "IdentityMap":
+    """
+    Returns an identity map that can be used as context manager.
+    If an identity map is already active in current context it's returned
+    instead, so nested scopes share the models loaded in the outermost one.
+
+    :return: identity map
+    :rtype: IdentityMap
+    """
+    return get_identity_map() or IdentityMap()
+
+
+class IdentityMap:
+    """
+    Keeps one model instance per model class and primary key.
+
+    Inside the scope models read from the database for a row that was already
+    loaded are not constructed again - the already loaded instance is returned,
+    with its fields refreshed with the values read from the database.
+    Relations selected in the query are loaded again, so they reflect the
+    last query, other relations of the instance are kept.
+    """
+
+    def __init__(self) -> None:
+        self._instances: dict[tuple[type["Model"], Any], "Model"] = {}
+        self._refreshed: Optional[set[int]] = None
+        self._depth = 0
+        self._token: Optional[Token] = None
+
+    def __enter__(self) -> "IdentityMap":
+        if self._depth == 0:
+            self._token = _identity_map.set(self)
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self._depth -= 1
+        if self._depth:
+            return
+        _identity_map.reset(self._token)  # type: ignore
+        self._token = None
+        self._instances.clear()
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def get(self, model_cls: type["Model"], pk: Any) -> Optional["Model"]:
+        """
+        Returns model instance of given class and primary key if it was loaded.
+
+        :param model_cls: class of the model
+        :type model_cls: type[Model]
+        :param pk: primary key value
+        :type pk: Any
+        :return: loaded model or None
+        :rtype: Optional[Model]
+        """
+        return self._instances.get((model_cls, pk))
+
+    def add(self, instance: "Model") -> None:
+        """
+        Registers the model instance in the identity map.
+
+        :param instance: model to register
+        :type instance: Model
+        """
+        self._instances[(instance.__class__, instance.pk)] = instance
+        if self._refreshed is not None:
+            self._refreshed.add(id(instance))
+
+    @contextmanager
+    def loading(self) -> Iterator[None]:
+        """
+        Marks processing of rows of one query, in which each model is refreshed
+        only once, even if the row is repeated for each joined child row.
+
+        :return: context manager
+        :rtype: Iterator[None]
+        """
+        refreshed, self._refreshed = self._refreshed, set()
+        try:
+            yield
+        finally:
+            self._refreshed = refreshed
+
+    def should_refresh(self, instance: "Model") -> bool:
+        """
+        Checks if the model was not yet refreshed (or created) in the currently
+        processed query, and marks it as refreshed.
+
+        :param instance: model to check
+        :type instance: Model
+        :return: result of the check
+        :rtype: bool
+        """
+        if self._refreshed is None:
+            return True
+        if id(instance) in self._refreshed:
+            return False
+        self._refreshed.add(id(instance))
+        return True
+
+    def discard(self, model_cls: type["Model"], pk: Any) -> None:
+        """
+        Removes model of given class and primary key from the identity map,
+        i.e. after the row was deleted.
+
+        :param model_cls: class of the model
+        :type model_cls: type[Model]
+        :param pk: primary key value
+        :type pk: Any
+        """
+        self._instances.pop((model_cls, pk), None)
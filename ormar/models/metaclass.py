@@ -128,7 +128,32 @@ def register_signals(new_model: type["Model"]) -> None:  # noqa: CCR001
         signals.post_relation_add = Signal()
         signals.pre_relation_remove = Signal()
         signals.post_relation_remove = Signal()
+        signals.post_bulk_create = Signal()
         signals.post_bulk_update = Signal()
+        signals.post_bulk_delete = Signal()
+
+
+def register_cache_invalidation(new_model: type["Model"]) -> None:
+    """
+    Connects invalidation of the model cache (if set in OrmarConfig)
+    to signals sent after the model rows are written.
+
+    :param new_model: newly constructed model
+    :type new_model: Model class
+    """
+    cache = new_model.ormar_config.cache
+    if cache is None:
+        return
+    signals = new_model.ormar_config.signals
+    for signal in (
+        signals.post_save,
+        signals.post_update,
+        signals.post_delete,
+        signals.post_bulk_create,
+        signals.post_bulk_update,
+        signals.post_bulk_delete,
+    ):
+        signal.connect(cache.on_model_change)
 
 
 def verify_constraint_names(
@@ -651,6 +676,7 @@ class ModelMetaclass(pydantic._internal._model_construction.ModelMetaclass):
             check_required_config_parameters(new_model)
             add_property_fields(new_model, attrs)
             register_signals(new_model=new_model)
+            register_cache_invalidation(new_model=new_model)
             modify_schema_example(model=new_model)
 
             if not new_model.ormar_config.abstract:
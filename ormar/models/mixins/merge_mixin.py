@@ -57,9 +57,13 @@ class MergeModelMixin:
         """
         merged_rows: list["Model"] = []
         grouped_instances: dict = {}
+        seen: set[int] = set()
 
         for model in result_rows:
-            grouped_instances.setdefault(model.pk, []).append(model)
+            # inside identity map rows of the same pk are the same instance
+            if id(model) not in seen:
+                seen.add(id(model))
+                grouped_instances.setdefault(model.pk, []).append(model)
 
         for group in grouped_instances.values():
             model = cls._recursive_add(group)[0]
@@ -391,17 +391,38 @@ class SavePrepareMixin(RelationMixin, AliasMixin):
         :param previous_model: previous model from which method came
         :type previous_model: Model
         """
+        through_dict = instance._get_through_model_kwargs(
+            instance=instance,
+            previous_model=previous_model,
+            relation_field=relation_field,
+        )
+        await getattr(
+            previous_model, relation_field.name
+        ).queryset_proxy.upsert_through_instance(instance, **through_dict)
+
+    @staticmethod
+    def _get_through_model_kwargs(
+        instance: "Model", previous_model: "Model", relation_field: "ForeignKeyField"
+    ) -> dict:
+        """
+        Extracts values of through model fields set on the child of m2m relation.
+
+        :param instance: child model of m2m relation
+        :type instance: Model
+        :param relation_field: field with relation
+        :type relation_field: ForeignKeyField
+        :param previous_model: parent model of m2m relation
+        :type previous_model: Model
+        :return: through model fields values
+        :rtype: dict
+        """
         through_name = previous_model.ormar_config.model_fields[
             relation_field.name
         ].through.get_name()
         through = getattr(instance, through_name)
         if through:
-            through_dict = through.model_dump(exclude=through.extract_related_names())
-        else:
-            through_dict = {}
-        await getattr(
-            previous_model, relation_field.name
-        ).queryset_proxy.upsert_through_instance(instance, **through_dict)
+            return through.model_dump(exclude=through.extract_related_names())
+        return {}
 
     async def _update_relation_list(
         self,
@@ -1,13 +1,26 @@
 import builtins
 from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
 
+import sqlalchemy
 from sqlalchemy import Executable
 
 import ormar.queryset  # noqa I100
-from ormar.exceptions import ModelPersistenceError, NoMatch
+from ormar.exceptions import ModelPersistenceError, NoMatch, QueryDefinitionError
 from ormar.models import NewBaseModel  # noqa I100
+from ormar.models.bulk_saver import BulkRelatedSaver
+from ormar.models.identity_map import get_identity_map
 from ormar.models.model_row import ModelRow
-from ormar.queryset.utils import subtract_dict, translate_list_to_dict
+from ormar.models.unit_of_work import UnitOfWork, get_unit_of_work
+from ormar.queryset.field_expression import (
+    compile_field_expressions,
+    is_field_expression,
+)
+from ormar.queryset.utils import (
+    get_conflict_insert,
+    get_upsert,
+    subtract_dict,
+    translate_list_to_dict,
+)
 
 T = TypeVar("T", bound="Model")
 
@@ -44,6 +57,12 @@ class Model(ModelRow):
         If the pk field is filled it's an update, otherwise the save is performed.
         For save kwargs are ignored, used only in update if provided.
 
+        With `__force_save__=True` the row is inserted if it does not exist yet.
+        When no kwargs are passed that is done with one native upsert statement
+        on PostgreSQL (see `_native_upsert`), otherwise the row is checked with
+        a separate query first. Inside `ormar.unit_of_work()` scope
+        the row existence is checked on flush, for all upserted models at once.
+
         :param kwargs: list of fields to update
         :type kwargs: Any
         :return: saved Model
@@ -51,7 +70,23 @@ class Model(ModelRow):
         """
 
         force_save = kwargs.pop("__force_save__", False)
+        unit_of_work = get_unit_of_work(self.ormar_config.database)
+        if force_save and unit_of_work is not None:
+            self.update_from_dict(kwargs)
+            unit_of_work.register_save(self, check_existing=self.pk is not None)
+            return self
         if force_save:
+            if not kwargs and self.pk is not None:
+                upserted = await self._native_upsert(
+                    explicit_fields=set(self.__setattr_fields__),
+                    update_fields=(
+                        set(self.__setattr_fields__)
+                        if self.ormar_config.partial_updates
+                        else None
+                    ),
+                )
+                if upserted is not None:
+                    return self
             expr = self.ormar_config.table.select().where(self.pk_column == self.pk)
             row = await self._execute_query(expr, is_select=True)
             if not row:
@@ -71,8 +106,10 @@ class Model(ModelRow):
         are not saved - use corresponding relations methods.
 
         If there are fields with server_default set and those fields
-        are not already filled save will trigger also a second query
-        to refreshed the fields populated server side.
+        are not already filled their values are returned by the insert
+        (RETURNING clause). On backends without RETURNING support (MySQL)
+        save will trigger also a second query to refresh the fields
+        populated server side.
 
         Does not recognize if model was previously saved.
         If you want to perform update or insert depending on the pk
@@ -82,36 +119,73 @@ class Model(ModelRow):
 
         Sets model save status to True.
 
+        Inside `ormar.unit_of_work()` scope the insert is only registered and
+        executed on flush, so the pk is not populated yet and signals are not sent.
+
         :return: saved Model
         :rtype: Model
         """
-        await self.signals.pre_save.send(sender=self.__class__, instance=self)
-        self_fields = self._extract_model_db_fields()
+        unit_of_work = get_unit_of_work(self.ormar_config.database)
+        if unit_of_work is not None:
+            unit_of_work.register_save(self)
+            return self
+        await self._save()
+        return self
 
-        if (
-            not self.pk
-            and self.ormar_config.model_fields[self.ormar_config.pkname].autoincrement
-        ):
-            self_fields.pop(self.ormar_config.pkname, None)
-        self_fields = self.populate_default_values(self_fields)
-        self.update_from_dict(
-            {
-                k: v
-                for k, v in self_fields.items()
-                if k not in self.extract_related_names()
-            }
-        )
+    async def _save(self, conflict_columns: Optional[list[str]] = None) -> bool:
+        """
+        Inserts the model into the database, see save() for details.
 
-        self_fields = self.translate_columns_to_aliases(self_fields)
-        expr = self.ormar_config.table.insert()
-        expr = expr.values(**self_fields)
+        If `conflict_columns` are passed the row is inserted with
+        `ON CONFLICT (conflict_columns) DO NOTHING RETURNING ...`, and if the row
+        already exists nothing is inserted and the model is not marked as saved.
+        Used by `QuerySet.get_or_create` on dialects supporting it.
 
+        :param conflict_columns: names of columns of unique constraint
+        :type conflict_columns: Optional[list[str]]
+        :return: True if the row was inserted, False on conflict
+        :rtype: bool
+        """
+        await self.signals.pre_save.send(sender=self.__class__, instance=self)
+        self_fields = self._prepare_insert_values()
         pkname = self.ormar_config.pkname
-        pk_returned_from_insert = False
-        pk = await self._execute_query(expr)
+        table = self.ormar_config.table
+        pk_column = table.c[self.get_column_alias(pkname)]
+        server_default_columns = [
+            table.c[self.get_column_alias(name)]
+            for name, field in self.ormar_config.model_fields.items()
+            if field.server_default is not None
+            and name != pkname
+            and self.get_column_alias(name) not in self_fields
+        ]
+        # return server defaults with the insert if backend supports RETURNING,
+        # otherwise (i.e. MySQL) they are refreshed with load() below
+        use_returning = bool(server_default_columns) and (
+            self.ormar_config.database.dialect.insert_returning
+        )
+        returned_values: builtins.dict[str, Any] = {}
+        if conflict_columns is not None or use_returning:
+            if conflict_columns is not None:
+                insert_expr: Any = get_conflict_insert(
+                    table, self.ormar_config.database.dialect
+                )
+                insert_expr = insert_expr.values(**self_fields).on_conflict_do_nothing(
+                    index_elements=conflict_columns
+                )
+            else:
+                insert_expr = table.insert().values(**self_fields)
+            insert_expr = insert_expr.returning(pk_column, *server_default_columns)
+            row = await self._execute_query(insert_expr, is_select=True)
+            if row is None:
+                return False
+            returned_values = dict(row)
+            pk = returned_values.pop(pk_column.name)
+        else:
+            expr = table.insert()
+            expr = expr.values(**self_fields)
+            pk = await self._execute_query(expr)
         if pk and isinstance(pk, self.pk_type()):
             setattr(self, pkname, pk)
-            pk_returned_from_insert = True
 
         if self.pk is None:
             raise ModelPersistenceError(  # pragma: no cover
@@ -125,21 +199,42 @@ class Model(ModelRow):
                 "(PostgreSQL, SQLite 3.35+, MariaDB 10.5+)."
             )
 
+        # refresh server-side defaults, pk is already returned by the insert
+        if returned_values:
+            self.update_from_dict(self.translate_aliases_to_columns(returned_values))
         self.set_save_status(True)
-        # refresh server-side defaults — but skip the pk if the insert already
-        # returned it, so save() stays a single round-trip when the pk is the
-        # only server_default field.
-        if any(
-            field.server_default is not None
-            for name, field in self.ormar_config.model_fields.items()
-            if name not in self_fields
-            and not (pk_returned_from_insert and name == pkname)
-        ):
+        if server_default_columns and not use_returning:
             await self.load()
 
         self.__setattr_fields__.clear()
         await self.signals.post_save.send(sender=self.__class__, instance=self)
-        return self
+        return True
+
+    def _prepare_insert_values(self) -> builtins.dict[str, Any]:
+        """
+        Prepares values of the model to be inserted into the database.
+        Populates default values also on the model itself, and removes
+        autoincrement primary key if it's not set.
+
+        :return: values to insert with column names as keys
+        :rtype: dict[str, Any]
+        """
+        self_fields = self._extract_model_db_fields()
+
+        if (
+            not self.pk
+            and self.ormar_config.model_fields[self.ormar_config.pkname].autoincrement
+        ):
+            self_fields.pop(self.ormar_config.pkname, None)
+        self_fields = self.populate_default_values(self_fields)
+        self.update_from_dict(
+            {
+                k: v
+                for k, v in self_fields.items()
+                if k not in self.extract_related_names()
+            }
+        )
+        return self.translate_columns_to_aliases(self_fields)
 
     async def save_related(  # noqa: CCR001, CFQ002
         self,
@@ -150,6 +245,7 @@ class Model(ModelRow):
         update_count: int = 0,
         previous_model: Optional["Model"] = None,
         relation_field: Optional["ForeignKeyField"] = None,
+        bulk: bool = False,
     ) -> int:
         """
         Triggers a upsert method on all related models
@@ -166,6 +262,12 @@ class Model(ModelRow):
         Model A but will never follow into Model C.
         Nested relations of those kind need to be persisted manually.
 
+        With bulk=True the same models are collected first and written in one
+        transaction with bulk inserts (returning generated primary keys) and bulk
+        updates, one per model class and level of foreign keys dependencies,
+        followed by bulk inserts of through models. Models with save or update
+        signals receivers are still upserted one by one.
+
         :param relation_field: field with relation leading to this model
         :type relation_field: Optional[ForeignKeyField]
         :param previous_model: previous model from which method came
@@ -183,6 +285,8 @@ class Model(ModelRow):
         :param update_count: internal parameter for recursive calls -
         number of updated instances
         :type update_count: int
+        :param bulk: flag if models should be written with bulk statements
+        :type bulk: bool
         :return: number of updated/saved models
         :rtype: int
         """
@@ -195,6 +299,12 @@ class Model(ModelRow):
             exclude = translate_list_to_dict(exclude)
         relation_map = subtract_dict(relation_map, exclude or {})
 
+        if bulk:
+            saver = BulkRelatedSaver(save_all=save_all, follow=follow)
+            return update_count + await saver.save(
+                instance=self, relation_map=relation_map
+            )
+
         if relation_map:
             fields_to_visit = {
                 field
@@ -249,6 +359,19 @@ class Model(ModelRow):
         Performs update of Model instance in the database.
         Fields can be updated before or you can pass them as kwargs.
 
+        If `partial_updates` is set in OrmarConfig and no `_columns` are passed,
+        only fields changed since the model was loaded or last saved are
+        updated, and the database query is skipped if nothing changed.
+
+        Values can be also expressions on model fields evaluated by the database,
+        i.e. `update(views=Post.views + 1)`. Fields updated with expressions are
+        refreshed with values returned by the update (or with a separate query
+        on backends without RETURNING support).
+
+        Inside `ormar.unit_of_work()` scope the update is only registered and
+        executed on flush with other updates of the same model, field expressions
+        are not allowed there.
+
         Sends pre_update and post_update signals.
 
         Sets model save status to True.
@@ -262,17 +385,27 @@ class Model(ModelRow):
         :return: updated Model
         :rtype: Model
         """
+        partial_update = self.ormar_config.partial_updates and not _columns
         explicit_fields = self.__setattr_fields__ | kwargs.keys()
-        values = self.populate_onupdate_value(
-            dict(kwargs), explicit_fields=explicit_fields
-        )
+        expressions = {k: v for k, v in kwargs.items() if is_field_expression(v)}
+        values = {k: v for k, v in kwargs.items() if k not in expressions}
+        if explicit_fields or not partial_update:
+            values = self.populate_onupdate_value(
+                values, explicit_fields=explicit_fields
+            )
         if values:
             self.update_from_dict(values)
 
+        unit_of_work = get_unit_of_work(self.ormar_config.database)
+        if unit_of_work is not None and unit_of_work.is_pending_save(self):
+            return self
         if not self.pk:
             raise ModelPersistenceError(
                 "You cannot update not saved model! Use save or upsert method."
             )
+        if unit_of_work is not None:
+            self._register_update(unit_of_work, _columns, partial_update, expressions)
+            return self
 
         await self.signals.pre_update.send(
             sender=self.__class__, instance=self, passed_args=kwargs
@@ -285,16 +418,104 @@ class Model(ModelRow):
                 for k, v in self_fields.items()
                 if k in _columns or k in self._onupdate_fields
             }
-        if self_fields:
+        elif partial_update:
+            self_fields = {
+                k: v for k, v in self_fields.items() if k in self.__setattr_fields__
+            }
+        self_fields = {k: v for k, v in self_fields.items() if k not in expressions}
+        if self_fields or expressions:
             self_fields = self.translate_columns_to_aliases(self_fields)
-            expr = self.ormar_config.table.update().values(**self_fields)
+            compiled = compile_field_expressions(self.__class__, expressions)
+            expr = self.ormar_config.table.update().values(**self_fields, **compiled)
             expr = expr.where(self.pk_column == getattr(self, self.ormar_config.pkname))
-            await self._execute_query(expr)
+            if compiled:
+                await self._execute_update_with_expressions(expr, list(compiled))
+            else:
+                await self._execute_query(expr)
         self.set_save_status(True)
         self.__setattr_fields__.clear()
         await self.signals.post_update.send(sender=self.__class__, instance=self)
         return self
 
+    def _register_update(
+        self,
+        unit_of_work: UnitOfWork,
+        columns: Optional[list[str]],
+        partial_update: bool,
+        expressions: builtins.dict[str, Any],
+    ) -> None:
+        """
+        Registers the update in unit of work instead of executing it.
+
+        :raises QueryDefinitionError: if values are field expressions
+        :param unit_of_work: active unit of work
+        :type unit_of_work: UnitOfWork
+        :param columns: list of columns to update, if None all are updated
+        :type columns: Optional[list[str]]
+        :param partial_update: flag if only changed fields should be updated
+        :type partial_update: bool
+        :param expressions: field expressions passed to update
+        :type expressions: dict[str, Any]
+        """
+        if expressions:
+            raise QueryDefinitionError(
+                "Field expressions are evaluated by the database and cannot be "
+                "used inside unit of work."
+            )
+        if columns:
+            unit_of_work.register_update(self, columns=set(columns))
+        elif partial_update:
+            if self.__setattr_fields__:
+                unit_of_work.register_update(self, columns=set(self.__setattr_fields__))
+        else:
+            unit_of_work.register_update(self)
+
+    async def increment(self: T, field: str, by: Any = 1) -> T:
+        """
+        Increments given field by the value in the database, with one atomic
+        `UPDATE ... SET field = field + by`, and refreshes only that field.
+
+        Sends pre_update and post_update signals.
+
+        :raises ModelPersistenceError: If the pk column is not set
+        :param field: name of the field to increment
+        :type field: str
+        :param by: value to add, can be negative
+        :type by: Any
+        :return: updated Model
+        :rtype: Model
+        """
+        accessor = getattr(self.__class__, field)
+        return await self.update(_columns=[field], **{field: accessor + by})
+
+    async def _execute_update_with_expressions(
+        self, expr: Any, columns: list[str]
+    ) -> None:
+        """
+        Executes the update with values evaluated by the database and refreshes
+        the fields with the values actually stored, returned by the update on
+        backends supporting RETURNING, otherwise selected by pk.
+
+        :param expr: update statement
+        :type expr: sqlalchemy.sql.Update
+        :param columns: names of the columns to refresh
+        :type columns: list[str]
+        """
+        table_columns = [self.ormar_config.table.c[name] for name in columns]
+        if self.ormar_config.database.dialect.update_returning:
+            row = await self._execute_query(
+                expr.returning(*table_columns), is_select=True
+            )
+        else:  # pragma: no cover
+            await self._execute_query(expr)
+            row = await self._execute_query(
+                sqlalchemy.select(*table_columns).where(self.pk_column == self.pk),
+                is_select=True,
+            )
+        if row is None:  # pragma: no cover
+            raise NoMatch("Instance was deleted from database and cannot be updated")
+        self.update_from_dict(self.translate_aliases_to_columns(dict(row)))
+
     async def delete(self) -> int:
         """
         Removes the Model instance from the database.
@@ -307,37 +528,143 @@ class Model(ModelRow):
         So you can delete and later save (since pk is deleted no conflict will arise)
         or update and the Model will be saved in database again.
 
+        Inside `ormar.unit_of_work()` scope the delete is only registered and
+        executed on flush, in that case 0 is returned.
+
         :return: number of deleted rows (for some backends)
         :rtype: int
         """
+        unit_of_work = get_unit_of_work(self.ormar_config.database)
+        if unit_of_work is not None:
+            unit_of_work.register_delete(self)
+            return 0
         await self.signals.pre_delete.send(sender=self.__class__, instance=self)
         expr = self.ormar_config.table.delete()
         expr = expr.where(self.pk_column == (getattr(self, self.ormar_config.pkname)))
         result = await self._execute_query(expr)
         self.set_save_status(False)
+        identity_map = get_identity_map()
+        if identity_map is not None:
+            identity_map.discard(self.__class__, self.pk)
         await self.signals.post_delete.send(sender=self.__class__, instance=self)
         return result
 
+    async def _native_upsert(
+        self,
+        explicit_fields: set[str],
+        update_fields: Optional[set[str]] = None,
+    ) -> Optional[bool]:
+        """
+        Inserts the model or updates the row with the same pk with one native
+        `INSERT ... ON CONFLICT DO UPDATE ... RETURNING` statement and refreshes
+        the model from the row stored in the database.
+
+        Used only on PostgreSQL, which reports if the row was inserted in
+        RETURNING (`xmax = 0`). Other backends cannot tell that from the upsert
+        itself, so None is returned there and the caller checks the row first.
+
+        Sends post_save or post_update signal depending on what actually happened.
+        As that is not known upfront, native upsert is used only if there are no
+        pre_save and pre_update receivers registered.
+
+        :param explicit_fields: fields set explicitly, not populated by on_update
+        :type explicit_fields: set[str]
+        :param update_fields: fields updated if the row exists, all if None
+        :type update_fields: Optional[set[str]]
+        :return: True if inserted, False if updated, None if upsert cannot be used
+        :rtype: Optional[bool]
+        """
+        database = self.ormar_config.database
+        if (
+            database.dialect.name != "postgresql"
+            or self.pk is None
+            or self.signals.pre_save.has_receivers
+            or self.signals.pre_update.has_receivers
+        ):
+            return None
+
+        pkname = self.ormar_config.pkname
+        insert_fields = self.populate_default_values(self._extract_model_db_fields())
+        update_names = set(insert_fields) if update_fields is None else update_fields
+        update_values = {
+            name: insert_fields[name]
+            for name in update_names
+            if name in insert_fields and name != pkname
+        }
+        update_values = self.populate_onupdate_value(
+            update_values, explicit_fields=explicit_fields
+        )
+        table = self.ormar_config.table
+        pk_column = table.c[self.get_column_alias(pkname)]
+        expr = get_upsert(
+            table=table,
+            dialect=database.dialect,
+            values=self.translate_columns_to_aliases(insert_fields),
+            update_values=self.translate_columns_to_aliases(update_values)
+            or {pk_column.name: self.pk},
+            index_elements=[pk_column.name],
+        )
+        if expr is None:
+            return None  # pragma: no cover
+
+        inserted_flag = "ormar_upsert_inserted"
+        expr = expr.returning(
+            *table.columns,
+            sqlalchemy.literal_column("(xmax = 0)").label(inserted_flag),
+        )
+        row = await self._execute_query(expr, is_select=True)
+        values = dict(row)
+        inserted = values.pop(inserted_flag)
+
+        self._refresh_from_row(values)
+        signal = self.signals.post_save if inserted else self.signals.post_update
+        await signal.send(sender=self.__class__, instance=self)
+        return bool(inserted)
+
+    def _refresh_from_row(self, row: builtins.dict[str, Any]) -> None:
+        """
+        Updates the model fields with values of a raw database row
+        and marks the model as saved.
+
+        :param row: row with column names as keys
+        :type row: dict[str, Any]
+        """
+        kwargs = self.translate_aliases_to_columns(row)
+        self.update_from_dict(kwargs)
+        self.set_save_status(True)
+        self.__setattr_fields__.clear()
+
     async def load(self: T) -> T:
         """
         Allow to refresh existing Models fields from database.
         Be careful as the related models can be overwritten by pk_only models in load.
         Does NOT refresh the related models fields if they were loaded before.
 
+        If `cache` is set in OrmarConfig the row is read from the model cache.
+
         :raises NoMatch: If given pk is not found in database.
 
         :return: reloaded Model
         :rtype: Model
         """
-        expr = self.ormar_config.table.select().where(self.pk_column == self.pk)
-        row = await self._execute_query(expr, is_select=True)
-        if not row:  # pragma nocover
-            raise NoMatch("Instance was deleted from database and cannot be refreshed")
-        kwargs = dict(row)
-        kwargs = self.translate_aliases_to_columns(kwargs)
-        self.update_from_dict(kwargs)
-        self.set_save_status(True)
-        self.__setattr_fields__.clear()
+        cache = self.ormar_config.cache
+        if (
+            cache is not None
+            and self.ormar_config.database.get_transaction_connection()
+        ):
+            cache = None
+        row = cache.get(self.pk) if cache is not None else None
+        if row is None:
+            expr = self.ormar_config.table.select().where(self.pk_column == self.pk)
+            db_row = await self._execute_query(expr, is_select=True)
+            if not db_row:  # pragma nocover
+                raise NoMatch(
+                    "Instance was deleted from database and cannot be refreshed"
+                )
+            row = dict(db_row)
+            if cache is not None:
+                cache.set(self.pk, row)
+        self._refresh_from_row(row)
         return self
 
     async def load_all(
@@ -383,6 +710,15 @@ class Model(ModelRow):
             queryset = queryset.exclude_fields(exclude)
         if order_by:
             queryset = queryset.order_by(order_by)
+        identity_map = get_identity_map()
+        if (
+            identity_map is not None
+            and identity_map.get(self.__class__, self.pk) is self
+        ):
+            # query returns this instance, relations are reloaded on it directly
+            self._orm.clear()
+            await queryset.select_related(relations).get(pk=self.pk)
+            return self
         instance = await queryset.select_related(relations).get(pk=self.pk)
         self._orm.clear()
         self.update_from_dict(instance.model_dump())
@@ -0,0 +1,136 @@
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Optional
+
+from ormar.databases.transaction import register_transaction_callback
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ormar import Model
+
+
+class ModelCache:
+    """
+    In-process LRU cache of database rows of one model, keyed by primary key.
+
+    Set as `cache` in `OrmarConfig` it serves `QuerySet.get(pk=...)`,
+    `get_or_none(pk=...)` and `Model.load()` without querying the database.
+    Entries are invalidated by `post_save`, `post_update`, `post_delete` and
+    bulk signals of the model, and the whole cache is cleared by
+    `QuerySet.update()` and `QuerySet.delete()`. Writes inside a transaction
+    invalidate entries again when the transaction ends, as rows read by other
+    connections before the commit could be cached in between.
+
+    Oldest entries are evicted when `max_entries` is exceeded, with `ttl`
+    (in seconds) entries also expire after given time.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl: Optional[float] = None) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries has to be a positive number")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Any, tuple[Optional[float], dict]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Returns number of cache hits, misses and currently cached entries.
+
+        :return: dict with hits, misses and size
+        :rtype: dict[str, int]
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self)}
+
+    def get(self, pk: Any) -> Optional[dict]:
+        """
+        Returns cached row of given primary key and marks it as recently used.
+        Counts the lookup as hit or miss.
+
+        :param pk: primary key value
+        :type pk: Any
+        :return: copy of the cached row or None
+        :rtype: Optional[dict]
+        """
+        entry = self._entries.get(pk)
+        if entry is not None and entry[0] is not None and entry[0] < time.monotonic():
+            del self._entries[pk]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(pk)
+        self.hits += 1
+        return dict(entry[1])
+
+    def set(self, pk: Any, row: dict) -> None:
+        """
+        Stores the row of given primary key, evicting least recently used
+        entries over the limit.
+
+        :param pk: primary key value
+        :type pk: Any
+        :param row: database row with column names as keys
+        :type row: dict
+        """
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[pk] = (expires, dict(row))
+        self._entries.move_to_end(pk)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, pk: Any) -> None:
+        """
+        Removes the entry of given primary key.
+
+        :param pk: primary key value
+        :type pk: Any
+        """
+        self._entries.pop(pk, None)
+
+    def invalidate_many(self, pks: list[Any]) -> None:
+        """
+        Removes the entries of given primary keys.
+
+        :param pks: primary key values
+        :type pks: list[Any]
+        """
+        for pk in pks:
+            self.invalidate(pk)
+
+    def clear(self) -> None:
+        """
+        Removes all entries, counters are kept.
+        """
+        self._entries.clear()
+
+    async def on_model_change(
+        self,
+        sender: type["Model"],
+        instance: Optional["Model"] = None,
+        instances: Optional[list["Model"]] = None,
+        pks: Optional[list[Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Signal receiver invalidating entries of saved, updated and deleted models.
+
+        :param sender: model class sending the signal
+        :type sender: type[Model]
+        :param instance: model from single instance signals
+        :type instance: Optional[Model]
+        :param instances: models from bulk signals
+        :type instances: Optional[list[Model]]
+        :param pks: primary keys from bulk delete signal
+        :type pks: Optional[list[Any]]
+        :param kwargs: other arguments of the signal
+        :type kwargs: Any
+        """
+        models = [instance] if instance is not None else instances or []
+        changed = [model.pk for model in models] + list(pks or [])
+        self.invalidate_many(changed)
+        register_transaction_callback(lambda: self.invalidate_many(changed))
@@ -5,9 +5,11 @@ try:
 except ImportError:  # pragma: no cover
     from sqlalchemy.engine.result import Row as ResultProxy  # type: ignore
 
+import ormar  # noqa: I100
 from ormar.models import NewBaseModel  # noqa: I202
 from ormar.models.excludable import ExcludableItems
 from ormar.models.helpers.models import group_related_list
+from ormar.models.identity_map import get_identity_map
 
 if TYPE_CHECKING:  # pragma: no cover
     from ormar.fields import ForeignKeyField
@@ -96,14 +98,105 @@ class ModelRow(NewBaseModel):
         )
 
         instance: Optional["Model"] = None
-        if item.get(cls.ormar_config.pkname, None) is not None:
+        pk = item.get(cls.ormar_config.pkname, None)
+        if pk is not None:
+            identity_map = get_identity_map()
+            if identity_map is not None:
+                instance = identity_map.get(cast(type["Model"], cls), pk)
+                if instance is not None:
+                    instance._refresh_from_identity_map(
+                        item=item,
+                        reload_relations=(
+                            list(related_models)
+                            if identity_map.should_refresh(instance)
+                            else []
+                        ),
+                    )
+                    return instance
             excluded = cls.get_names_to_exclude(
                 excludable=excludable, alias=table_prefix
             )
             instance = cast("Model", cls._construct_with_excluded(excluded, **item))
             instance.set_save_status(True)
+            if identity_map is not None:
+                identity_map.add(instance)
         return instance
 
+    def _refresh_from_identity_map(
+        self, item: dict[str, Any], reload_relations: list[str]
+    ) -> None:
+        """
+        Refreshes already loaded model with values read from the database.
+        Foreign keys read as bare primary keys are skipped if the model already
+        points to the related model with the same pk, so loaded related models
+        are not replaced with pk only ones.
+
+        Reverse and many to many relations that are loaded again are cleared
+        first, so they contain only the models read in the current query.
+
+        Fields changed on the model and not saved yet are not overwritten, so
+        pending edits are kept. With changes tracking (partial updates or
+        onupdate fields) only the changed fields are kept, otherwise all own
+        fields of a not saved model keep their current values.
+
+        :param item: dictionary of field values and related models
+        :type item: dict[str, Any]
+        :param reload_relations: names of relations loaded in the query
+        :type reload_relations: list[str]
+        """
+        model_fields = self.ormar_config.model_fields
+        for name in reload_relations:
+            field = model_fields[name]
+            if field.virtual or field.is_multi:
+                relation = self._orm._get(name)
+                if relation is not None:
+                    relation.clear()
+        related_names = self.extract_related_names()
+        through_names = self.extract_through_names()
+        pending = self._get_pending_fields(related_names=related_names)
+        for name, value in item.items():
+            if name in pending:
+                continue
+            if name in related_names:
+                current = getattr(self, name, None)
+                if value is current or (
+                    isinstance(current, ormar.Model)
+                    and not isinstance(value, ormar.Model)
+                    and current.pk == value
+                ):
+                    continue
+            elif name not in through_names and name not in self.__class__.model_fields:
+                # reverse side of relation with skip_reverse is not populated
+                continue
+            setattr(self, name, value)
+        self.set_save_status(not pending)
+        self.__setattr_fields__.intersection_update(pending)
+
+    def _get_pending_fields(self, related_names: set[str]) -> set[str]:
+        """
+        Returns names of fields changed on the model and not saved yet.
+
+        If changes are tracked those are the changed fields, otherwise
+        all own fields (excluding relations) of a not saved model.
+        Reverse and many to many relations are never pending as they are
+        reloaded from the database.
+
+        :param related_names: names of relation fields of the model
+        :type related_names: set[str]
+        :return: names of fields with pending changes
+        :rtype: set[str]
+        """
+        model_fields = self.ormar_config.model_fields
+        if self._onupdate_fields or self.ormar_config.partial_updates:
+            return {
+                name
+                for name in self.__setattr_fields__
+                if not (model_fields[name].virtual or model_fields[name].is_multi)
+            }
+        if self.saved:
+            return set()
+        return {name for name in model_fields if name not in related_names}
+
     @classmethod
     def _process_table_prefix(
         cls,
@@ -66,6 +66,7 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         "_orm_saved",
         "_orm",
         "_pk_column",
+        "_orm_annotations",
         "__pk_only__",
         "__cached_hash__",
         "__pydantic_extra__",
@@ -82,6 +83,7 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         _orm: RelationsManager
         _orm_id: int
         _orm_saved: bool
+        _orm_annotations: Optional[dict[str, Any]]
         _related_names: Optional[set]
         _through_names: Optional[set]
         _related_names_hash: str
@@ -128,6 +130,11 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
             new_kwargs,
             self_instance=self,  # type: ignore
         )
+        if self.ormar_config.partial_updates:
+            # model not loaded from db - all passed fields count as changed
+            self.__setattr_fields__.update(
+                k for k in new_kwargs if k in self.ormar_config.model_fields
+            )
         self._register_related_models(new_kwargs, through_tmp_dict)
 
     @classmethod
@@ -200,7 +207,8 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
     ) -> typing_extensions.Self:
         """
         Constructs model instance and nullifies excluded fields post-construction.
-        Used when loading partial results from the database.
+        Used when loading partial results from the database, so the set of
+        changed fields is cleared as the values match the database row.
 
         :param excluded: set of field names to nullify after construction
         :type excluded: set[str]
@@ -212,6 +220,7 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         instance = cls(**kwargs)
         for field_to_nullify in excluded:
             instance.__dict__[field_to_nullify] = None
+        instance.__setattr_fields__.clear()
         return instance
 
     def __setattr__(self, name: str, value: Any) -> None:  # noqa CCR001
@@ -233,8 +242,11 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
             # let pydantic handle errors for unknown fields
             super().__setattr__(name, value)
 
-        if self._onupdate_fields and name in self.ormar_config.model_fields:
-            self.__setattr_fields__.add(name)
+        if self._onupdate_fields or self.ormar_config.partial_updates:
+            field = self.ormar_config.model_fields.get(name)
+            # reverse and many to many relations are not columns of the model
+            if field is not None and not (field.virtual or field.is_multi):
+                self.__setattr_fields__.add(name)
 
         # In this case, the hash could have changed, so update it
         if name == self.ormar_config.pkname or self.pk is None:
@@ -246,7 +258,8 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
 
     def __getattr__(self, item: str) -> Any:
         """
-        Used for private attributes of pydantic v2.
+        Used for private attributes of pydantic v2 and values of
+        annotations added with QuerySet.annotate().
 
         :param item: name of attribute
         :type item: str
@@ -256,6 +269,12 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         # TODO: Check __pydantic_extra__
         if item == "__pydantic_extra__":
             return None
+        try:
+            annotations = object.__getattribute__(self, "_orm_annotations")
+        except AttributeError:
+            annotations = None
+        if annotations and item in annotations:
+            return annotations[item]
         return super().__getattr__(item)  # type: ignore
 
     def __getstate__(self) -> dict[Any, Any]:
@@ -421,6 +440,7 @@ class NewBaseModel(pydantic.BaseModel, ModelTableProxy, metaclass=ModelMetaclass
         # object.__setattr__(self, "_orm_id", uuid.uuid4().hex)
         object.__setattr__(self, "_orm_saved", False)
         object.__setattr__(self, "_pk_column", None)
+        object.__setattr__(self, "_orm_annotations", None)
         object.__setattr__(self, "__setattr_fields__", set())
         object.__setattr__(
             self,
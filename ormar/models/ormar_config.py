@@ -7,6 +7,7 @@ from sqlalchemy.sql.schema import ColumnCollectionConstraint
 from ormar.databases.connection import DatabaseConnection
 from ormar.fields import BaseField, ForeignKeyField, ManyToManyField
 from ormar.models.helpers import alias_manager
+from ormar.models.model_cache import ModelCache
 from ormar.models.utils import Extra
 from ormar.queryset.queryset import QuerySet
 from ormar.relations import AliasManager
@@ -24,6 +25,8 @@ class OrmarConfig:
         abstract: bool
         exclude_parent_fields: list[str]
         constraints: list[ColumnCollectionConstraint]
+        partial_updates: bool
+        cache: Optional[ModelCache]
 
     def __init__(
         self,
@@ -36,6 +39,8 @@ class OrmarConfig:
         queryset_class: type[QuerySet] = QuerySet,
         extra: Extra = Extra.forbid,
         constraints: Optional[list[ColumnCollectionConstraint]] = None,
+        partial_updates: bool = False,
+        cache: Optional[ModelCache] = None,
     ) -> None:
         self.pkname = None  # type: ignore
         self.metadata = metadata  # type: ignore
@@ -55,6 +60,8 @@ class OrmarConfig:
         self.requires_ref_update: bool = False
         self.extra = extra
         self.queryset_class = queryset_class
+        self.partial_updates = partial_updates
+        self.cache = cache
         self.table: sqlalchemy.Table = None  # type: ignore
 
     def copy(
@@ -68,6 +75,8 @@ class OrmarConfig:
         queryset_class: Optional[type[QuerySet]] = None,
         extra: Optional[Extra] = None,
         constraints: Optional[list[ColumnCollectionConstraint]] = None,
+        partial_updates: Optional[bool] = None,
+        cache: Optional[ModelCache] = None,
     ) -> "OrmarConfig":
         return OrmarConfig(
             metadata=metadata or self.metadata,
@@ -79,4 +88,8 @@ class OrmarConfig:
             queryset_class=queryset_class or self.queryset_class,
             extra=extra or self.extra,
             constraints=constraints,
+            partial_updates=(
+                partial_updates if partial_updates is not None else self.partial_updates
+            ),
+            cache=cache,
         )
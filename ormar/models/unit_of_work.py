@@ -0,0 +1,394 @@
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+from ormar.exceptions import ModelPersistenceError
+from ormar.models.bulk_saver import (
+    get_instance_key,
+    group_by_model,
+    insert_instances,
+    resolve_levels,
+    split_existing,
+    unwrap_proxy,
+    update_instances,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ormar import Model
+    from ormar.databases.connection import DatabaseConnection
+    from ormar.relations.querysetproxy import QuerysetProxy
+
+_unit_of_work: ContextVar[Optional["UnitOfWork"]] = ContextVar(
+    "_unit_of_work", default=None
+)
+
+
+def get_unit_of_work(database: "DatabaseConnection") -> Optional["UnitOfWork"]:
+    """
+    Returns unit of work active in current context for given database.
+
+    :param database: database of the model
+    :type database: DatabaseConnection
+    :return: active unit of work or None
+    :rtype: Optional[UnitOfWork]
+    """
+    unit_of_work = _unit_of_work.get()
+    if unit_of_work is not None and unit_of_work.database is database:
+        return unit_of_work
+    return None
+
+
+def is_pending_save(instance: "Model") -> bool:
+    """
+    Checks if the model is registered to be inserted by the unit of work
+    active in current context.
+
+    :param instance: model to check
+    :type instance: Model
+    :return: result of the check
+    :rtype: bool
+    """
+    unit_of_work = get_unit_of_work(instance.ormar_config.database)
+    return unit_of_work is not None and unit_of_work.is_pending_save(instance)
+
+
+def unit_of_work(database: "DatabaseConnection") -> "UnitOfWork":
+    """
+    Returns a unit of work for given database, that can be used as async
+    context manager. If a unit of work for this database is already active in
+    current context it's returned instead, so nested scopes are flushed
+    together with the outermost one.
+
+    :param database: database to write to
+    :type database: DatabaseConnection
+    :return: unit of work
+    :rtype: UnitOfWork
+    """
+    return get_unit_of_work(database) or UnitOfWork(database)
+
+
+class UnitOfWork:
+    """
+    Records writes of models instead of executing them and writes all of them
+    at once on flush, with bulk statements in one transaction.
+
+    Inside the scope `Model.save()`, `update()`, `upsert()` and `delete()`, as
+    well as adding and removing many to many relations, are only registered.
+    On flush models are inserted level by level (each model after models it
+    points to with foreign keys) with one bulk insert per model class, updated
+    with one bulk update per class and set of columns, and deleted in reverse
+    order with one bulk delete per class.
+
+    Per instance signals are not sent, instead `post_bulk_create`,
+    `post_bulk_update` and `post_bulk_delete` are sent once per statement.
+    """
+
+    def __init__(self, database: "DatabaseConnection") -> None:
+        self.database = database
+        self._depth = 0
+        self._token: Optional[Token] = None
+        self._clear()
+
+    def _clear(self) -> None:
+        """
+        Forgets all registered changes.
+        """
+        self._saves: dict[int, "Model"] = {}
+        self._check_existing: set[int] = set()
+        self._updates: dict[int, tuple["Model", Optional[set[str]]]] = {}
+        self._deletes: dict[int, "Model"] = {}
+        self._links: dict[
+            tuple[Any, int, int], tuple["QuerysetProxy", "Model", "Model", dict]
+        ] = {}
+        self._unlinks: dict[
+            tuple[Any, int], tuple["QuerysetProxy", "Model", set[Any]]
+        ] = {}
+
+    async def __aenter__(self) -> "UnitOfWork":
+        if self._depth == 0:
+            self._token = _unit_of_work.set(self)
+        self._depth += 1
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self._depth -= 1
+        if self._depth:
+            return
+        _unit_of_work.reset(self._token)  # type: ignore
+        self._token = None
+        if exc_type is not None:
+            self._clear()
+            return
+        await self.flush()
+
+    @property
+    def has_changes(self) -> bool:
+        """
+        Checks if there are any registered changes waiting for flush.
+
+        :return: result of the check
+        :rtype: bool
+        """
+        return any(
+            (self._saves, self._updates, self._deletes, self._links, self._unlinks)
+        )
+
+    def is_pending_save(self, instance: "Model") -> bool:
+        """
+        Checks if the model is registered to be inserted.
+
+        :param instance: model to check
+        :type instance: Model
+        :return: result of the check
+        :rtype: bool
+        """
+        return get_instance_key(instance) in self._saves
+
+    def register_save(self, instance: "Model", check_existing: bool = False) -> None:
+        """
+        Registers the model to be inserted on flush.
+
+        With `check_existing` the row is inserted only if it does not exist yet,
+        otherwise it's updated (as in `upsert(__force_save__=True)`).
+
+        :param instance: model to save
+        :type instance: Model
+        :param check_existing: flag if existing rows should be updated
+        :type check_existing: bool
+        """
+        key = get_instance_key(instance)
+        if self._deletes.pop(key, None) is not None:
+            check_existing = True
+        self._updates.pop(key, None)
+        self._saves[key] = unwrap_proxy(instance)
+        if check_existing:
+            self._check_existing.add(key)
+
+    def register_update(
+        self, instance: "Model", columns: Optional[set[str]] = None
+    ) -> None:
+        """
+        Registers the model to be updated on flush.
+        Models waiting for insert are skipped, as the insert already uses
+        current values of the model.
+
+        :param instance: model to update
+        :type instance: Model
+        :param columns: names of the fields to update, all if not passed
+        :type columns: Optional[set[str]]
+        """
+        key = get_instance_key(instance)
+        if key in self._saves:
+            return
+        if key in self._updates:
+            previous = self._updates[key][1]
+            columns = (
+                None if previous is None or columns is None else previous | columns
+            )
+        self._updates[key] = (unwrap_proxy(instance), columns)
+
+    def register_delete(self, instance: "Model") -> None:
+        """
+        Registers the model to be deleted on flush.
+        If the model waits for insert the insert is cancelled instead, together
+        with many to many links of the model.
+
+        :param instance: model to delete
+        :type instance: Model
+        """
+        key = get_instance_key(instance)
+        self._updates.pop(key, None)
+        if key in self._saves and key not in self._check_existing:
+            del self._saves[key]
+            self._links = {
+                link_key: link
+                for link_key, link in self._links.items()
+                if key not in link_key[1:]
+            }
+            return
+        self._saves.pop(key, None)
+        self._check_existing.discard(key)
+        if instance.pk is not None:
+            self._deletes[key] = unwrap_proxy(instance)
+
+    def register_link(
+        self, queryset_proxy: "QuerysetProxy", child: "Model", **kwargs: Any
+    ) -> None:
+        """
+        Registers through model of many to many relation to be created on flush.
+        Primary keys of parent and child are read on flush, so both can be
+        waiting for insert.
+
+        :param queryset_proxy: queryset proxy of the relation
+        :type queryset_proxy: QuerysetProxy
+        :param child: child model
+        :type child: Model
+        :param kwargs: dict of additional keyword arguments for through instance
+        :type kwargs: Any
+        """
+        owner = unwrap_proxy(queryset_proxy._owner)
+        key = (
+            queryset_proxy.relation.through,
+            get_instance_key(owner),
+            get_instance_key(child),
+        )
+        self._links[key] = (
+            queryset_proxy,
+            owner,
+            unwrap_proxy(child),
+            kwargs,
+        )
+
+    def register_unlink(self, queryset_proxy: "QuerysetProxy", child: "Model") -> None:
+        """
+        Registers through model of many to many relation to be removed on flush.
+        If the link waits for insert the insert is cancelled instead.
+
+        :param queryset_proxy: queryset proxy of the relation
+        :type queryset_proxy: QuerysetProxy
+        :param child: child model
+        :type child: Model
+        """
+        key = (
+            queryset_proxy.relation.through,
+            get_instance_key(queryset_proxy._owner),
+            get_instance_key(child),
+        )
+        if self._links.pop(key, None) is None:
+            self.register_unlinks(queryset_proxy, [child.pk])
+
+    def register_unlinks(
+        self, queryset_proxy: "QuerysetProxy", children_pks: Sequence[Any]
+    ) -> None:
+        """
+        Registers through models of many to many relation with children of
+        given primary keys to be removed on flush.
+
+        :param queryset_proxy: queryset proxy of the relation
+        :type queryset_proxy: QuerysetProxy
+        :param children_pks: primary keys of the child models to unlink
+        :type children_pks: Sequence[Any]
+        """
+        owner = unwrap_proxy(queryset_proxy._owner)
+        through = queryset_proxy.relation.through
+        owner_key = get_instance_key(owner)
+        pks = {pk for pk in children_pks if pk is not None}
+        if not pks or owner.pk is None:
+            return
+        self._links = {
+            key: link
+            for key, link in self._links.items()
+            if key[:2] != (through, owner_key) or link[2].pk not in pks
+        }
+        unlinks = self._unlinks.setdefault(
+            (through, owner_key), (queryset_proxy, owner, set())
+        )
+        unlinks[2].update(pks)
+
+    async def flush(self) -> None:
+        """
+        Writes all registered changes in one transaction - inserts, updates,
+        removed and added many to many links and deletes, in that order.
+        """
+        token = _unit_of_work.set(None)
+        try:
+            async with self.database.transaction():
+                await self._flush_saves()
+                await self._flush_updates()
+                await self._flush_unlinks()
+                await self._flush_links()
+                await self._flush_deletes()
+        finally:
+            _unit_of_work.reset(token)
+        self._clear()
+
+    async def _flush_saves(self) -> None:
+        """
+        Inserts registered models level by level, with one bulk insert per model
+        class. Models registered with existence check and already existing in
+        the database are updated instead.
+        """
+        for level in resolve_levels(self._saves):
+            for model_cls, instances in group_by_model(level).items():
+                to_insert = [
+                    instance
+                    for instance in instances
+                    if get_instance_key(instance) not in self._check_existing
+                ]
+                to_check = [
+                    instance
+                    for instance in instances
+                    if get_instance_key(instance) in self._check_existing
+                ]
+                if to_check:
+                    missing, to_update = await split_existing(
+                        model_cls=model_cls, instances=to_check
+                    )
+                    to_insert.extend(missing)
+                    if to_update:
+                        await update_instances(model_cls=model_cls, instances=to_update)
+                if to_insert:
+                    await insert_instances(model_cls=model_cls, instances=to_insert)
+                    await model_cls.ormar_config.signals.post_bulk_create.send(
+                        sender=model_cls, instances=to_insert
+                    )
+
+    async def _flush_updates(self) -> None:
+        """
+        Updates registered models with one bulk update per model class and set
+        of updated columns.
+        """
+        grouped: dict[tuple[type["Model"], Optional[frozenset]], list["Model"]] = {}
+        for instance, columns in self._updates.values():
+            group_key = (
+                instance.__class__,
+                frozenset(columns) if columns is not None else None,
+            )
+            grouped.setdefault(group_key, []).append(instance)
+        for (model_cls, fields), instances in grouped.items():
+            await update_instances(
+                model_cls=model_cls,
+                instances=instances,
+                columns=sorted(fields) if fields is not None else None,
+            )
+
+    async def _flush_unlinks(self) -> None:
+        """
+        Removes registered many to many links with one delete per parent model.
+        """
+        for queryset_proxy, _, pks in self._unlinks.values():
+            await queryset_proxy.delete_through_instances(list(pks))
+
+    async def _flush_links(self) -> None:
+        """
+        Creates registered many to many links with one bulk insert per through
+        model.
+
+        :raises ModelPersistenceError: if parent or child has no primary key
+        """
+        grouped: dict[type["Model"], list["Model"]] = {}
+        for queryset_proxy, owner, child, kwargs in self._links.values():
+            for instance in (owner, child):
+                if instance.pk is None:
+                    raise ModelPersistenceError(
+                        f"You cannot save {instance.get_name()} "
+                        f"model without primary key set! \n"
+                        f"Save the model first."
+                    )
+            related_field = queryset_proxy.related_field
+            through = queryset_proxy.relation.through
+            owner_column = related_field.default_target_field_name()  # type: ignore
+            child_column = related_field.default_source_field_name()  # type: ignore
+            grouped.setdefault(through, []).append(
+                through(**{owner_column: owner.pk, child_column: child.pk, **kwargs})
+            )
+        for through, instances in grouped.items():
+            await through.objects.bulk_create(instances)
+
+    async def _flush_deletes(self) -> None:
+        """
+        Deletes registered models with one bulk delete per model class, models
+        pointing to other deleted models with foreign keys are deleted first.
+        """
+        for level in reversed(resolve_levels(self._deletes)):
+            for model_cls, instances in group_by_model(level).items():
+                await model_cls.objects.bulk_delete(instances)
@@ -3,8 +3,11 @@ Contains QuerySet and different Query classes to allow for constructing of sql q
 """
 
 from ormar.queryset.actions import FilterAction, OrderAction, SelectAction
+from ormar.queryset.aggregations import Aggregate, Avg, Count, Max, Min, Sum
+from ormar.queryset.batch_loader import BatchLoader
 from ormar.queryset.clause import NullsOrdering, and_, or_
 from ormar.queryset.field_accessor import FieldAccessor
+from ormar.queryset.field_expression import FieldExpression
 from ormar.queryset.queries import FilterQuery, LimitQuery, OffsetQuery, OrderQuery
 from ormar.queryset.queryset import QuerySet
 
@@ -21,4 +24,12 @@ __all__ = [
     "and_",
     "or_",
     "FieldAccessor",
+    "FieldExpression",
+    "BatchLoader",
+    "Aggregate",
+    "Count",
+    "Sum",
+    "Avg",
+    "Min",
+    "Max",
 ]
@@ -34,6 +34,23 @@ class SelectAction(QueryAction):
     def get_target_field_type(self) -> Any:
         return self.target_model.ormar_config.model_fields[self.field_name].__type__
 
+    def get_column(self) -> sqlalchemy.sql.expression.ColumnElement:
+        """
+        Returns column of the target model bound to the table alias used
+        in joins, so it can be used directly in query built with select related.
+
+        :return: aliased column
+        :rtype: sqlalchemy.sql.expression.ColumnElement
+        """
+        if not self.table_prefix:
+            return self.column
+        aliased_table = (
+            self.source_model.ormar_config.alias_manager.prefixed_table_name(
+                self.table_prefix, self.column.table
+            )
+        )
+        return aliased_table.c[self.column.name]
+
     def get_text_clause(self) -> sqlalchemy.sql.expression.ColumnClause:
         alias = f"{self.table_prefix}_" if self.table_prefix else ""
         return sqlalchemy.column(f"{alias}{self.field_name}")
@@ -0,0 +1,144 @@
+"""
+Aggregate functions used in QuerySet.annotate() to compute values per group of rows
+or per model from its related models.
+"""
+
+from typing import TYPE_CHECKING, Any, Optional
+
+import sqlalchemy
+
+from ormar.exceptions import QueryDefinitionError
+from ormar.queryset.actions.select_action import SelectAction
+
+if TYPE_CHECKING:  # pragma no cover
+    from ormar import Model
+
+
+class Aggregate:
+    """
+    Base class of aggregate functions, wraps the field (with relation path
+    separated with dunder '__') in sql function with given name.
+
+    Passing relation name instead of field aggregates primary key
+    of the related model.
+    """
+
+    function_name: str = ""
+    numeric_only: bool = False
+
+    def __init__(self, field: str, distinct: bool = False) -> None:
+        self.field = field
+        self.distinct = distinct
+
+    def __repr__(self) -> str:
+        distinct = ", distinct=True" if self.distinct else ""
+        return f"{self.__class__.__name__}({self.field!r}{distinct})"
+
+    def get_select_action(
+        self, model_cls: type["Model"], field: Optional[str] = None
+    ) -> SelectAction:
+        """
+        Resolves the aggregated field on given model.
+
+        :raises QueryDefinitionError: if the field does not exist or
+        is not numeric for functions requiring numeric fields
+        :param model_cls: model on which queryset is executed
+        :type model_cls: type[Model]
+        :param field: field to resolve instead of the aggregated one
+        :type field: Optional[str]
+        :return: action pointing to the aggregated column
+        :rtype: SelectAction
+        """
+        action = resolve_select_action(field=field or self.field, model_cls=model_cls)
+        if self.numeric_only and not action.is_numeric:
+            raise QueryDefinitionError(
+                f"You can use {self.__class__.__name__} only with numeric "
+                f"types of columns, {self.field} is not numeric"
+            )
+        return action
+
+    def apply(self, column: Any) -> sqlalchemy.sql.expression.ColumnElement:
+        """
+        Wraps the column in sql function of the aggregate.
+
+        :param column: aggregated column
+        :type column: sqlalchemy.Column
+        :return: aggregate expression
+        :rtype: sqlalchemy.sql.expression.ColumnElement
+        """
+        if self.distinct:
+            column = sqlalchemy.distinct(column)
+        return getattr(sqlalchemy.func, self.function_name)(column)
+
+
+class Count(Aggregate):
+    """
+    Counts not null values of the field.
+    """
+
+    function_name = "count"
+
+
+class Sum(Aggregate):
+    """
+    Sums values of the numeric field.
+    """
+
+    function_name = "sum"
+    numeric_only = True
+
+
+class Avg(Aggregate):
+    """
+    Averages values of the numeric field.
+    """
+
+    function_name = "avg"
+    numeric_only = True
+
+
+class Min(Aggregate):
+    """
+    Returns minimal value of the field.
+    """
+
+    function_name = "min"
+
+
+class Max(Aggregate):
+    """
+    Returns maximal value of the field.
+    """
+
+    function_name = "max"
+
+
+def resolve_select_action(field: str, model_cls: type["Model"]) -> SelectAction:
+    """
+    Resolves the field (with relation path separated with dunder '__')
+    into action pointing to a column. `pk` is replaced with primary key name
+    and reverse or many to many relation name with primary key of related model.
+
+    :raises QueryDefinitionError: if the field does not exist
+    :param field: field name with optional relation path
+    :type field: str
+    :param model_cls: model from which relation path starts
+    :type model_cls: type[Model]
+    :return: action pointing to the column
+    :rtype: SelectAction
+    """
+    action = SelectAction(select_str=field, model_cls=model_cls)
+    target_config = action.target_model.ormar_config
+    if action.field_name == "pk":
+        action.field_name = target_config.pkname
+    model_field = target_config.model_fields.get(action.field_name)
+    if model_field is None:
+        raise QueryDefinitionError(
+            f"Field {field} does not exist on model {model_cls.get_name()}"
+        )
+    if model_field.is_multi or model_field.virtual:
+        return SelectAction(
+            select_str=f"{field}__{model_field.to.ormar_config.pkname}",
+            model_cls=model_cls,
+        )
+    return action
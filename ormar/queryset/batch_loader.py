@@ -0,0 +1,122 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar
+
+from ormar.exceptions import NoMatch
+from ormar.models.identity_map import get_identity_map
+
+if TYPE_CHECKING:  # pragma no cover
+    from ormar import Model
+    from ormar.models import T
+    from ormar.queryset import QuerySet
+else:
+    T = TypeVar("T", bound="Model")
+
+
+class BatchLoader(Generic[T]):
+    """
+    Collects loads of single models requested by concurrent coroutines and
+    loads all of them with one `WHERE field IN (...)` query (chunked by
+    `batch_size`) through `QuerySet.in_bulk()`.
+
+    Loads are collected until the next iteration of the event loop, or for
+    `delay` seconds if it's set. Loaded models are not cached, each batch
+    queries the database, so one loader can be shared by the whole application.
+    Callers loading the same value in one batch get the same instance.
+
+    Inside a transaction or an identity map scope loads are not batched,
+    as batches are executed outside of the caller context.
+    """
+
+    def __init__(
+        self,
+        queryset: "QuerySet[T]",
+        field: str = "pk",
+        delay: float = 0.0,
+        batch_size: int = 500,
+    ) -> None:
+        self.queryset = queryset
+        self.field = field
+        self.delay = delay
+        self.batch_size = batch_size
+        self.batches = 0
+        self._pending: dict[Any, list[asyncio.Future]] = {}
+        self._scheduled = False
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, value: Any) -> "T":
+        """
+        Loads the model with given value of the field.
+
+        :raises NoMatch: if no row with given value exists
+        :param value: value of the field
+        :type value: Any
+        :return: loaded model
+        :rtype: Model
+        """
+        instance = await self.load_or_none(value)
+        if instance is None:
+            raise NoMatch()
+        return instance
+
+    async def load_or_none(self, value: Any) -> Optional["T"]:
+        """
+        Loads the model with given value of the field, returns None if no row
+        with given value exists.
+
+        :param value: value of the field
+        :type value: Any
+        :return: loaded model or None
+        :rtype: Optional[Model]
+        """
+        database = self.queryset.model_config.database
+        if (
+            database.get_transaction_connection() is not None
+            or get_identity_map() is not None
+        ):
+            found = await self.queryset.in_bulk([value], field=self.field)
+            return found.get(value)
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.setdefault(value, []).append(future)
+        if not self._scheduled:
+            self._scheduled = True
+            if self.delay:
+                loop.call_later(self.delay, self._dispatch)
+            else:
+                loop.call_soon(self._dispatch)
+        return await future
+
+    def _dispatch(self) -> None:
+        """
+        Starts loading of all collected values in a separate task.
+        """
+        pending, self._pending = self._pending, {}
+        self._scheduled = False
+        task = asyncio.ensure_future(self._load_batch(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(self, pending: dict[Any, list[asyncio.Future]]) -> None:
+        """
+        Loads models of collected values and resolves futures of the callers.
+        If the query fails the exception is set on all futures.
+
+        :param pending: collected values with futures of their callers
+        :type pending: dict[Any, list[asyncio.Future]]
+        """
+        self.batches += 1
+        try:
+            found = await self.queryset.in_bulk(
+                list(pending), field=self.field, batch_size=self.batch_size
+            )
+        except Exception as exc:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+        for value, futures in pending.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(found.get(value))
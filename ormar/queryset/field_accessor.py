@@ -1,17 +1,24 @@
 from typing import TYPE_CHECKING, Any, Optional, cast
 
+from ormar.exceptions import QueryDefinitionError
 from ormar.queryset.actions import OrderAction
 from ormar.queryset.actions.filter_action import METHODS_TO_OPERATORS
 from ormar.queryset.clause import FilterGroup, NullsOrdering
+from ormar.queryset.field_expression import ExpressionOperators
 
 if TYPE_CHECKING:  # pragma: no cover
+    from sqlalchemy.sql.elements import ColumnElement
+
     from ormar import BaseField, Model
 
 
-class FieldAccessor:
+class FieldAccessor(ExpressionOperators):
     """
     Helper to access ormar fields directly from Model class also for nested
     models attributes.
+
+    Arithmetic operators on fields build expressions evaluated by the database,
+    that can be used in updates (i.e. `Post.views + 1`).
     """
 
     def __init__(
@@ -70,6 +77,32 @@ class FieldAccessor:
             return
         raise AttributeError("Cannot filter by Model, you need to provide model name")
 
+    def _compile_expression(self, model: type["Model"]) -> "ColumnElement":
+        """
+        Returns the column of the field to be used in expressions.
+        Only own, non relation fields accessed from the updated model can be used.
+
+        :raises QueryDefinitionError: if field is a relation, nested field or
+        field of other model
+        :param model: model which table is updated
+        :type model: type[Model]
+        :return: table column
+        :rtype: ColumnElement
+        """
+        field = object.__getattribute__(self, "_field")
+        if (
+            field is None
+            or self._source_model is not model
+            or "__" in self._access_chain
+            or field.is_relation
+            or field.name not in model.ormar_config.model_fields
+        ):
+            raise QueryDefinitionError(
+                "Only own fields of updated model can be used in expressions, "
+                f"got '{self._access_chain}'."
+            )
+        return model.ormar_config.table.c[model.get_column_alias(field.name)]
+
     def _select_operator(self, op: str, other: Any) -> FilterGroup:
         self._check_field()
         filter_kwg = {self._access_chain + f"__{METHODS_TO_OPERATORS[op]}": other}
@@ -0,0 +1,175 @@
+import abc
+import operator
+from typing import TYPE_CHECKING, Any, Callable
+
+from ormar.exceptions import QueryDefinitionError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sqlalchemy.sql.elements import ColumnElement
+
+    from ormar import Model
+
+OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "truediv": operator.truediv,
+}
+
+
+class ExpressionOperators(abc.ABC):
+    """
+    Arithmetic operators building database side expressions out of model fields,
+    shared by FieldAccessor and FieldExpression.
+    """
+
+    @abc.abstractmethod
+    def _compile_expression(self, model: type["Model"]) -> "ColumnElement":
+        """
+        Compiles the expression into sqlalchemy clause on the model table.
+
+        :param model: model which table is updated
+        :type model: type[Model]
+        :return: sqlalchemy clause
+        :rtype: ColumnElement
+        """
+
+    def __add__(self, other: Any) -> "FieldExpression":
+        """
+        overloaded to work as sql `column + <VALUE>`
+
+        :param other: value, field or expression to add
+        :type other: Any
+        :return: expression evaluated by the database
+        :rtype: ormar.queryset.field_expression.FieldExpression
+        """
+        return FieldExpression(left=self, operator="add", right=other)
+
+    def __radd__(self, other: Any) -> "FieldExpression":
+        return FieldExpression(left=other, operator="add", right=self)
+
+    def __sub__(self, other: Any) -> "FieldExpression":
+        """
+        overloaded to work as sql `column - <VALUE>`
+
+        :param other: value, field or expression to subtract
+        :type other: Any
+        :return: expression evaluated by the database
+        :rtype: ormar.queryset.field_expression.FieldExpression
+        """
+        return FieldExpression(left=self, operator="sub", right=other)
+
+    def __rsub__(self, other: Any) -> "FieldExpression":
+        return FieldExpression(left=other, operator="sub", right=self)
+
+    def __mul__(self, other: Any) -> "FieldExpression":
+        """
+        overloaded to work as sql `column * <VALUE>`
+
+        :param other: value, field or expression to multiply by
+        :type other: Any
+        :return: expression evaluated by the database
+        :rtype: ormar.queryset.field_expression.FieldExpression
+        """
+        return FieldExpression(left=self, operator="mul", right=other)
+
+    def __rmul__(self, other: Any) -> "FieldExpression":
+        return FieldExpression(left=other, operator="mul", right=self)
+
+    def __truediv__(self, other: Any) -> "FieldExpression":
+        """
+        overloaded to work as sql `column / <VALUE>`
+
+        :param other: value, field or expression to divide by
+        :type other: Any
+        :return: expression evaluated by the database
+        :rtype: ormar.queryset.field_expression.FieldExpression
+        """
+        return FieldExpression(left=self, operator="truediv", right=other)
+
+    def __rtruediv__(self, other: Any) -> "FieldExpression":
+        return FieldExpression(left=other, operator="truediv", right=self)
+
+
+class FieldExpression(ExpressionOperators):
+    """
+    Expression on model fields evaluated by the database, created with
+    arithmetic operators on fields accessed from the Model class,
+    i.e. `Post.views + 1` or `Order.price * Order.quantity`.
+
+    Can be used as a value in `QuerySet.update()` and `Model.update()`.
+    """
+
+    def __init__(self, left: Any, operator: str, right: Any) -> None:
+        self._left = left
+        self._operator = operator
+        self._right = right
+
+    def _compile_expression(self, model: type["Model"]) -> "ColumnElement":
+        """
+        Compiles the expression into sqlalchemy clause on the model table.
+
+        :param model: model which table is updated
+        :type model: type[Model]
+        :return: sqlalchemy clause
+        :rtype: ColumnElement
+        """
+        return OPERATORS[self._operator](
+            compile_operand(self._left, model), compile_operand(self._right, model)
+        )
+
+
+def is_field_expression(value: Any) -> bool:
+    """
+    Checks if given value is an expression evaluated by the database
+    (FieldExpression or FieldAccessor of a field).
+
+    :param value: value to check
+    :type value: Any
+    :return: result of the check
+    :rtype: bool
+    """
+    return isinstance(value, ExpressionOperators)
+
+
+def compile_operand(value: Any, model: type["Model"]) -> Any:
+    """
+    Compiles expressions and fields into sqlalchemy clauses,
+    other values are returned unchanged to be used as bind parameters.
+
+    :param value: field, expression or literal value
+    :type value: Any
+    :param model: model which table is updated
+    :type model: type[Model]
+    :return: sqlalchemy clause or value
+    :rtype: Any
+    """
+    if is_field_expression(value):
+        return value._compile_expression(model)
+    return value
+
+
+def compile_field_expressions(
+    model: type["Model"], expressions: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Compiles dictionary of field names and expressions into dictionary of
+    column names and sqlalchemy clauses, ready to be used in update values.
+
+    :raises QueryDefinitionError: if field is not an own column of the model
+    :param model: model which table is updated
+    :type model: type[Model]
+    :param expressions: field names and expressions
+    :type expressions: dict[str, Any]
+    :return: column names and sqlalchemy clauses
+    :rtype: dict[str, Any]
+    """
+    compiled = {}
+    for name, expression in expressions.items():
+        if name not in model.extract_db_own_fields():
+            raise QueryDefinitionError(
+                f"Expressions can be used only to update own fields of "
+                f"{model.__name__}, got '{name}'."
+            )
+        compiled[model.get_column_alias(name)] = expression._compile_expression(model)
+    return compiled
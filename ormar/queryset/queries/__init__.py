@@ -1,3 +1,4 @@
+from ormar.queryset.queries.estimate_query import EstimateQuery
 from ormar.queryset.queries.filter_query import FilterQuery
 from ormar.queryset.queries.limit_query import LimitQuery
 from ormar.queryset.queries.offset_query import OffsetQuery
@@ -6,6 +7,7 @@ from ormar.queryset.queries.prefetch_query import PrefetchQuery
 from ormar.queryset.queries.query import Query
 
 __all__ = [
+    "EstimateQuery",
     "FilterQuery",
     "LimitQuery",
     "OffsetQuery",
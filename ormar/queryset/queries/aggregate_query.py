@@ -0,0 +1,212 @@
+from typing import TYPE_CHECKING, Any, Optional
+
+from sqlalchemy import Select
+from sqlalchemy.sql.elements import ColumnElement
+
+import ormar  # noqa I100
+from ormar.exceptions import QueryDefinitionError
+from ormar.queryset.actions.filter_action import FILTER_OPERATORS, FilterAction
+from ormar.queryset.aggregations import resolve_select_action
+from ormar.queryset.queries.limit_query import LimitQuery
+from ormar.queryset.queries.offset_query import OffsetQuery
+from ormar.queryset.queries.query import Query
+
+if TYPE_CHECKING:  # pragma no cover
+    from ormar import Model
+    from ormar.queryset import OrderAction
+    from ormar.queryset.aggregations import Aggregate
+
+HAVING_OPERATORS = ["exact", "in", "isnull", "gt", "gte", "lt", "lte"]
+
+
+class AggregateQuery:
+    """
+    Builds the query grouping rows by given fields and computing aggregates
+    for each group. Joins of related models are built the same way as in
+    regular query, only the selected columns are replaced.
+    """
+
+    def __init__(  # noqa CFQ002
+        self,
+        model_cls: type["Model"],
+        filter_clauses: list[FilterAction],
+        exclude_clauses: list[FilterAction],
+        select_related: list,
+        group_by: list[str],
+        annotations: dict[str, "Aggregate"],
+        having: dict[str, Any],
+        order_bys: list["OrderAction"],
+        limit_count: Optional[int],
+        offset: Optional[int],
+    ) -> None:
+        self.model_cls = model_cls
+        self.filter_clauses = filter_clauses
+        self.exclude_clauses = exclude_clauses
+        self.group_by = group_by
+        self.annotations = annotations
+        self.having = having
+        self.order_bys = order_bys
+        self.limit_count = limit_count
+        self.query_offset = offset
+
+        self.group_actions = [
+            resolve_select_action(field=field, model_cls=model_cls)
+            for field in group_by
+        ]
+        self.aggregate_actions = {
+            name: aggregate.get_select_action(model_cls=model_cls)
+            for name, aggregate in annotations.items()
+        }
+        self._select_related = select_related[:]
+        for action in [*self.group_actions, *self.aggregate_actions.values()]:
+            self._select_related = action.update_select_related(self._select_related)
+
+    def build_select_expression(self) -> Select:
+        """
+        Builds the query with joins and filters of the queryset, selecting
+        grouped columns (labeled with fields names) and aggregates
+        (labeled with annotations names).
+
+        :return: ready to run query
+        :rtype: sqlalchemy.sql.selectable.Select
+        """
+        expr = Query(
+            model_cls=self.model_cls,
+            filter_clauses=self.filter_clauses,
+            exclude_clauses=self.exclude_clauses,
+            select_related=self._select_related,
+            limit_count=None,
+            offset=None,
+            excludable=ormar.ExcludableItems(),
+            order_bys=[],
+            limit_raw_sql=True,
+        ).build_select_expression()
+
+        group_columns = [action.get_column() for action in self.group_actions]
+        aggregates = {
+            name: self.annotations[name].apply(action.get_column())
+            for name, action in self.aggregate_actions.items()
+        }
+        expr = expr.with_only_columns(
+            *[
+                column.label(field)
+                for field, column in zip(self.group_by, group_columns)
+            ],
+            *[aggregate.label(name) for name, aggregate in aggregates.items()],
+        ).order_by(None)
+        if group_columns:
+            expr = expr.group_by(*group_columns)
+        for condition in self._get_having_clauses(aggregates=aggregates):
+            expr = expr.having(condition)
+        expr = expr.order_by(*self._get_order_clauses(aggregates=aggregates))
+        expr = LimitQuery(limit_count=self.limit_count).apply(expr)
+        expr = OffsetQuery(query_offset=self.query_offset).apply(expr)
+        return expr
+
+    def _get_having_clauses(self, aggregates: dict[str, Any]) -> list:
+        """
+        Converts having filters (annotation name with optional operator
+        separated with dunder '__') into conditions on aggregates.
+
+        :raises QueryDefinitionError: if annotation or operator is not supported
+        :param aggregates: aggregate expressions by annotation name
+        :type aggregates: dict[str, Any]
+        :return: list of conditions
+        :rtype: list
+        """
+        clauses = []
+        for key, value in self.having.items():
+            name, _, operator = key.partition("__")
+            operator = operator or "exact"
+            if name not in aggregates:
+                raise QueryDefinitionError(
+                    f"You can filter groups only by annotations, {name} is not one"
+                )
+            if operator not in HAVING_OPERATORS:
+                raise QueryDefinitionError(
+                    f"Operator {operator} is not supported in having, "
+                    f"use one of {', '.join(HAVING_OPERATORS)}"
+                )
+            op_attr = FILTER_OPERATORS[operator]
+            if operator == "isnull":
+                op_attr = "is_" if value else "isnot"
+                value = None
+            clauses.append(getattr(aggregates[name], op_attr)(value))
+        return clauses
+
+    def _get_order_clauses(self, aggregates: dict[str, Any]) -> list:
+        """
+        Orders groups by annotations or grouped fields.
+
+        :param aggregates: aggregate expressions by annotation name
+        :type aggregates: dict[str, Any]
+        :return: list of order by clauses
+        :rtype: list
+        """
+        clauses = []
+        for order in self.order_bys:
+            if not order.related_parts and order.field_name in aggregates:
+                aggregate = aggregates[order.field_name]
+                clauses.append(
+                    aggregate.desc() if order.direction == "desc" else aggregate
+                )
+            else:
+                clauses.append(order.get_text_clause())
+        return clauses
+
+
+def build_annotation_subquery(
+    model_cls: type["Model"], aggregate: "Aggregate"
+) -> ColumnElement:
+    """
+    Builds correlated subquery computing the aggregate of related models
+    for each row of the model. The aggregated field has to start with
+    reverse ForeignKey or ManyToMany relation name, i.e. `comments` or
+    `comments__likes`.
+
+    :raises QueryDefinitionError: if the field does not start with reverse
+    or many to many relation
+    :param model_cls: model on which queryset is executed
+    :type model_cls: type[Model]
+    :param aggregate: aggregate to compute
+    :type aggregate: Aggregate
+    :return: scalar subquery correlated with the model table
+    :rtype: sqlalchemy.sql.elements.ColumnElement
+    """
+    relation_name, _, field = aggregate.field.partition("__")
+    relation_field = model_cls.ormar_config.model_fields.get(relation_name)
+    if (
+        relation_field is None
+        or not (relation_field.is_multi or relation_field.virtual)
+        or relation_field.is_through
+        or relation_field.to == model_cls
+    ):
+        raise QueryDefinitionError(
+            f"Annotations without group_by() need a reverse or many to many "
+            f"relation to other model, {aggregate.field} does not start with one"
+        )
+    target = relation_field.to
+    pkname = model_cls.ormar_config.pkname
+    table = model_cls.ormar_config.table
+    back_name = relation_field.get_related_name()
+    filter_action = FilterAction(
+        filter_str=f"{back_name}__{pkname}" if relation_field.is_multi else back_name,
+        value=table.c[model_cls.get_column_alias(pkname)],
+        model_cls=target,
+    )
+    action = aggregate.get_select_action(model_cls=target, field=field or "pk")
+    expr = Query(
+        model_cls=target,
+        filter_clauses=[filter_action],
+        exclude_clauses=[],
+        select_related=action.update_select_related(
+            filter_action.update_select_related([])
+        ),
+        limit_count=None,
+        offset=None,
+        excludable=ormar.ExcludableItems(),
+        order_bys=[],
+        limit_raw_sql=True,
+    ).build_select_expression()
+    expr = expr.with_only_columns(aggregate.apply(action.get_column()))
+    return expr.order_by(None).correlate(table).scalar_subquery()
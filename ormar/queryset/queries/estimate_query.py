@@ -0,0 +1,229 @@
+import json
+from typing import TYPE_CHECKING, Any, Optional
+
+import sqlalchemy
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+from ormar.databases.query_executor import QueryExecutor
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ormar.databases.connection import DatabaseConnection
+
+# query_canceled on PostgreSQL, ER_QUERY_TIMEOUT on MySQL
+TIMEOUT_ERROR_CODES = {"57014", 3024}
+
+
+class Explain(Executable, ClauseElement):
+    """
+    EXPLAIN statement wrapping the select, compiled only for dialects
+    returning the row estimates in machine readable form.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement: sqlalchemy.sql.Select) -> None:
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain_postgresql(element: Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+class EstimateQuery:
+    """
+    Reads estimated number of rows from statistics kept by the database,
+    without scanning the table.
+
+    Supported are PostgreSQL (`pg_class.reltuples` and EXPLAIN), MySQL
+    (`information_schema.tables`) and SQLite (`sqlite_stat1` filled by ANALYZE).
+    For other dialects or tables without statistics estimates are None.
+    """
+
+    def __init__(self, table: sqlalchemy.Table, dialect: Any) -> None:
+        self.table = table
+        self.dialect = dialect
+
+    async def table_estimate(self, executor: QueryExecutor) -> Optional[int]:
+        """
+        Returns number of rows in the whole table collected in statistics.
+
+        :param executor: executor used to run the query
+        :type executor: QueryExecutor
+        :return: estimated number of rows or None if there are no statistics
+        :rtype: Optional[int]
+        """
+        if self.dialect.name == "postgresql":
+            return await self._postgresql_table_estimate(executor)
+        if self.dialect.name == "sqlite":
+            return await self._sqlite_table_estimate(executor)
+        if self.dialect.name == "mysql":
+            return await self._mysql_table_estimate(executor)
+        return None
+
+    async def explain_estimate(
+        self, executor: QueryExecutor, expr: sqlalchemy.sql.Select
+    ) -> Optional[int]:
+        """
+        Returns number of rows the query planner expects the select to return.
+
+        :param executor: executor used to run the query
+        :type executor: QueryExecutor
+        :param expr: select to estimate
+        :type expr: sqlalchemy.sql.Select
+        :return: estimated number of rows or None if planner estimates are
+        not available for the dialect
+        :rtype: Optional[int]
+        """
+        if self.dialect.name != "postgresql":
+            return None
+        plan = await executor.fetch_val(Explain(expr))
+        if isinstance(plan, (str, bytes)):
+            plan = json.loads(plan)
+        if not plan:  # pragma: no cover
+            return None
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    @property
+    def supports_count_timeout(self) -> bool:
+        """
+        Checks if the database can stop the count query itself after a timeout
+        (PostgreSQL `statement_timeout` and MySQL `MAX_EXECUTION_TIME` hint).
+
+        :return: result of the check
+        :rtype: bool
+        """
+        return self.dialect.name == "postgresql" or (
+            self.dialect.name == "mysql" and not self.dialect.is_mariadb
+        )
+
+    async def count_with_timeout(
+        self,
+        database: "DatabaseConnection",
+        expr: sqlalchemy.sql.Select,
+        timeout: float,
+    ) -> Optional[int]:  # pragma: no cover
+        """
+        Executes the count query with a time limit set on the database server,
+        so the query is stopped there and the connection is released when the
+        limit is exceeded.
+
+        On PostgreSQL the query runs in a (nested) transaction with local
+        `statement_timeout`, on MySQL with `MAX_EXECUTION_TIME` optimizer hint.
+
+        :param database: database on which the query is executed
+        :type database: DatabaseConnection
+        :param expr: count query
+        :type expr: sqlalchemy.sql.Select
+        :param timeout: max number of seconds the query can take
+        :type timeout: float
+        :return: number of rows or None if the query timed out
+        :rtype: Optional[int]
+        """
+        milliseconds = max(int(timeout * 1000), 1)
+        try:
+            if self.dialect.name == "mysql":
+                expr = expr.prefix_with(f"/*+ MAX_EXECUTION_TIME({milliseconds}) */")
+                async with database.get_query_executor() as executor:
+                    result = await executor.fetch_val(expr)
+            else:
+                nested = database.get_transaction_connection() is not None
+                async with database.transaction():
+                    async with database.get_query_executor() as executor:
+                        if nested:
+                            previous = await executor.fetch_val(
+                                sqlalchemy.text(
+                                    "SELECT current_setting('statement_timeout')"
+                                )
+                            )
+                        await executor.fetch_val(
+                            set_statement_timeout(str(milliseconds))
+                        )
+                        result = await executor.fetch_val(expr)
+                        if nested:
+                            # local setting would outlive the released savepoint
+                            await executor.fetch_val(
+                                set_statement_timeout(str(previous))
+                            )
+        except sqlalchemy.exc.DBAPIError as error:
+            if is_timeout_error(error):
+                return None
+            raise
+        return int(result) if result is not None else 0
+
+    async def _postgresql_table_estimate(
+        self, executor: QueryExecutor
+    ) -> Optional[int]:
+        expr = sqlalchemy.text(
+            "SELECT reltuples, relpages FROM pg_class "
+            "WHERE oid = to_regclass(:table_name)"
+        ).bindparams(
+            table_name=self.dialect.identifier_preparer.format_table(self.table)
+        )
+        row = await executor.fetch_one(expr)
+        # never analyzed tables report -1 (or 0 pages before PostgreSQL 14)
+        if row is None or row["reltuples"] < 0 or not row["relpages"]:
+            return None
+        return int(row["reltuples"])
+
+    async def _sqlite_table_estimate(self, executor: QueryExecutor) -> Optional[int]:
+        analyzed = await executor.fetch_val(
+            sqlalchemy.text(
+                "SELECT name FROM sqlite_master "
+                "WHERE type = 'table' AND name = 'sqlite_stat1'"
+            )
+        )
+        if not analyzed:
+            return None
+        expr = sqlalchemy.text(
+            "SELECT stat FROM sqlite_stat1 WHERE tbl = :table_name"
+        ).bindparams(table_name=self.table.name)
+        # first number of each stat row is the number of rows in the table
+        stats = [row["stat"] for row in await executor.fetch_all(expr)]
+        counts = [int(stat.split()[0]) for stat in stats if stat]
+        return max(counts) if counts else None
+
+    async def _mysql_table_estimate(
+        self, executor: QueryExecutor
+    ) -> Optional[int]:  # pragma: no cover
+        expr = sqlalchemy.text(
+            "SELECT table_rows FROM information_schema.tables "
+            "WHERE table_schema = COALESCE(:schema, DATABASE()) "
+            "AND table_name = :table_name"
+        ).bindparams(schema=self.table.schema, table_name=self.table.name)
+        result = await executor.fetch_val(expr)
+        return int(result) if result is not None else None
+
+
+def set_statement_timeout(value: str) -> sqlalchemy.TextClause:
+    """
+    Returns PostgreSQL query setting statement timeout until the end of
+    current transaction.
+
+    :param value: timeout in milliseconds or with units
+    :type value: str
+    :return: query setting the timeout
+    :rtype: sqlalchemy.TextClause
+    """
+    return sqlalchemy.text(
+        "SELECT set_config('statement_timeout', :value, true)"
+    ).bindparams(value=value)
+
+
+def is_timeout_error(error: sqlalchemy.exc.DBAPIError) -> bool:
+    """
+    Checks if the database error was raised because the statement exceeded
+    the time limit set on the database server.
+
+    :param error: error raised by the query
+    :type error: sqlalchemy.exc.DBAPIError
+    :return: result of the check
+    :rtype: bool
+    """
+    original = error.orig
+    code = getattr(original, "sqlstate", None) or getattr(original, "pgcode", None)
+    if code is None and original is not None and original.args:
+        code = original.args[0]
+    return code in TIMEOUT_ERROR_CODES
@@ -4,6 +4,8 @@ from abc import abstractmethod
 from typing import TYPE_CHECKING, Any, Sequence, Union, cast
 
 import ormar  # noqa:  I100, I202
+from ormar.databases.single_flight import fetch_all_shared
+from ormar.models.identity_map import get_identity_map
 from ormar.queryset.clause import QueryClause
 from ormar.queryset.queries.query import Query
 from ormar.queryset.utils import translate_list_to_dict
@@ -246,8 +248,9 @@ class LoadNode(Node):
                 )
             )
 
-            async with query_target.ormar_config.database.get_query_executor() as exctr:
-                self.rows = await exctr.fetch_all(expr)
+            self.rows = await fetch_all_shared(
+                database=query_target.ormar_config.database, query=expr
+            )
 
             for child in self.children:
                 await child.load_data()
@@ -381,24 +384,37 @@ class LoadNode(Node):
         also include the through model - hence full rows are unique, but related
         models without through models can be not unique).
         """
-        fields_to_exclude = self.relation_field.to.get_names_to_exclude(
+        model_cls = self.relation_field.to
+        fields_to_exclude = model_cls.get_names_to_exclude(
             excludable=self.excludable, alias=self.exclude_prefix
         )
+        identity_map = get_identity_map()
         parsed_rows: dict[tuple, "Model"] = {}
         for row in self.rows:
-            item = self.relation_field.to.extract_prefixed_table_columns(
+            item = model_cls.extract_prefixed_table_columns(
                 item={},
                 row=row,
                 table_prefix=self.table_prefix,
                 excludable=self.excludable,
             )
             hashable_item = self._hash_item(item)
-            instance = parsed_rows.setdefault(
-                hashable_item,
-                self.relation_field.to._construct_with_excluded(
-                    fields_to_exclude, **item
-                ),
-            )
+            instance = parsed_rows.get(hashable_item)
+            if instance is None:
+                pk = item.get(model_cls.ormar_config.pkname)
+                instance = (
+                    identity_map.get(model_cls, pk)
+                    if identity_map is not None
+                    else None
+                )
+                if instance is not None:
+                    instance._refresh_from_identity_map(item=item, reload_relations=[])
+                else:
+                    instance = model_cls._construct_with_excluded(
+                        fields_to_exclude, **item
+                    )
+                    if identity_map is not None and pk is not None:
+                        identity_map.add(instance)
+                parsed_rows[hashable_item] = instance
             self.models.append(instance)
 
     def _hash_item(self, item: Union[dict, list]) -> tuple:
@@ -438,12 +454,21 @@ class LoadNode(Node):
         Populate parent node models with own child models from grouped dictionary
         """
         relation_key = self._get_relation_key_linking_models()
+        reload_relation = get_identity_map() is not None
         for model in self.parent.models:
             children = self._get_own_models_related_to_parent(
                 model=model, relation_key=relation_key
             )
+            if reload_relation:
+                # models from identity map can have the relation already loaded
+                relation = model._orm._get(self.relation_field.name)
+                if relation is not None:
+                    relation.clear()
+            # loading relations does not change the model
+            changed_fields = set(model.__setattr_fields__)
             for child in children:
                 setattr(model, self.relation_field.name, child)
+            model.__setattr_fields__.intersection_update(changed_fields)
 
     def _get_relation_key_linking_models(self) -> tuple[str, str]:
         """
@@ -16,6 +16,8 @@ if TYPE_CHECKING:  # pragma no cover
     from ormar.models.excludable import ExcludableItems
     from ormar.queryset import OrderAction
 
+TOTAL_COUNT_LABEL = "ormar_total_count"
+
 
 class Query:
     def __init__(  # noqa CFQ002
@@ -29,6 +31,7 @@ class Query:
         excludable: "ExcludableItems",
         order_bys: Optional[list["OrderAction"]],
         limit_raw_sql: bool,
+        with_total: bool = False,
     ) -> None:
         self.query_offset = offset
         self.limit_count = limit_count
@@ -49,6 +52,7 @@ class Query:
         self._init_sorted_orders()
 
         self.limit_raw_sql = limit_raw_sql
+        self.with_total = with_total
 
     def _init_sorted_orders(self) -> None:
         """
@@ -145,13 +149,22 @@ class Query:
                 self.sorted_orders,
             ) = sql_join.build_join()  # type: ignore
 
+        total_column: Optional[sqlalchemy.sql.ColumnElement] = None
         if self._pagination_query_required():
             limit_qry, on_clause = self._build_pagination_condition()
             self.select_from = sqlalchemy.sql.join(
                 cast("FromClauseRole", self.select_from), limit_qry, on_clause
             )
+            if self.with_total:
+                total_column = sqlalchemy.literal_column(
+                    f"limit_query.{TOTAL_COUNT_LABEL}"
+                ).label(TOTAL_COUNT_LABEL)
+        elif self.with_total:
+            total_column = sqlalchemy.func.count().over().label(TOTAL_COUNT_LABEL)
 
         expr = sqlalchemy.sql.select(*self.columns)
+        if total_column is not None:
+            expr = expr.add_columns(total_column)
         expr = expr.select_from(cast("FromClauseRole", self.select_from))
 
         expr = self._apply_expression_modifiers(expr)
@@ -178,6 +191,9 @@ class Query:
 
         The condition is added to filters to filter out desired number of main model
         primary key values. Whole query is used to determine the values.
+
+        If total is requested the subquery also counts all main model rows
+        matching the filters with a window function (before limit and offset).
         """
         pk_alias = self.model_cls.get_column_alias(self.model_cls.ormar_config.pkname)
         pk_aliased_name = f"{self.table.name}.{pk_alias}"
@@ -192,6 +208,10 @@ class Query:
                 maxes[pk_aliased_name] = order.get_text_clause()
 
         limit_qry: Select[Any] = sqlalchemy.sql.select(qry_text)
+        if self.with_total:
+            limit_qry = limit_qry.add_columns(
+                sqlalchemy.func.count().over().label(TOTAL_COUNT_LABEL)
+            )
         limit_qry = limit_qry.select_from(self.select_from)  # type: ignore
         limit_qry = FilterQuery(filter_clauses=self.filter_clauses).apply(limit_qry)
         limit_qry = FilterQuery(
@@ -1,8 +1,14 @@
 import asyncio
+import inspect
+from contextlib import nullcontext
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Generator,
     Generic,
     Optional,
     Sequence,
@@ -11,28 +17,52 @@ from typing import (
     cast,
 )
 
+import pydantic
 import sqlalchemy
 from sqlalchemy import bindparam
 
 import ormar  # noqa I100
 from ormar import MultipleMatches, NoMatch
+from ormar.databases.query_cache import fetch_all_cached
+from ormar.databases.single_flight import fetch_all_shared
+from ormar.databases.transaction import register_transaction_callback
 from ormar.exceptions import (
+    BulkOperationError,
     ModelListEmptyError,
     ModelPersistenceError,
     QueryDefinitionError,
 )
+from ormar.models.identity_map import get_identity_map
 from ormar.queryset import FieldAccessor, FilterQuery, SelectAction
 from ormar.queryset.actions.order_action import OrderAction
+from ormar.queryset.aggregations import Aggregate
+from ormar.queryset.batch_loader import BatchLoader
 from ormar.queryset.clause import FilterGroup, QueryClause
+from ormar.queryset.field_expression import (
+    compile_field_expressions,
+    is_field_expression,
+)
+from ormar.queryset.queries.aggregate_query import (
+    AggregateQuery,
+    build_annotation_subquery,
+)
+from ormar.queryset.queries.estimate_query import EstimateQuery
 from ormar.queryset.queries.prefetch_query import PrefetchQuery
-from ormar.queryset.queries.query import Query
+from ormar.queryset.queries.query import TOTAL_COUNT_LABEL, Query
 from ormar.queryset.reverse_alias_resolver import ReverseAliasResolver
-from ormar.queryset.utils import normalize_slice
+from ormar.queryset.utils import (
+    chunked,
+    get_conflict_insert,
+    normalize_slice,
+    supports_window_functions,
+)
 
 if TYPE_CHECKING:  # pragma no cover
     from ormar import Model
+    from ormar.databases.query_executor import QueryExecutor
     from ormar.models import T
     from ormar.models.excludable import ExcludableItems
+    from ormar.models.model_cache import ModelCache
     from ormar.models.ormar_config import OrmarConfig
 else:
     T = TypeVar("T", bound="Model")
@@ -57,6 +87,11 @@ class QuerySet(Generic[T]):
         limit_raw_sql: bool = False,
         proxy_source_model: Optional[type["Model"]] = None,
         reverse_result: bool = False,
+        use_cache: bool = False,
+        cache_ttl: Optional[float] = None,
+        group_by: Optional[list[str]] = None,
+        annotations: Optional[dict[str, "Aggregate"]] = None,
+        having: Optional[dict[str, Any]] = None,
     ) -> None:
         self.proxy_source_model = proxy_source_model
         self.model_cls = model_cls
@@ -70,6 +105,12 @@ class QuerySet(Generic[T]):
         self.order_bys = order_bys or []
         self.limit_sql_raw = limit_raw_sql
         self._reverse_result = reverse_result
+        self._use_cache = use_cache
+        self._cache_ttl = cache_ttl
+        self._group_by = [] if group_by is None else group_by
+        self._annotations = {} if annotations is None else annotations
+        self._having = {} if having is None else having
+        self._result_cache: Optional[list[T]] = None
 
     @property
     def model_config(self) -> "OrmarConfig":
@@ -108,6 +149,11 @@ class QuerySet(Generic[T]):
         limit_raw_sql: Optional[bool] = None,
         proxy_source_model: Optional[type["Model"]] = None,
         reverse_result: Optional[bool] = None,
+        use_cache: Optional[bool] = None,
+        cache_ttl: Optional[float] = None,
+        group_by: Optional[list[str]] = None,
+        annotations: Optional[dict[str, "Aggregate"]] = None,
+        having: Optional[dict[str, Any]] = None,
     ) -> "QuerySet":
         """
         Method that returns new instance of queryset based on passed params,
@@ -120,6 +166,11 @@ class QuerySet(Generic[T]):
             "prefetch_related": "_prefetch_related",
             "limit_raw_sql": "limit_sql_raw",
             "reverse_result": "_reverse_result",
+            "use_cache": "_use_cache",
+            "cache_ttl": "_cache_ttl",
+            "group_by": "_group_by",
+            "annotations": "_annotations",
+            "having": "_having",
         }
         passed_args = locals()
 
@@ -141,6 +192,11 @@ class QuerySet(Generic[T]):
             limit_raw_sql=replace_if_none("limit_raw_sql"),
             proxy_source_model=replace_if_none("proxy_source_model"),
             reverse_result=replace_if_none("reverse_result"),
+            use_cache=replace_if_none("use_cache"),
+            cache_ttl=replace_if_none("cache_ttl"),
+            group_by=replace_if_none("group_by"),
+            annotations=replace_if_none("annotations"),
+            having=replace_if_none("having"),
         )
 
     async def _prefetch_related_models(
@@ -175,18 +231,25 @@ class QuerySet(Generic[T]):
         :rtype: list[Model]
         """
         result_rows = []
-        for i, row in enumerate(rows):
-            result_rows.append(
-                self.model.from_row(
+        identity_map = get_identity_map()
+        with identity_map.loading() if identity_map is not None else nullcontext():
+            for i, row in enumerate(rows):
+                instance = self.model.from_row(
                     row=row,
                     select_related=self._select_related,
                     excludable=self._excludable,
                     source_model=self.model,
                     proxy_source_model=self.proxy_source_model,
                 )
-            )
-            if i % 100 == 99:  # pragma: no cover
-                await asyncio.sleep(0)
+                if self._annotations and instance is not None:
+                    object.__setattr__(
+                        instance,
+                        "_orm_annotations",
+                        {name: row[name] for name in self._annotations},
+                    )
+                result_rows.append(instance)
+                if i % 100 == 99:  # pragma: no cover
+                    await asyncio.sleep(0)
 
         if result_rows:
             return self.model.merge_instances_list(result_rows)  # type: ignore
@@ -251,6 +314,7 @@ class QuerySet(Generic[T]):
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         order_bys: Optional[list] = None,
+        with_total: bool = False,
     ) -> sqlalchemy.sql.Select:
         """
         Constructs the actual database query used in the QuerySet.
@@ -262,9 +326,26 @@ class QuerySet(Generic[T]):
         :type offset: int
         :param order_bys: list of order-by fields names
         :type order_bys: list
+        :param with_total: flag if number of all matching rows (without limit
+        and offset) should be selected in each row with window function
+        :type with_total: bool
         :return: built sqlalchemy select expression
         :rtype: sqlalchemy.sql.selectable.Select
         """
+        if self._group_by:
+            raise QueryDefinitionError(
+                "Querysets with group_by() can be evaluated "
+                "only with values() or values_list()"
+            )
+        if self._having:
+            raise QueryDefinitionError("Filtering by having requires group_by()")
+        order_bys = order_bys or self.order_bys
+        if any(
+            not x.related_parts and x.field_name in self._annotations for x in order_bys
+        ):
+            raise QueryDefinitionError(
+                "Ordering by annotations is supported only with group_by()"
+            )
         qry = Query(
             model_cls=self.model,
             select_related=self._select_related,
@@ -272,11 +353,21 @@ class QuerySet(Generic[T]):
             exclude_clauses=self.exclude_clauses,
             offset=offset or self.query_offset,
             excludable=self._excludable,
-            order_bys=order_bys or self.order_bys,
+            order_bys=order_bys,
             limit_raw_sql=self.limit_sql_raw,
             limit_count=limit if limit is not None else self.limit_count,
+            with_total=with_total,
         )
         exp = qry.build_select_expression()
+        if self._annotations:
+            exp = exp.add_columns(
+                *[
+                    build_annotation_subquery(
+                        model_cls=self.model, aggregate=aggregate
+                    ).label(name)
+                    for name, aggregate in self._annotations.items()
+                ]
+            )
         # print("\n", exp.compile(compile_kwargs={"literal_binds": True}))
         return exp
 
@@ -524,6 +615,70 @@ class QuerySet(Generic[T]):
         """
         return self.fields(columns=columns, _is_exclude=True)
 
+    def group_by(self, *fields: str) -> "QuerySet[T]":
+        """
+        Groups rows by given fields, so `annotate()` computes aggregates
+        for each group of rows with the same values of the fields.
+
+        To group by fields of related models separate field names with dunder '__',
+        required joins are added the same way as in select_related.
+
+        Grouped querysets are evaluated with `values()` or `values_list()`.
+
+        :param fields: names of the fields to group by
+        :type fields: str
+        :return: QuerySet
+        :rtype: QuerySet
+        """
+        if not fields:
+            raise QueryDefinitionError(
+                "You need to pass at least one field to group by"
+            )
+        group_by = self._group_by + [x for x in fields if x not in self._group_by]
+        return self.rebuild_self(group_by=group_by)
+
+    def annotate(
+        self, having: Optional[dict[str, Any]] = None, **aggregates: "Aggregate"
+    ) -> "QuerySet[T]":
+        """
+        Adds aggregates (`ormar.Count`, `ormar.Sum`, `ormar.Avg`, `ormar.Min`
+        and `ormar.Max`) computed by the database for each group of rows
+        created with `group_by()`, returned under given names by `values()`.
+
+        Groups can be filtered by the annotations with `having`, i.e.
+        `having={"total__gte": 100}`, with `exact`, `in`, `isnull`, `gt`, `gte`,
+        `lt` and `lte` operators. Annotation names can be used in `order_by()`.
+
+        Without `group_by()` aggregates of reverse ForeignKey and ManyToMany
+        relations, i.e. `ormar.Count("comments")`, are computed for each model
+        with correlated subqueries and available as attributes of returned
+        models and in `values()`.
+
+        Annotation names cannot shadow fields, methods or other attributes
+        of the model, i.e. `save` or `pk`.
+
+        :param having: filters of groups by annotations
+        :type having: Optional[dict[str, Any]]
+        :param aggregates: aggregates by names of the annotations
+        :type aggregates: Aggregate
+        :return: QuerySet
+        :rtype: QuerySet
+        """
+        for name, aggregate in aggregates.items():
+            if not isinstance(aggregate, Aggregate):
+                raise QueryDefinitionError(
+                    f"Annotation {name} has to be an aggregate, i.e. ormar.Count"
+                )
+            if name in self.model_config.model_fields or hasattr(self.model, name):
+                raise QueryDefinitionError(
+                    f"Annotation {name} conflicts with a field or an attribute "
+                    f"of the model"
+                )
+        return self.rebuild_self(
+            annotations={**self._annotations, **aggregates},
+            having={**self._having, **(having or {})},
+        )
+
     def order_by(self, columns: Union[list, str, OrderAction]) -> "QuerySet[T]":
         """
         With `order_by()` you can order the results from database based on your
@@ -596,13 +751,16 @@ class QuerySet(Generic[T]):
         :param fields: field name or list of field names to extract from db
         :type fields:  Union[list, str, set, dict]
         """
+        if self._group_by:
+            return await self._grouped_values(
+                fields=fields, _as_dict=_as_dict, _flatten=_flatten
+            )
         if fields:
             return await self.fields(columns=fields).values(
                 _as_dict=_as_dict, _flatten=_flatten, exclude_through=exclude_through
             )
         expr = self.build_select_expression()
-        async with self.model_config.database.get_query_executor() as executor:
-            rows = await executor.fetch_all(expr)
+        rows = await self._fetch_all(expr)
         if not rows:
             return []
         alias_resolver = ReverseAliasResolver(
@@ -613,7 +771,10 @@ class QuerySet(Generic[T]):
         )
         column_map = alias_resolver.resolve_columns(columns_names=list(rows[0].keys()))  # type: ignore
         result = [
-            {column_map.get(k): v for k, v in dict(x).items() if k in column_map}
+            {
+                **{column_map.get(k): v for k, v in dict(x).items() if k in column_map},
+                **{name: x[name] for name in self._annotations},
+            }
             for x in rows
         ]
         if _as_dict:
@@ -625,6 +786,52 @@ class QuerySet(Generic[T]):
         tuple_result = [tuple(x.values()) for x in result]
         return tuple_result if not _flatten else [x[0] for x in tuple_result]
 
+    async def _grouped_values(
+        self,
+        fields: Union[list, str, set, dict, None],
+        _as_dict: bool,
+        _flatten: bool,
+    ) -> list:
+        """
+        Returns grouped fields and annotations of each group of rows
+        of queryset with group_by().
+
+        :param fields: not supported for grouped querysets
+        :type fields: Union[list, str, set, dict, None]
+        :param _as_dict: internal parameter if return dict or tuples
+        :type _as_dict: bool
+        :param _flatten: internal parameter to flatten one element tuples
+        :type _flatten: bool
+        :return: list of dicts or tuples with values of each group
+        :rtype: list
+        """
+        if fields:
+            raise QueryDefinitionError(
+                "Grouped querysets return grouped fields and annotations, "
+                "use group_by() and annotate() instead of fields"
+            )
+        expr = AggregateQuery(
+            model_cls=self.model,
+            filter_clauses=self.filter_clauses,
+            exclude_clauses=self.exclude_clauses,
+            select_related=self._select_related,
+            group_by=self._group_by,
+            annotations=self._annotations,
+            having=self._having,
+            order_bys=self.order_bys,
+            limit_count=self.limit_count,
+            offset=self.query_offset,
+        ).build_select_expression()
+        rows = await self._fetch_all(expr)
+        if _as_dict:
+            return [dict(row) for row in rows]
+        if _flatten and len(self._group_by) + len(self._annotations) != 1:
+            raise QueryDefinitionError(
+                "You cannot flatten values_list if more than one field is selected!"
+            )
+        tuple_result = [tuple(dict(row).values()) for row in rows]
+        return tuple_result if not _flatten else [x[0] for x in tuple_result]
+
     async def values_list(
         self,
         fields: Union[list, str, set, dict, None] = None,
@@ -662,13 +869,21 @@ class QuerySet(Generic[T]):
         Returns a bool value to confirm if there are rows matching the given criteria
         (applied with `filter` and `exclude` if set).
 
+        If the queryset was already evaluated the check uses evaluated results.
+
         :return: result of the check
         :rtype: bool
         """
-        expr = self.build_select_expression()
-        expr = sqlalchemy.exists(expr).select()
+        if self._result_cache is not None:
+            return bool(self._result_cache)
+        one: sqlalchemy.ColumnClause[Any] = sqlalchemy.literal_column("1")
+        if self._is_paginated():
+            subquery = self._build_pk_subquery("subquery_for_exists")
+            expr = sqlalchemy.select(one).select_from(subquery)
+        else:
+            expr = self._build_unordered_expression().with_only_columns(one)
         async with self.model_config.database.get_query_executor() as executor:
-            result = await executor.fetch_val(expr)
+            result = await executor.fetch_val(expr.limit(1))
             return bool(result)
 
     async def count(self, distinct: bool = True) -> int:
@@ -682,21 +897,185 @@ class QuerySet(Generic[T]):
         left `select_related` table joins).
         `False` is the legacy (buggy) behavior for workflows that depend on it.
 
+        Only primary key is selected - without limit and offset the query is
+        a plain `COUNT(*)`, or `COUNT(DISTINCT pk)` if rows are multiplied by joins
+        of reverse or many to many relations.
+
+        If the queryset was already evaluated the distinct count is the number
+        of evaluated results.
+
         :param distinct: flag if the primary table rows should be distinct or not
 
         :return: number of rows
         :rtype: int
         """
-        expr = self.build_select_expression().alias("subquery_for_count")
-        expr = sqlalchemy.func.count().select().select_from(expr)  # type: ignore
-        if distinct:
-            pk_column_name = self.model.get_column_alias(self.model_config.pkname)
-            expr_distinct = expr.group_by(pk_column_name).alias("subquery_for_group")  # type: ignore
-            expr = sqlalchemy.func.count().select().select_from(expr_distinct)  # type: ignore
+        if distinct and self._result_cache is not None:
+            return len(self._result_cache)
+        expr = self._build_count_expression(distinct=distinct)
         async with self.model_config.database.get_query_executor() as executor:
-            result = await executor.fetch_val(expr)  # type: ignore
+            result = await executor.fetch_val(expr)
             return int(result) if result is not None else 0
 
+    def _build_count_expression(self, distinct: bool) -> sqlalchemy.sql.Select:
+        """
+        Builds the query counting rows matching the criteria of the queryset.
+
+        :param distinct: flag if the primary table rows should be distinct or not
+        :type distinct: bool
+        :return: count query
+        :rtype: sqlalchemy.sql.Select
+        """
+        if self._is_paginated():
+            subquery = self._build_pk_subquery("subquery_for_count")
+            column = subquery.c[self._pk_column.name]
+            if distinct:
+                count = sqlalchemy.func.count(sqlalchemy.distinct(column))
+            else:
+                count = sqlalchemy.func.count()
+            expr = sqlalchemy.select(count).select_from(subquery)
+        else:
+            if distinct and self._has_multi_joins():
+                count = sqlalchemy.func.count(sqlalchemy.distinct(self._pk_column))
+            else:
+                count = sqlalchemy.func.count()
+            expr = self._build_unordered_expression().with_only_columns(count)
+        return expr
+
+    async def estimated_count(self, timeout: Optional[float] = None) -> Optional[int]:
+        """
+        Returns approximate number of rows matching the given criteria,
+        cheap to compute also for very large tables.
+
+        For querysets without filters the number of rows is read from table
+        statistics (`pg_class.reltuples` on PostgreSQL, `sqlite_stat1` on SQLite
+        after ANALYZE, `information_schema.tables` on MySQL). Filtered querysets
+        use row estimates of the query planner where available (PostgreSQL EXPLAIN).
+
+        If no estimate is available exact `count()` is executed, capped by
+        the timeout - if it takes longer None is returned. On PostgreSQL and
+        MySQL the limit is set on the database server, so the count is stopped
+        there, on other backends it keeps running until it finishes.
+
+        Limit and offset of the queryset are applied to the estimates.
+
+        :raises QueryDefinitionError: if queryset is grouped
+        :param timeout: max number of seconds to wait for exact count,
+        None waits until the count finishes
+        :type timeout: Optional[float]
+        :return: estimated number of rows or None if exact count timed out
+        :rtype: Optional[int]
+        """
+        if self._result_cache is not None:
+            return len(self._result_cache)
+        expr = self._build_unordered_expression()
+        estimate_query = EstimateQuery(
+            table=self.table, dialect=self.model_config.database.dialect
+        )
+        async with self.model_config.database.get_query_executor() as executor:
+            if not self.filter_clauses and not self.exclude_clauses:
+                estimate = await estimate_query.table_estimate(executor)
+            else:
+                expr = expr.with_only_columns(self._pk_column)
+                if self._has_multi_joins():
+                    expr = expr.distinct()
+                estimate = await estimate_query.explain_estimate(executor, expr)
+        if (
+            estimate is None
+            and timeout is not None
+            and (estimate_query.supports_count_timeout)
+        ):  # pragma: no cover
+            return await estimate_query.count_with_timeout(
+                database=self.model_config.database,
+                expr=self._build_count_expression(distinct=True),
+                timeout=timeout,
+            )
+        if estimate is None:
+            try:
+                return await asyncio.wait_for(self.count(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return None
+        estimate = max(estimate - (self.query_offset or 0), 0)
+        if self.limit_count is not None:
+            estimate = min(estimate, self.limit_count)
+        return estimate
+
+    @property
+    def _pk_column(self) -> sqlalchemy.Column:
+        """
+        Shortcut to primary key column of the model table.
+
+        :return: primary key column
+        :rtype: sqlalchemy.Column
+        """
+        return self.table.c[self.model.get_column_alias(self.model_config.pkname)]
+
+    def _is_paginated(self) -> bool:
+        """
+        Checks if limit or offset is set on the queryset.
+
+        :return: result of the check
+        :rtype: bool
+        """
+        return self.limit_count is not None or bool(self.query_offset)
+
+    def _has_multi_joins(self) -> bool:
+        """
+        Checks if any of select related relations (including relations used
+        in filters) is a reverse or many to many relation, that can return
+        more than one row for each row of the model.
+
+        :return: result of the check
+        :rtype: bool
+        """
+        for related in self._select_related:
+            model: type["Model"] = self.model
+            for part in related.split("__"):
+                field = model.ormar_config.model_fields.get(part)
+                if field is None or field.is_multi or field.virtual or field.is_through:
+                    return True
+                model = field.to
+        return False
+
+    def _build_unordered_expression(self) -> sqlalchemy.sql.Select:
+        """
+        Builds the query with joins and filters of the queryset without
+        ordering, limit and offset, for queries replacing the selected columns.
+
+        :raises QueryDefinitionError: if queryset is grouped
+        :return: select expression
+        :rtype: sqlalchemy.sql.selectable.Select
+        """
+        if self._group_by:
+            raise QueryDefinitionError(
+                "Querysets with group_by() can be evaluated "
+                "only with values() or values_list()"
+            )
+        qry = Query(
+            model_cls=self.model,
+            select_related=self._select_related,
+            filter_clauses=self.filter_clauses,
+            exclude_clauses=self.exclude_clauses,
+            offset=None,
+            excludable=ormar.ExcludableItems(),
+            order_bys=[],
+            limit_raw_sql=True,
+            limit_count=None,
+        )
+        return qry.build_select_expression().order_by(None)
+
+    def _build_pk_subquery(self, name: str) -> sqlalchemy.sql.Subquery:
+        """
+        Builds subquery selecting only primary key of the model,
+        with limit, offset and ordering of the queryset.
+
+        :param name: name of the subquery
+        :type name: str
+        :return: subquery
+        :rtype: sqlalchemy.sql.Subquery
+        """
+        expr = self.build_select_expression().with_only_columns(self._pk_column)
+        return expr.subquery(name)
+
     async def _query_aggr_function(self, func_name: str, columns: list) -> Any:
         func = getattr(sqlalchemy.func, func_name)
         select_actions = [
@@ -775,6 +1154,9 @@ class QuerySet(Generic[T]):
         You have to either pass a filter to narrow down a query or explicitly pass
         each=True flag to affect whole table.
 
+        Values can be also expressions on model fields evaluated by the database,
+        i.e. `update(views=Post.views + 1)`.
+
         :param each: flag if whole table should be affected if no filter is passed
         :type each: bool
         :param kwargs: fields names and proper value types
@@ -782,6 +1164,23 @@ class QuerySet(Generic[T]):
         :return: number of updated rows
         :rtype: int
         """
+        expr = self._build_update_expression(each=each, **kwargs)
+        async with self.model_config.database.get_query_executor() as executor:
+            result = await executor.execute(expr)
+        self._clear_model_cache()
+        return result
+
+    def _build_update_expression(self, each: bool = False, **kwargs: Any) -> Any:
+        """
+        Builds filtered update statement for the model table.
+
+        :param each: flag if whole table should be affected if no filter is passed
+        :type each: bool
+        :param kwargs: fields names and proper value types
+        :type kwargs: Any
+        :return: update statement
+        :rtype: sqlalchemy.sql.Update
+        """
         if not each and not (self.filter_clauses or self.exclude_clauses):
             raise QueryDefinitionError(
                 "You cannot update without filtering the queryset first. "
@@ -792,18 +1191,43 @@ class QuerySet(Generic[T]):
             self.model.extract_related_names()
         )
         updates = {k: v for k, v in kwargs.items() if k in self_fields}
-        updates = self.model.populate_onupdate_value(updates)
+        expressions = {k: v for k, v in updates.items() if is_field_expression(v)}
+        updates = {k: v for k, v in updates.items() if k not in expressions}
+        updates = self.model.populate_onupdate_value(
+            updates, explicit_fields=set(updates) | set(expressions)
+        )
         updates = self.model.validate_enums(updates)
         updates = self.model.translate_columns_to_aliases(updates)
+        updates.update(compile_field_expressions(self.model, expressions))
 
-        expr = FilterQuery(filter_clauses=self.filter_clauses).apply(
+        return self._apply_filter_clauses(
             self.table.update().values(**updates)  # type: ignore
         )
-        expr = FilterQuery(filter_clauses=self.exclude_clauses, exclude=True).apply(
-            expr
-        )
-        async with self.model_config.database.get_query_executor() as executor:
-            return await executor.execute(expr)
+
+    async def update_returning(self, each: bool = False, **kwargs: Any) -> list["T"]:
+        """
+        Works the same as update() but returns the updated models instead of
+        the number of updated rows.
+
+        Rows are returned by the UPDATE statement itself (with RETURNING clause),
+        so no separate query is issued and models reflect exactly the rows
+        that were updated.
+
+        Related models are not loaded, only the relation keys are populated.
+
+        :raises QueryDefinitionError: if database backend does not support RETURNING
+        :param each: flag if whole table should be affected if no filter is passed
+        :type each: bool
+        :param kwargs: fields names and proper value types
+        :type kwargs: Any
+        :return: list of updated models
+        :rtype: list[Model]
+        """
+        self._verify_returning_support(operation="update")
+        expr = self._build_update_expression(each=each, **kwargs)
+        instances = await self._fetch_returning(expr)
+        self._clear_model_cache()
+        return instances
 
     async def delete(self, *args: Any, each: bool = False, **kwargs: Any) -> int:
         """
@@ -821,19 +1245,120 @@ class QuerySet(Generic[T]):
         """
         if kwargs or args:
             return await self.filter(*args, **kwargs).delete()
+        expr = self._build_delete_expression(each=each)
+        async with self.model_config.database.get_query_executor() as executor:
+            result = await executor.execute(expr)
+        self._clear_model_cache()
+        return result
+
+    async def delete_returning(
+        self, *args: Any, each: bool = False, **kwargs: Any
+    ) -> list["T"]:
+        """
+        Works the same as delete() but returns the deleted models instead of
+        the number of deleted rows.
+
+        Rows are returned by the DELETE statement itself (with RETURNING clause),
+        so no separate query is issued. Returned models are not saved anymore
+        and are removed from the active identity map.
+
+        :raises QueryDefinitionError: if database backend does not support RETURNING
+        :param each: flag if whole table should be affected if no filter is passed
+        :type each: bool
+        :param kwargs: fields names and proper value types
+        :type kwargs: Any
+        :return: list of deleted models
+        :rtype: list[Model]
+        """
+        if kwargs or args:
+            return await self.filter(*args, **kwargs).delete_returning()
+        self._verify_returning_support(operation="delete")
+        expr = self._build_delete_expression(each=each)
+        instances = await self._fetch_returning(expr)
+        self._clear_model_cache()
+        identity_map = get_identity_map()
+        for instance in instances:
+            instance.set_save_status(False)
+            if identity_map is not None:
+                identity_map.discard(self.model, instance.pk)
+        return instances
+
+    def _clear_model_cache(self) -> None:
+        """
+        Clears the model cache (if set) after update or delete of filtered rows,
+        as the affected primary keys are not known, together with evaluated
+        results of the queryset. Inside a transaction the cache is cleared
+        again after the transaction ends.
+        """
+        self._result_cache = None
+        if self.model_config.cache is not None:
+            self.model_config.cache.clear()
+            register_transaction_callback(self.model_config.cache.clear)
+
+    def _build_delete_expression(self, each: bool = False) -> Any:
+        """
+        Builds filtered delete statement for the model table.
+
+        :param each: flag if whole table should be affected if no filter is passed
+        :type each: bool
+        :return: delete statement
+        :rtype: sqlalchemy.sql.Delete
+        """
         if not each and not (self.filter_clauses or self.exclude_clauses):
             raise QueryDefinitionError(
                 "You cannot delete without filtering the queryset first. "
                 "If you want to delete all rows use delete(each=True)"
             )
-        expr = FilterQuery(filter_clauses=self.filter_clauses).apply(
-            self.table.delete()  # type: ignore
-        )
-        expr = FilterQuery(filter_clauses=self.exclude_clauses, exclude=True).apply(
+        return self._apply_filter_clauses(self.table.delete())  # type: ignore
+
+    def _apply_filter_clauses(self, expr: Any) -> Any:
+        """
+        Applies filter and exclude clauses of the queryset to the statement.
+
+        :param expr: update or delete statement
+        :type expr: Union[sqlalchemy.sql.Update, sqlalchemy.sql.Delete]
+        :return: filtered statement
+        :rtype: Union[sqlalchemy.sql.Update, sqlalchemy.sql.Delete]
+        """
+        expr = FilterQuery(filter_clauses=self.filter_clauses).apply(expr)
+        return FilterQuery(filter_clauses=self.exclude_clauses, exclude=True).apply(
             expr
         )
+
+    def _verify_returning_support(self, operation: str) -> None:
+        """
+        Checks if the database backend supports RETURNING clause for given
+        operation.
+
+        :raises QueryDefinitionError: if RETURNING is not supported
+        :param operation: name of the operation (update or delete)
+        :type operation: str
+        """
+        dialect = self.model_config.database.dialect
+        if not getattr(dialect, f"{operation}_returning", False):
+            raise QueryDefinitionError(
+                f"{operation}_returning() requires database backend supporting "
+                f"{operation.upper()} ... RETURNING, {dialect.name} does not. "
+                f"Use {operation}() and query the rows separately instead."
+            )
+
+    async def _fetch_returning(self, expr: Any) -> list["T"]:
+        """
+        Executes the statement with RETURNING of all model table columns
+        and initializes models from returned rows.
+
+        :param expr: update or delete statement
+        :type expr: Union[sqlalchemy.sql.Update, sqlalchemy.sql.Delete]
+        :return: list of models
+        :rtype: list[Model]
+        """
+        expr = expr.returning(*self.table.columns)
         async with self.model_config.database.get_query_executor() as executor:
-            return await executor.execute(expr)
+            rows = await executor.fetch_all(expr)
+        return [
+            self.model.from_row(row=row, source_model=self.model)  # type: ignore
+            for row in rows
+        ]
 
     def paginate(self, page: int, page_size: int = 20) -> "QuerySet[T]":
         """
@@ -873,6 +1398,41 @@ class QuerySet(Generic[T]):
         limit_raw_sql = self.limit_sql_raw if limit_raw_sql is None else limit_raw_sql
         return self.rebuild_self(limit_count=limit_count, limit_raw_sql=limit_raw_sql)
 
+    def cache(self, ttl: Optional[float] = None) -> "QuerySet[T]":
+        """
+        Caches rows returned by the query in the query cache of the database
+        (set with `query_cache` option of `DatabaseConnection`, in memory of the
+        process by default), under the key of compiled sql and its params.
+
+        Cached rows are served only until any of the tables used in the query
+        is written by ormar, and only outside of transactions.
+
+        :param ttl: number of seconds after which cached rows expire
+        :type ttl: Optional[float]
+        :return: QuerySet
+        :rtype: QuerySet
+        """
+        return self.rebuild_self(use_cache=True, cache_ttl=ttl)
+
+    async def _fetch_all(self, expr: Any) -> list:
+        """
+        Executes select statement and returns all rows, from the query cache
+        if the queryset is cached and no transaction is active.
+        Identical concurrent queries share one execution if `single_flight`
+        is enabled in the database.
+
+        :param expr: select statement
+        :type expr: sqlalchemy.sql.Select
+        :return: database rows
+        :rtype: list
+        """
+        database = self.model_config.database
+        if self._use_cache and database.get_transaction_connection() is None:
+            return await fetch_all_cached(
+                database=database, query=expr, ttl=self._cache_ttl
+            )
+        return await fetch_all_shared(database=database, query=expr)
+
     def offset(
         self, offset: int, limit_raw_sql: Optional[bool] = None
     ) -> "QuerySet[T]":
@@ -932,8 +1492,7 @@ class QuerySet(Generic[T]):
         :rtype: Model
         """
         expr = self.build_select_expression(limit=1, order_bys=order_bys)
-        async with self.model_config.database.get_query_executor() as executor:
-            rows = await executor.fetch_all(expr)
+        rows = await self._fetch_all(expr)
         processed_rows = await self._process_query_result_rows(rows)
         if self._prefetch_related and processed_rows:
             processed_rows = await self._prefetch_related_models(processed_rows, rows)
@@ -1045,6 +1604,10 @@ class QuerySet(Generic[T]):
         :return: returned model
         :rtype: Model
         """
+        cache = self.model_config.cache
+        if cache is not None and self._is_cacheable_pk_lookup(args, kwargs):
+            return await self._get_cached(cache=cache, pk=next(iter(kwargs.values())))
+
         if kwargs or args:
             return await self.filter(*args, **kwargs).get()
 
@@ -1066,14 +1629,74 @@ class QuerySet(Generic[T]):
         else:
             expr = self.build_select_expression()
 
-        async with self.model_config.database.get_query_executor() as executor:
-            rows = await executor.fetch_all(expr)
+        rows = await self._fetch_all(expr)
         processed_rows = await self._process_query_result_rows(rows)
         if self._prefetch_related and processed_rows:
             processed_rows = await self._prefetch_related_models(processed_rows, rows)
         self.check_single_result_rows_count(processed_rows)
         return processed_rows[0]  # type: ignore
 
+    def _is_cacheable_pk_lookup(self, args: tuple, kwargs: dict) -> bool:
+        """
+        Checks if get() call is a plain lookup by primary key, that can be served
+        from the model cache - without other filters, related models and
+        excluded fields, and outside of a transaction (in which rows can be
+        not yet committed).
+
+        :param args: positional filter arguments of get()
+        :type args: tuple
+        :param kwargs: keyword filter arguments of get()
+        :type kwargs: dict
+        :return: result of the check
+        :rtype: bool
+        """
+        return (
+            not args
+            and len(kwargs) == 1
+            and next(iter(kwargs)) in ("pk", self.model_config.pkname)
+            and next(iter(kwargs.values())) is not None
+            and not (
+                self.filter_clauses
+                or self.exclude_clauses
+                or self._select_related
+                or self._prefetch_related
+                or self._excludable.items
+                or self.query_offset
+                or self.proxy_source_model
+                or self._annotations
+            )
+            and self.model_config.database.get_transaction_connection() is None
+        )
+
+    async def _get_cached(self, cache: "ModelCache", pk: Any) -> "T":
+        """
+        Gets the model by primary key from the model cache, on cache miss the row
+        is read from the database and stored in the cache.
+
+        :raises NoMatch: if no rows are returned
+        :param cache: cache of the model
+        :type cache: ModelCache
+        :param pk: primary key value
+        :type pk: Any
+        :return: returned model
+        :rtype: Model
+        """
+        row = cache.get(pk)
+        if row is None:
+            pk_column = self.table.primary_key.columns.values()[0]
+            expr = self.table.select().where(pk_column == pk)
+            rows = await fetch_all_shared(
+                database=self.model_config.database, query=expr
+            )
+            if not rows:
+                raise NoMatch()
+            row = dict(rows[0])
+            cache.set(row[pk_column.name], row)
+        return cast(
+            "T",
+            self.model.from_row(row=row, source_model=self.model),  # type: ignore
+        )
+
     async def get_or_create(
         self,
         _defaults: Optional[dict[str, Any]] = None,
@@ -1090,6 +1713,13 @@ class QuerySet(Generic[T]):
         Passing a criteria is actually calling filter(*args, **kwargs) method described
         below.
 
+        If kwargs are plain equality lookups of exactly the columns of primary key
+        or unique constraint, and the database supports it (PostgreSQL, SQLite),
+        the row is inserted first with `INSERT ... ON CONFLICT DO NOTHING RETURNING`,
+        and only if it already exists it is selected. That way concurrent calls do
+        not fail with IntegrityError. Note that pre_save signal is sent also when
+        the row already existed, while post_save only if it was created.
+
         :param kwargs: fields names and proper value types
         :type kwargs: Any
         :param _defaults: default values for creating object
@@ -1097,16 +1727,96 @@ class QuerySet(Generic[T]):
         :return: model instance and a boolean
         :rtype: tuple("T", bool)
         """
+        _defaults = _defaults or {}
+        conflict_columns = self._get_conflict_columns(*args, **kwargs)
+        if conflict_columns is not None:
+            pk_name = self.model_config.pkname
+            values = {pk_name if k == "pk" else k: v for k, v in kwargs.items()}
+            instance = self.model(**{**values, **_defaults})
+            if await instance._save(conflict_columns=conflict_columns):
+                self._result_cache = None
+                return instance, True
+            return await self.get(*args, **kwargs), False
+
         try:
             return await self.get(*args, **kwargs), False
         except NoMatch:
-            _defaults = _defaults or {}
             return await self.create(**{**kwargs, **_defaults}), True
 
+    def _get_conflict_columns(self, *args: Any, **kwargs: Any) -> Optional[list[str]]:
+        """
+        Returns the columns of primary key or unique constraint equal to the columns
+        of given lookup kwargs, if get_or_create can use `ON CONFLICT DO NOTHING`.
+        With additional lookups a conflicting row might not match them, so regular
+        select and insert is used then.
+
+        That is only possible for plain, not null equality lookups on own fields
+        of the model in a queryset without other filters, on dialects supporting
+        conflict clauses and `RETURNING`.
+
+        :param args: filter clauses
+        :type args: Any
+        :param kwargs: fields names and values
+        :type kwargs: Any
+        :return: names of constraint columns or None
+        :rtype: Optional[list[str]]
+        """
+        if (
+            args
+            or not kwargs
+            or self.filter_clauses
+            or self.exclude_clauses
+            or get_conflict_insert(self.table, self.model_config.database.dialect)
+            is None
+        ):
+            return None
+        pk_name = self.model_config.pkname
+        names = {pk_name if name == "pk" else name for name in kwargs}
+        if not names.issubset(self.model.extract_db_own_fields()) or any(
+            value is None for value in kwargs.values()
+        ):
+            return None
+        columns = {self.model.get_column_alias(name) for name in names}
+        candidates = [
+            [column.name for column in constraint.columns]
+            for constraint in self.table.constraints
+            if isinstance(
+                constraint,
+                (sqlalchemy.PrimaryKeyConstraint, sqlalchemy.UniqueConstraint),
+            )
+        ]
+        candidates.extend(
+            [column.name for column in index.columns]
+            for index in self.table.indexes
+            if index.unique
+        )
+        matching = sorted(
+            (
+                candidate
+                for candidate in candidates
+                if candidate and set(candidate) == columns
+            ),
+            key=lambda candidate: (
+                candidate != [self.model.get_column_alias(pk_name)],
+                candidate,
+            ),
+        )
+        return matching[0] if matching else None
+
     async def update_or_create(self, **kwargs: Any) -> "T":
         """
         Updates the model, or in case there is no match in database creates a new one.
 
+        If pk is passed together with all required fields, on PostgreSQL the row
+        is inserted or updated with one atomic native upsert statement, and passed
+        fields are the ones updated if the row exists. That requires no pre_save
+        and pre_update receivers registered, as it's not known upfront if the row
+        will be created or updated. Otherwise the model is fetched and updated.
+
+        Row with given pk that does not exist yet is created if all required fields
+        are passed, otherwise `NoMatch` is raised.
+
+        :raises NoMatch: if pk is not found and not all required fields are passed
         :param kwargs: fields names and proper value types
         :type kwargs: Any
         :return: updated or created model
@@ -1117,8 +1827,28 @@ class QuerySet(Generic[T]):
             kwargs[pk_name] = kwargs.pop("pk")
         if pk_name not in kwargs or kwargs.get(pk_name) is None:
             return await self.create(**kwargs)
-        model = await self.get(pk=kwargs[pk_name])
-        return await model.update(**kwargs)
+        complete = True
+        try:
+            instance = self.model(**kwargs)
+        except pydantic.ValidationError:
+            # not all required fields passed - update has to load the row first
+            complete = False
+        else:
+            upserted = await instance._native_upsert(
+                explicit_fields=set(kwargs), update_fields=set(kwargs)
+            )
+            if upserted is not None:
+                self._result_cache = None
+                return instance
+        try:
+            model = await self.get(pk=kwargs[pk_name])
+        except NoMatch:
+            if not complete:
+                raise
+            return await self.create(**kwargs)
+        model = await model.update(**kwargs)
+        self._result_cache = None
+        return model
 
     async def all(self, *args: Any, **kwargs: Any) -> list["T"]:  # noqa: A003
         """
@@ -1129,6 +1859,8 @@ class QuerySet(Generic[T]):
 
         If there are no rows meeting the criteria an empty list is returned.
 
+        If the queryset was already evaluated (awaited) evaluated results are returned.
+
         :param kwargs: fields names and proper value types
         :type kwargs: Any
         :return: list of returned models
@@ -1136,18 +1868,143 @@ class QuerySet(Generic[T]):
         """
         if kwargs or args:
             return await self.filter(*args, **kwargs).all()
+        if self._result_cache is not None:
+            return list(self._result_cache)
 
         expr = self.build_select_expression()
-        async with self.model_config.database.get_query_executor() as executor:
-            rows = await executor.fetch_all(expr)
+        rows = await self._fetch_all(expr)
+        return await self._load_models(rows)
+
+    async def paginate_with_total(
+        self, page: int, page_size: int = 20
+    ) -> tuple[list["T"], int]:
+        """
+        Returns models from given page together with number of all models
+        matching the given criteria (applied with `filter` and `exclude`).
+
+        On databases supporting window functions both are fetched in one query,
+        with `COUNT(*) OVER()` selected in each row (in the subquery limiting
+        the main models if select_related is used). Otherwise, or if the page
+        is past the last one, separate count query is executed. The same happens
+        if raw sql rows are limited and reverse or many to many relations are
+        joined, as the window would count joined rows instead of models.
+
+        :raises QueryDefinitionError: if page or page size are lower than 1
+        :param page: page number
+        :type page: int
+        :param page_size: numbers of items per page
+        :type page_size: int
+        :return: models from the page and total number of models
+        :rtype: tuple[list[Model], int]
+        """
+        queryset = self.paginate(page=page, page_size=page_size)
+        if not supports_window_functions(self.model_config.database.dialect) or (
+            queryset.limit_sql_raw and queryset._has_multi_joins()
+        ):
+            return await queryset.all(), await self._count_without_pagination()
+        rows = await queryset._fetch_all(
+            queryset.build_select_expression(with_total=True)
+        )
+        if rows:
+            total = rows[0][TOTAL_COUNT_LABEL]
+        else:
+            total = await self._count_without_pagination() if page > 1 else 0
+        return await queryset._load_models(rows), total
+
+    async def _count_without_pagination(self) -> int:
+        """
+        Counts all models matching the criteria, ignoring limit and offset.
+
+        :return: number of rows
+        :rtype: int
+        """
+        queryset = self.rebuild_self()
+        queryset.limit_count = None
+        queryset.query_offset = None
+        return await queryset.count()
+
+    async def _load_models(self, rows: list) -> list["T"]:
+        """
+        Builds models from the database rows, prefetches their related models
+        and applies reversed order if set.
+
+        :param rows: list of database rows from query result
+        :type rows: list[sqlalchemy.engine.result.RowProxy]
+        :return: list of models
+        :rtype: list[Model]
+        """
         result_rows = await self._process_query_result_rows(rows)
         if self._prefetch_related and result_rows:
             result_rows = await self._prefetch_related_models(result_rows, rows)
         if self._reverse_result:
             result_rows.reverse()
-
         return result_rows
 
+    async def in_bulk(
+        self, values: Sequence[Any], field: str = "pk", batch_size: int = 500
+    ) -> dict[Any, "T"]:
+        """
+        Loads models with given values of the primary key or unique field,
+        with `WHERE field IN (...)` queries, each with at most `batch_size` values.
+
+        Filters and related models set on the queryset before are applied.
+
+        :raises QueryDefinitionError: if queryset has limit or offset or field
+        is not a primary key or unique column
+        :param values: values of the field to load
+        :type values: Sequence[Any]
+        :param field: name of the primary key or unique field
+        :type field: str
+        :param batch_size: maximum number of values in one query
+        :type batch_size: int
+        :return: dict of field values and loaded models, missing values are skipped
+        :rtype: dict[Any, Model]
+        """
+        if self.limit_count is not None or self.query_offset:
+            raise QueryDefinitionError(
+                "You cannot use in_bulk() on a queryset with limit or offset."
+            )
+        field_name = self.model_config.pkname if field == "pk" else field
+        model_field = self.model_config.model_fields.get(field_name)
+        if (
+            model_field is None
+            or model_field.is_relation
+            or not (model_field.primary_key or model_field.unique)
+        ):
+            raise QueryDefinitionError(
+                f"Field {field} of {self.model.get_name()} used in in_bulk() "
+                f"has to be a primary key or unique column."
+            )
+        unique_values = list(dict.fromkeys(x for x in values if x is not None))
+        result: dict[Any, "T"] = {}
+        for chunk in chunked(unique_values, batch_size):
+            chunk_filter = {f"{field_name}__in": list(chunk)}
+            instances = await self.filter(**chunk_filter).all()  # type: ignore
+            for instance in instances:
+                result[getattr(instance, field_name)] = instance
+        return result
+
+    def batch_loader(
+        self, field: str = "pk", delay: float = 0.0, batch_size: int = 500
+    ) -> "BatchLoader[T]":
+        """
+        Returns a loader that collects loads of single models requested by
+        concurrent coroutines (until the next event loop iteration or for
+        `delay` seconds) and loads them with one `in_bulk()` call.
+
+        :param field: name of the primary key or unique field
+        :type field: str
+        :param delay: number of seconds for which loads are collected
+        :type delay: float
+        :param batch_size: maximum number of values in one query
+        :type batch_size: int
+        :return: batch loader
+        :rtype: BatchLoader
+        """
+        return BatchLoader(
+            queryset=self, field=field, delay=delay, batch_size=batch_size
+        )
+
     async def iterate(  # noqa: A003
         self,
         *args: Any,
@@ -1216,9 +2073,16 @@ class QuerySet(Generic[T]):
         """
         instance = self.model(**kwargs)
         instance = await instance.save()
+        self._result_cache = None
         return instance
 
-    async def bulk_create(self, objects: list["T"]) -> None:
+    async def bulk_create(
+        self,
+        objects: list["T"],
+        batch_size: Optional[int] = None,
+        method: str = "insert",
+        concurrency: Optional[int] = None,
+    ) -> None:
         """
         Performs a bulk create in one database session to speed up the process.
 
@@ -1226,32 +2090,365 @@ class QuerySet(Generic[T]):
 
         A valid list of `Model` objects needs to be passed.
 
-        Bulk operations do not send signals.
+        If `batch_size` is passed objects are inserted in chunks of at most
+        `batch_size` rows, all in one transaction.
+
+        With `method="copy"` rows are loaded with the COPY protocol on PostgreSQL
+        with asyncpg driver, which is considerably faster for large imports.
+        On other backends it falls back to regular INSERT statements.
+
+        If `concurrency` is passed chunks are inserted concurrently on up to
+        `concurrency` separate connections from the pool, outside of any
+        transaction (so the operation is not atomic). Errors of failed chunks are
+        collected and raised together as `BulkOperationError` once all chunks
+        finished. If `batch_size` is not set, objects are split evenly between
+        connections.
 
+        Bulk operations do not send per instance signals, instead one
+        post_bulk_create signal is sent with all created instances.
+
+        :raises BulkOperationError: if some of the concurrent chunks failed
         :param objects: list of ormar models already initialized and ready to save.
         :type objects: list[Model]
+        :param batch_size: maximum number of rows inserted in one statement
+        :type batch_size: Optional[int]
+        :param method: "insert" or "copy" - how the rows are sent to the database
+        :type method: str
+        :param concurrency: maximum number of chunks inserted at the same time
+        :type concurrency: Optional[int]
         """
 
         if not objects:
             raise ModelListEmptyError("Bulk create objects are empty!")
+        self._verify_bulk_create_method(method)
+
+        if concurrency is not None:
+            batch_size = self._get_concurrent_batch_size(
+                objects=objects, batch_size=batch_size, concurrency=concurrency
+            )
 
+            async def execute(executor: "QueryExecutor", rows: list[dict]) -> None:
+                await self._execute_bulk_insert(
+                    executor=executor, rows=rows, method=method
+                )
+
+            chunks = list(chunked(objects, batch_size))
+            errors = await self._run_bulk_chunks_concurrently(
+                chunks=chunks,
+                prepare=self._prepare_bulk_insert_rows,
+                execute=execute,
+                concurrency=concurrency,
+            )
+            failed = {index for index, _ in errors}
+            created = [
+                obj
+                for index, chunk in enumerate(chunks)
+                if index not in failed
+                for obj in chunk
+            ]
+            self._result_cache = None
+            if created:
+                await self.model_config.signals.post_bulk_create.send(
+                    sender=self.model, instances=created
+                )
+            self._raise_bulk_chunk_errors(errors)
+            return
+
+        batch_size = batch_size if batch_size is not None else len(objects)
+        # Multiple chunks: run in an explicit transaction so all chunks
+        # are committed at once.
+        async with self.model_config.database.get_query_executor(
+            transactional=len(objects) > batch_size
+        ) as executor:
+            for chunk in chunked(objects, batch_size):
+                await self._bulk_insert_chunk(
+                    executor=executor, objects=chunk, method=method
+                )
+        self._result_cache = None
+        await self.model_config.signals.post_bulk_create.send(
+            sender=self.model, instances=objects
+        )
+
+    async def bulk_create_stream(
+        self,
+        objects: AsyncIterable[Union["T", dict[str, Any]]],
+        batch_size: int = 500,
+        progress: Optional[Callable[[int], Any]] = None,
+        method: str = "insert",
+    ) -> int:
+        """
+        Performs a bulk create of models consumed lazily from an async iterable,
+        so the whole data set never has to be kept in memory.
+
+        Items can be either ormar models or dictionaries of field values,
+        the latter are validated by initializing the model.
+
+        Objects are inserted in chunks of at most `batch_size` rows, each chunk is
+        a separate statement, so wrap the call in a transaction if the whole
+        import should be atomic.
+
+        With `method="copy"` each chunk is loaded with the COPY protocol on
+        PostgreSQL with asyncpg driver, other backends fall back to INSERT.
+
+        Bulk operations do not send per instance signals, instead one
+        post_bulk_create signal is sent for each inserted chunk.
+
+        :param objects: async iterable of ormar models or dictionaries
+        :type objects: AsyncIterable[Union[Model, dict]]
+        :param batch_size: maximum number of rows inserted in one statement
+        :type batch_size: int
+        :param progress: optional (sync or async) callback called after each chunk
+        with the number of rows inserted so far
+        :type progress: Optional[Callable[[int], Any]]
+        :param method: "insert" or "copy" - how the rows are sent to the database
+        :type method: str
+        :return: number of inserted rows
+        :rtype: int
+        """
+        if batch_size < 1:
+            raise QueryDefinitionError("Batch size has to be greater than 0.")
+        self._verify_bulk_create_method(method)
+
+        total = 0
+        batch: list["T"] = []
+        async for obj in objects:
+            batch.append(obj if isinstance(obj, ormar.Model) else self.model(**obj))
+            if len(batch) >= batch_size:
+                total += await self._insert_stream_batch(batch, total, progress, method)
+                batch = []
+        if batch:
+            total += await self._insert_stream_batch(batch, total, progress, method)
+        return total
+
+    async def _insert_stream_batch(
+        self,
+        batch: list["T"],
+        inserted: int,
+        progress: Optional[Callable[[int], Any]],
+        method: str,
+    ) -> int:
+        """
+        Inserts one chunk of bulk_create_stream, sends post_bulk_create signal
+        and reports the progress.
+
+        :param batch: models to insert
+        :type batch: list[Model]
+        :param inserted: number of rows already inserted
+        :type inserted: int
+        :param progress: optional progress callback
+        :type progress: Optional[Callable[[int], Any]]
+        :param method: "insert" or "copy" - how the rows are sent to the database
+        :type method: str
+        :return: number of inserted rows
+        :rtype: int
+        """
+        async with self.model_config.database.get_query_executor() as executor:
+            await self._bulk_insert_chunk(
+                executor=executor, objects=batch, method=method
+            )
+        self._result_cache = None
+        await self.model_config.signals.post_bulk_create.send(
+            sender=self.model, instances=batch
+        )
+        if progress is not None:
+            result = progress(inserted + len(batch))
+            if inspect.isawaitable(result):
+                await result
+        return len(batch)
+
+    @staticmethod
+    def _verify_bulk_create_method(method: str) -> None:
+        """
+        Checks if the bulk create method is one of supported ones.
+
+        :raises QueryDefinitionError: if method is not supported
+        :param method: name of the method
+        :type method: str
+        """
+        if method not in ("insert", "copy"):
+            raise QueryDefinitionError(
+                f"Bulk create method has to be 'insert' or 'copy', got '{method}'."
+            )
+
+    async def _bulk_insert_chunk(
+        self, executor: "QueryExecutor", objects: Sequence["T"], method: str = "insert"
+    ) -> None:
+        """
+        Prepares given models and inserts them with one multi-row INSERT,
+        or with COPY if requested and supported by the backend.
+        Marks the models as saved.
+
+        :param executor: executor used to run the query
+        :type executor: QueryExecutor
+        :param objects: models to insert
+        :type objects: Sequence[Model]
+        :param method: "insert" or "copy" - how the rows are sent to the database
+        :type method: str
+        """
+        ready_objects = await self._prepare_bulk_insert_rows(objects)
+        await self._execute_bulk_insert(
+            executor=executor, rows=ready_objects, method=method
+        )
+        self._mark_bulk_saved(objects)
+
+    @staticmethod
+    async def _prepare_bulk_insert_rows(objects: Sequence["T"]) -> list[dict]:
+        """
+        Dumps and prepares given models to be inserted into the database.
+        Yields control to the event loop every 100 models.
+
+        :param objects: models to insert
+        :type objects: Sequence[Model]
+        :return: list of rows with column names as keys
+        :rtype: list[dict]
+        """
         ready_objects = []
         for i, obj in enumerate(objects):
             ready_objects.append(obj.prepare_model_to_save(obj.model_dump()))
             if i % 100 == 99:  # pragma: no cover
                 await asyncio.sleep(0)
+        return ready_objects
 
-        # don't use execute_many, as in databases it's executed in a loop
-        # instead of using execute_many from drivers
-        expr = self.table.insert().values(ready_objects)
-        async with self.model_config.database.get_query_executor() as executor:
+    async def _execute_bulk_insert(
+        self, executor: "QueryExecutor", rows: list[dict], method: str
+    ) -> None:
+        """
+        Inserts already prepared rows with one multi-row INSERT,
+        or with COPY if requested and supported by the backend.
+
+        :param executor: executor used to run the query
+        :type executor: QueryExecutor
+        :param rows: prepared rows with column names as keys
+        :type rows: list[dict]
+        :param method: "insert" or "copy" - how the rows are sent to the database
+        :type method: str
+        """
+        if method == "copy" and executor.supports_copy:
+            await executor.copy_records(table=self.table, rows=rows)
+        else:
+            # don't use execute_many, as in databases it's executed in a loop
+            # instead of using execute_many from drivers
+            expr = self.table.insert().values(rows)
             await executor.execute(expr)
 
+    @staticmethod
+    def _mark_bulk_saved(objects: Sequence["T"]) -> None:
+        """
+        Marks models written by a bulk operation as saved.
+
+        :param objects: saved models
+        :type objects: Sequence[Model]
+        """
         for obj in objects:
             obj.set_save_status(True)
+            obj.__setattr_fields__.clear()
+
+    @staticmethod
+    def _get_concurrent_batch_size(
+        objects: Sequence["T"], batch_size: Optional[int], concurrency: int
+    ) -> int:
+        """
+        Validates concurrency and returns the size of chunks for concurrent bulk
+        operations. If batch_size is not set objects are split evenly.
+
+        :raises QueryDefinitionError: if concurrency is lower than 1
+        :param objects: models to write
+        :type objects: Sequence[Model]
+        :param batch_size: requested size of chunk
+        :type batch_size: Optional[int]
+        :param concurrency: maximum number of concurrent chunks
+        :type concurrency: int
+        :return: size of the chunks
+        :rtype: int
+        """
+        if concurrency < 1:
+            raise QueryDefinitionError("Concurrency has to be greater than 0.")
+        if batch_size is not None:
+            return batch_size
+        return -(-len(objects) // concurrency)
+
+    async def _run_bulk_chunks_concurrently(
+        self,
+        chunks: list[Sequence["T"]],
+        prepare: Callable[[Sequence["T"]], Awaitable[list[dict]]],
+        execute: Callable[["QueryExecutor", list[dict]], Awaitable[None]],
+        concurrency: int,
+        transactional: bool = False,
+    ) -> list[tuple[int, Exception]]:
+        """
+        Writes chunks of models concurrently, each on a separate connection from
+        the pool, outside of any transaction of the current context.
+
+        Next chunk is prepared while previous ones are being written, at most
+        `concurrency` chunks are written at the same time.
+        Models in successfully written chunks are marked as saved.
+
+        :param chunks: chunks of models to write
+        :type chunks: list[Sequence[Model]]
+        :param prepare: coroutine function preparing rows from models
+        :type prepare: Callable
+        :param execute: coroutine function writing prepared rows
+        :type execute: Callable
+        :param concurrency: maximum number of chunks written at the same time
+        :type concurrency: int
+        :param transactional: if each chunk should be written in own transaction
+        :type transactional: bool
+        :return: list of (chunk index, exception) tuples of failed chunks
+        :rtype: list[tuple[int, Exception]]
+        """
+        database = self.model_config.database
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def write(rows: list[dict]) -> None:
+            try:
+                async with database.get_query_executor(
+                    transactional=transactional, detached=True
+                ) as executor:
+                    await execute(executor, rows)
+            finally:
+                semaphore.release()
+
+        tasks: list[asyncio.Future] = []
+        try:
+            for chunk in chunks:
+                rows = await prepare(chunk)
+                await semaphore.acquire()
+                tasks.append(asyncio.ensure_future(write(rows)))
+        finally:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        errors: list[tuple[int, Exception]] = []
+        for index, (chunk, result) in enumerate(zip(chunks, results)):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):  # pragma: no cover
+                    raise result
+                errors.append((index, result))
+            else:
+                self._mark_bulk_saved(chunk)
+        return errors
+
+    @staticmethod
+    def _raise_bulk_chunk_errors(errors: list[tuple[int, Exception]]) -> None:
+        """
+        Raises BulkOperationError if any of the concurrent chunks failed.
+
+        :raises BulkOperationError: if errors are not empty
+        :param errors: list of (chunk index, exception) tuples
+        :type errors: list[tuple[int, Exception]]
+        """
+        if errors:
+            raise BulkOperationError(
+                f"{len(errors)} chunk(s) of bulk operation failed: "
+                f"{', '.join(repr(error) for _, error in errors)}",
+                errors=errors,
+            )
 
     async def bulk_update(  # noqa:  CCR001
-        self, objects: list["T"], columns: Optional[list[str]] = None
+        self,
+        objects: list["T"],
+        columns: Optional[list[str]] = None,
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
     ) -> None:
         """
         Performs bulk update in one database session to speed up the process.
@@ -1263,17 +2460,34 @@ class QuerySet(Generic[T]):
         You can also select which fields to update by passing `columns` list
         as a list of string names.
 
-        Bulk operations do not send signals.
+        If `batch_size` is passed objects are updated in chunks of at most
+        `batch_size` rows, all in one transaction.
 
+        If `concurrency` is passed chunks are updated concurrently on up to
+        `concurrency` separate connections from the pool, each chunk in its own
+        transaction, outside of any enclosing transaction (so the operation is not
+        atomic). Errors of failed chunks are collected and raised together as
+        `BulkOperationError` once all chunks finished, `post_bulk_update` is
+        sent for successfully updated models only.
+
+        Bulk operations do not send per instance signals, instead one
+        post_bulk_update signal is sent with all updated instances.
+
+        :raises BulkOperationError: if some of the concurrent chunks failed
         :param objects: list of ormar models
         :type objects: list[Model]
         :param columns: list of columns to update
         :type columns: list[str]
+        :param batch_size: maximum number of rows updated in one batch
+        :type batch_size: Optional[int]
+        :param concurrency: maximum number of chunks updated at the same time
+        :type concurrency: Optional[int]
         """
         if not objects:
             raise ModelListEmptyError("Bulk update objects are empty!")
+        # allow any collection of models (i.e. dict values)
+        objects = list(objects)
 
-        ready_objects = []
         pk_name = self.model_config.pkname
         if not columns:
             columns = list(
@@ -1292,6 +2506,76 @@ class QuerySet(Generic[T]):
 
         columns = [self.model.get_column_alias(k) for k in columns]
 
+        async def prepare(chunk: Sequence["T"]) -> list[dict]:
+            return await self._prepare_bulk_update_rows(
+                objects=chunk, columns=cast(list[str], columns)
+            )
+
+        expr = self._bulk_update_expression(columns=columns)
+
+        async def execute(executor: "QueryExecutor", rows: list[dict]) -> None:
+            await executor.execute_many(expr, rows, table=self.table)
+
+        errors: list[tuple[int, Exception]] = []
+        if concurrency is not None:
+            batch_size = self._get_concurrent_batch_size(
+                objects=objects, batch_size=batch_size, concurrency=concurrency
+            )
+            chunks = list(chunked(objects, batch_size))
+            errors = await self._run_bulk_chunks_concurrently(
+                chunks=chunks,
+                prepare=prepare,
+                execute=execute,
+                concurrency=concurrency,
+                transactional=True,
+            )
+            failed = {index for index, _ in errors}
+            updated = [
+                obj
+                for index, chunk in enumerate(chunks)
+                if index not in failed
+                for obj in chunk
+            ]
+        else:
+            batch_size = batch_size if batch_size is not None else len(objects)
+            # Multi-row execute_many: run in an explicit transaction so all rows
+            # share a single COMMIT instead of one per row under AUTOCOMMIT.
+            async with self.model_config.database.get_query_executor(
+                transactional=True
+            ) as executor:
+                for chunk in chunked(objects, batch_size):
+                    await execute(executor, await prepare(chunk))
+            self._mark_bulk_saved(objects)
+            updated = objects
+
+        self._result_cache = None
+        if updated:
+            await cast(
+                type["Model"], self.model_cls
+            ).ormar_config.signals.post_bulk_update.send(
+                sender=self.model_cls,  # type: ignore
+                instances=updated,
+            )
+        self._raise_bulk_chunk_errors(errors)
+
+    async def _prepare_bulk_update_rows(
+        self, objects: Sequence["T"], columns: list[str]
+    ) -> list[dict]:
+        """
+        Populates onupdate values and prepares given models to be updated with
+        bulk update statement. Yields control to the event loop every 100 models.
+
+        :raises ModelPersistenceError: if any of the models has no pk set
+        :param objects: models to update
+        :type objects: Sequence[Model]
+        :param columns: aliases of columns to update
+        :type columns: list[str]
+        :return: list of rows with bind parameters names as keys
+        :rtype: list[dict]
+        """
+        pk_name = self.model_config.pkname
+        onupdate_fields = self.model._onupdate_fields
+        ready_objects = []
         for i, obj in enumerate(objects):
             explicit_fields = obj.__setattr_fields__
             new_kwargs = obj.model_dump()
@@ -1315,7 +2599,19 @@ class QuerySet(Generic[T]):
             )
             if i % 100 == 99:  # pragma: no cover
                 await asyncio.sleep(0)
+        return ready_objects
 
+    def _bulk_update_expression(self, columns: list[str]) -> str:
+        """
+        Builds the update statement used in bulk update, with bind parameters
+        prefixed with `new_`.
+
+        :param columns: aliases of columns to update
+        :type columns: list[str]
+        :return: compiled update statement
+        :rtype: str
+        """
+        pk_name = self.model_config.pkname
         pk_column: sqlalchemy.Column = self.model_config.table.c[
             self.model.get_column_alias(pk_name)
         ]
@@ -1333,24 +2629,91 @@ class QuerySet(Generic[T]):
         )
         # databases bind params only where query is passed as string
         # otherwise it just passes all data to values and results in unconsumed columns
-        expr = str(expr)  # type: ignore
-        # Multi-row execute_many: run in an explicit transaction so all rows
-        # share a single COMMIT instead of one per row under AUTOCOMMIT.
+        return str(expr)
+
+    async def bulk_delete(
+        self, objects: Sequence[Union["T", Any]], batch_size: int = 500
+    ) -> int:
+        """
+        Performs bulk delete of models or primary key values in one database session
+        to speed up the process.
+
+        Rows are deleted with `DELETE ... WHERE pk IN (...)` statements, each with at
+        most `batch_size` primary keys.
+
+        Deleted instances have their save status set to False and are removed from
+        reverse relations of their related parent models. Already loaded reverse and
+        many to many children of deleted instances are not detached from them.
+
+        Bulk operations do not send per instance signals, instead one
+        post_bulk_delete signal is sent with all deleted instances and pks.
+
+        :raises ModelPersistenceError: if one of the models has no pk set
+        :param objects: list of ormar models or their primary key values
+        :type objects: Sequence[Union[Model, Any]]
+        :param batch_size: maximum number of primary keys in one statement
+        :type batch_size: int
+        :return: number of deleted rows
+        :rtype: int
+        """
+        if not objects:
+            raise ModelListEmptyError("Bulk delete objects are empty!")
+
+        pk_name = self.model_config.pkname
+        instances: list["T"] = []
+        pks: list[Any] = []
+        for obj in objects:
+            if isinstance(obj, ormar.Model):
+                if obj.pk is None:
+                    raise ModelPersistenceError(
+                        "You cannot delete unsaved objects. "
+                        f"{self.model.__name__} has to have {pk_name} filled."
+                    )
+                instances.append(cast("T", obj))
+                pks.append(obj.pk)
+            else:
+                pks.append(obj)
+
+        pk_column = self.table.c[self.model.get_column_alias(pk_name)]
+        deleted = 0
+        # Multiple chunks: run in an explicit transaction so the delete is atomic
         async with self.model_config.database.get_query_executor(
             transactional=True
         ) as executor:
-            await executor.execute_many(expr, ready_objects)
+            for chunk in chunked(pks, batch_size):
+                expr = self.table.delete().where(pk_column.in_(chunk))
+                deleted += await executor.execute(expr)
 
-        for obj in objects:
-            obj.set_save_status(True)
+        self._result_cache = None
+        for obj in instances:
+            obj.set_save_status(False)
             obj.__setattr_fields__.clear()
-
-        await cast(
-            type["Model"], self.model_cls
-        ).ormar_config.signals.post_bulk_update.send(
-            sender=self.model_cls,  # type: ignore
-            instances=objects,
+            self._remove_from_related_parents(obj)
+        identity_map = get_identity_map()
+        if identity_map is not None:
+            for pk in pks:
+                identity_map.discard(self.model, pk)
+
+        await self.model_config.signals.post_bulk_delete.send(
+            sender=self.model, instances=instances, pks=pks
         )
+        return deleted
+
+    @staticmethod
+    def _remove_from_related_parents(instance: "T") -> None:
+        """
+        Removes deleted instance from reverse relations of its related models.
+        The instance itself keeps its relation fields populated.
+
+        :param instance: deleted model
+        :type instance: Model
+        """
+        for field in instance.extract_related_fields():
+            if field.virtual or field.is_multi:
+                continue
+            parent = instance._orm.get(field.name)
+            if parent is not None:
+                parent._orm.remove(field.get_related_name(), instance)  # type: ignore
 
     def __getitem__(self, key: Union[int, slice]) -> "QuerySet[T]":
         """
@@ -1369,6 +2732,9 @@ class QuerySet(Generic[T]):
         with it — subsequent slicing on an already-sliced queryset is not
         guaranteed to compose in a Python-list-like way.
 
+        If the queryset without pagination was already evaluated, the returned
+        ``QuerySet`` is evaluated with the slice of evaluated results.
+
         :param key: integer index or slice
         :type key: int | slice
         :raises QueryDefinitionError: when ``key`` is not an ``int``/``slice``
@@ -1382,9 +2748,45 @@ class QuerySet(Generic[T]):
             if not order_bys:
                 order_bys = OrderAction.from_model_defaults(self.model)
             order_bys = [ob.flipped() for ob in order_bys]
-        return self.rebuild_self(
+        queryset = self.rebuild_self(
             limit_count=bounds.limit,
             offset=bounds.offset,
             order_bys=order_bys,
             reverse_result=bounds.reverse,
         )
+        if (
+            self._result_cache is not None
+            and self.limit_count is None
+            and self.query_offset is None
+        ):
+            if isinstance(key, slice):
+                queryset._result_cache = self._result_cache[key]
+            else:
+                queryset._result_cache = self._result_cache[key : key + 1 or None]
+        return queryset
+
+    def __await__(self) -> Generator[Any, None, list["T"]]:
+        """
+        Evaluates the queryset, so ``await queryset`` equals ``queryset.all()``.
+
+        Results are kept on the queryset, so awaiting it again, ``all()``,
+        ``count()``, ``exists()`` and slicing are answered without a query.
+        Writes made through the same queryset (i.e. ``create()``, ``bulk_*()``,
+        ``update()`` or ``delete()``) discard kept results, writes made elsewhere
+        do not. Querysets returned by other methods are not evaluated.
+
+        :return: list of returned models
+        :rtype: list[Model]
+        """
+        return self._evaluate().__await__()
+
+    async def _evaluate(self) -> list["T"]:
+        """
+        Loads and keeps results of the queryset if it was not evaluated yet.
+
+        :return: list of returned models
+        :rtype: list[Model]
+        """
+        if self._result_cache is None:
+            self._result_cache = await self.all()
+        return list(self._result_cache)
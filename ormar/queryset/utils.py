@@ -1,13 +1,18 @@
 import collections.abc
 import copy
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Sequence, TypeVar, Union
+
+import sqlalchemy
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 
 from ormar.exceptions import QueryDefinitionError
 
 if TYPE_CHECKING:  # pragma no cover
     from ormar import BaseField, Model
 
+ChunkItem = TypeVar("ChunkItem")
+
 
 @dataclass(frozen=True)
 class SliceBounds:
@@ -246,6 +251,108 @@ def _reverse_range(start: int, stop: int) -> SliceBounds:
     return SliceBounds(limit=stop - start, offset=-stop, reverse=True)
 
 
+def chunked(
+    items: Sequence[ChunkItem], chunk_size: int
+) -> Iterator[Sequence[ChunkItem]]:
+    """
+    Splits a sequence into consecutive chunks of at most ``chunk_size`` items.
+
+    Used by bulk operations to keep the number of bound parameters per
+    statement below the database limits.
+
+    :raises QueryDefinitionError: if ``chunk_size`` is lower than 1
+    :param items: sequence to split
+    :type items: Sequence
+    :param chunk_size: maximum number of items in one chunk
+    :type chunk_size: int
+    :return: iterator of chunks
+    :rtype: Iterator[Sequence]
+    """
+    if chunk_size < 1:
+        raise QueryDefinitionError("Batch size has to be greater than 0.")
+    for start in range(0, len(items), chunk_size):
+        yield items[start : start + chunk_size]
+
+
+def get_conflict_insert(table: sqlalchemy.Table, dialect: Any) -> Optional[Any]:
+    """
+    Returns dialect specific insert statement supporting ``ON CONFLICT`` clauses
+    together with ``RETURNING``, or None if the dialect does not support them.
+
+    :param table: table to insert into
+    :type table: sqlalchemy.Table
+    :param dialect: dialect of the database connection
+    :type dialect: sqlalchemy.engine.Dialect
+    :return: dialect specific insert statement or None
+    :rtype: Optional[Insert]
+    """
+    if not getattr(dialect, "insert_returning", False):
+        return None  # pragma: no cover
+    if dialect.name == "postgresql":
+        return postgresql.insert(table)  # pragma: no cover
+    if dialect.name == "sqlite":
+        return sqlite.insert(table)
+    return None  # pragma: no cover
+
+
+def get_upsert(
+    table: sqlalchemy.Table,
+    dialect: Any,
+    values: dict[str, Any],
+    update_values: dict[str, Any],
+    index_elements: list[str],
+) -> Optional[Any]:
+    """
+    Returns native upsert statement for given dialect - insert with
+    ``ON CONFLICT DO UPDATE`` on PostgreSQL and SQLite, and with
+    ``ON DUPLICATE KEY UPDATE`` on MySQL. Returns None for other dialects.
+
+    :param table: table to insert into
+    :type table: sqlalchemy.Table
+    :param dialect: dialect of the database connection
+    :type dialect: sqlalchemy.engine.Dialect
+    :param values: column names and values to insert
+    :type values: dict[str, Any]
+    :param update_values: column names and values to set if row exists
+    :type update_values: dict[str, Any]
+    :param index_elements: names of columns of the conflicting constraint
+    :type index_elements: list[str]
+    :return: upsert statement or None
+    :rtype: Optional[Insert]
+    """
+    if dialect.name == "mysql":  # pragma: no cover
+        return (
+            mysql.insert(table).values(**values).on_duplicate_key_update(update_values)
+        )
+    insert = get_conflict_insert(table, dialect)
+    if insert is None:
+        return None  # pragma: no cover
+    return insert.values(**values).on_conflict_do_update(
+        index_elements=index_elements, set_=update_values
+    )
+
+
+def supports_window_functions(dialect: Any) -> bool:
+    """
+    Checks if the database supports window functions (i.e. ``COUNT(*) OVER()``),
+    available in PostgreSQL, SQLite 3.25+, MySQL 8.0+ and MariaDB 10.2+.
+
+    :param dialect: dialect of the database connection
+    :type dialect: sqlalchemy.engine.Dialect
+    :return: result of the check
+    :rtype: bool
+    """
+    if dialect.name == "postgresql":
+        return True  # pragma: no cover
+    if dialect.name == "sqlite":
+        return dialect.dbapi.sqlite_version_info >= (3, 25)
+    if dialect.name == "mysql":  # pragma: no cover
+        version = dialect.server_version_info
+        minimal = (10, 2) if getattr(dialect, "is_mariadb", False) else (8, 0)
+        return version is not None and tuple(version[:2]) >= minimal
+    return False  # pragma: no cover
+
+
 def check_node_not_dict_or_not_last_node(
     part: str, is_last: bool, current_level: Any
 ) -> bool:
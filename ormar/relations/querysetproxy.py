@@ -14,11 +14,12 @@ from typing import (  # noqa: I100, I201
 
 import ormar  # noqa: I100, I202
 from ormar.exceptions import ModelPersistenceError, NoMatch, QueryDefinitionError
+from ormar.models.unit_of_work import get_unit_of_work
 
 if TYPE_CHECKING:  # pragma no cover
     from ormar import OrderAction, RelationType
     from ormar.models import Model, T
-    from ormar.queryset import QuerySet
+    from ormar.queryset import Aggregate, QuerySet
     from ormar.relations import Relation
 else:
     T = TypeVar("T", bound="Model")
@@ -114,12 +115,17 @@ class QuerysetProxy(Generic[T]):
     async def create_through_instance(self, child: "T", **kwargs: Any) -> None:
         """
         Crete a through model instance in the database for m2m relations.
+        Inside `ormar.unit_of_work()` scope it's only registered for flush.
 
         :param kwargs: dict of additional keyword arguments for through instance
         :type kwargs: Any
         :param child: child model instance
         :type child: Model
         """
+        unit_of_work = get_unit_of_work(self._owner.ormar_config.database)
+        if unit_of_work is not None:
+            unit_of_work.register_link(self, child, **kwargs)
+            return
         model_cls = self.relation.through
         owner_column = self.related_field.default_target_field_name()  # type: ignore
         child_column = self.related_field.default_source_field_name()  # type: ignore
@@ -167,10 +173,15 @@ class QuerysetProxy(Generic[T]):
     async def delete_through_instance(self, child: "T") -> None:
         """
         Removes through model instance from the database for m2m relations.
+        Inside `ormar.unit_of_work()` scope it's only registered for flush.
 
         :param child: child model instance
         :type child: Model
         """
+        unit_of_work = get_unit_of_work(self._owner.ormar_config.database)
+        if unit_of_work is not None:
+            unit_of_work.register_unlink(self, child)
+            return
         queryset = ormar.QuerySet(model_cls=self.relation.through)  # type: ignore
         owner_column = self.related_field.default_target_field_name()  # type: ignore
         child_column = self.related_field.default_source_field_name()  # type: ignore
@@ -178,6 +189,85 @@ class QuerysetProxy(Generic[T]):
         link_instance = await queryset.filter(**kwargs).get()  # type: ignore
         await link_instance.delete()
 
+    async def create_through_instances(
+        self, children: Sequence["T"], **kwargs: Any
+    ) -> None:
+        """
+        Crete through model instances for many children at once in m2m relations,
+        with one bulk insert.
+        Inside `ormar.unit_of_work()` scope they are only registered for flush.
+
+        :raises ModelPersistenceError: if any of the children is not saved
+        :param children: child model instances
+        :type children: Sequence[Model]
+        :param kwargs: dict of additional keyword arguments for through instances
+        :type kwargs: Any
+        """
+        unit_of_work = get_unit_of_work(self._owner.ormar_config.database)
+        if unit_of_work is not None:
+            for child in children:
+                unit_of_work.register_link(self, child, **kwargs)
+            return
+        model_cls = self.relation.through
+        owner_column = self.related_field.default_target_field_name()  # type: ignore
+        child_column = self.related_field.default_source_field_name()  # type: ignore
+        for child in children:
+            if child.pk is None:
+                raise ModelPersistenceError(
+                    f"You cannot save {child.get_name()} "
+                    f"model without primary key set! \n"
+                    f"Save the child model first."
+                )
+        if not children:
+            return
+        await model_cls.objects.bulk_create(
+            [
+                model_cls(
+                    **{owner_column: self._owner.pk, child_column: child.pk, **kwargs}
+                )
+                for child in children
+            ]
+        )
+
+    async def delete_through_instances(self, children_pks: Sequence[Any]) -> int:
+        """
+        Removes through model instances of many children at once in m2m relations,
+        with one `DELETE ... WHERE child IN (...)` query.
+        Inside `ormar.unit_of_work()` scope they are only registered for flush
+        and 0 is returned.
+
+        :param children_pks: primary keys of the child models to unlink
+        :type children_pks: Sequence[Any]
+        :return: number of deleted through instances
+        :rtype: int
+        """
+        if not children_pks:
+            return 0
+        unit_of_work = get_unit_of_work(self._owner.ormar_config.database)
+        if unit_of_work is not None:
+            unit_of_work.register_unlinks(self, children_pks)
+            return 0
+        queryset = ormar.QuerySet(model_cls=self.relation.through)  # type: ignore
+        owner_column = self.related_field.default_target_field_name()  # type: ignore
+        child_column = self.related_field.default_source_field_name()  # type: ignore
+        kwargs = {owner_column: self._owner.pk, f"{child_column}__in": children_pks}
+        return await queryset.filter(**kwargs).delete()  # type: ignore
+
+    async def get_through_children_pks(self) -> list[Any]:
+        """
+        Loads primary keys of all children linked with the parent in m2m relation,
+        reading only the through model table.
+
+        :return: primary keys of related models
+        :rtype: list[Any]
+        """
+        queryset = ormar.QuerySet(model_cls=self.relation.through)  # type: ignore
+        owner_column = self.related_field.default_target_field_name()  # type: ignore
+        child_column = self.related_field.default_source_field_name()  # type: ignore
+        return await queryset.filter(  # type: ignore
+            **{owner_column: self._owner.pk}
+        ).values_list(fields=child_column, flatten=True)
+
     async def exists(self) -> bool:
         """
         Returns a bool value to confirm if there are rows matching the given criteria
@@ -209,6 +299,20 @@ class QuerysetProxy(Generic[T]):
         """
         return await self.queryset.count(distinct=distinct)
 
+    async def estimated_count(self, timeout: Optional[float] = None) -> Optional[int]:
+        """
+        Returns approximate number of rows matching the given criteria,
+        falls back to exact count capped by the timeout.
+
+        Actual call delegated to QuerySet.
+
+        :param timeout: max number of seconds to wait for exact count
+        :type timeout: Optional[float]
+        :return: estimated number of rows or None if exact count timed out
+        :rtype: Optional[int]
+        """
+        return await self.queryset.estimated_count(timeout=timeout)
+
     async def max(self, columns: Union[str, list[str]]) -> Any:  # noqa: A003
         """
         Returns max value of columns for rows matching the given criteria
@@ -494,6 +598,31 @@ class QuerysetProxy(Generic[T]):
         self._register_related(all_items)
         return all_items
 
+    async def paginate_with_total(
+        self, page: int, page_size: int = 20
+    ) -> tuple[list["T"], int]:
+        """
+        Returns related models from given page together with number of all
+        related models matching the given criteria.
+
+        Actual call delegated to QuerySet.
+
+        List of related models is cleared before the call.
+
+        :param page: page number
+        :type page: int
+        :param page_size: numbers of items per page
+        :type page_size: int
+        :return: models from the page and total number of models
+        :rtype: tuple[list[Model], int]
+        """
+        items, total = await self.queryset.paginate_with_total(
+            page=page, page_size=page_size
+        )
+        self._clean_items_on_load()
+        self._register_related(items)
+        return items, total
+
     async def iterate(  # noqa: A003
         self,
         *args: Any,
@@ -795,6 +924,60 @@ class QuerysetProxy(Generic[T]):
             relation=self.relation, type_=self.type_, to=self.to, qryset=queryset
         )
 
+    def group_by(self, *fields: str) -> "QuerysetProxy[T]":
+        """
+        Groups rows by given fields, so `annotate()` computes aggregates
+        for each group of rows with the same values of the fields.
+
+        Actual call delegated to QuerySet.
+
+        :param fields: names of the fields to group by
+        :type fields: str
+        :return: QuerysetProxy
+        :rtype: QuerysetProxy
+        """
+        queryset = self.queryset.group_by(*fields)
+        return self.__class__(
+            relation=self.relation, type_=self.type_, to=self.to, qryset=queryset
+        )
+
+    def annotate(
+        self, having: Optional[dict[str, Any]] = None, **aggregates: "Aggregate"
+    ) -> "QuerysetProxy[T]":
+        """
+        Adds aggregates computed by the database for each group of rows
+        created with `group_by()`, returned under given names by `values()`.
+
+        Actual call delegated to QuerySet.
+
+        :param having: filters of groups by annotations
+        :type having: Optional[dict[str, Any]]
+        :param aggregates: aggregates by names of the annotations
+        :type aggregates: Aggregate
+        :return: QuerysetProxy
+        :rtype: QuerysetProxy
+        """
+        queryset = self.queryset.annotate(having=having, **aggregates)
+        return self.__class__(
+            relation=self.relation, type_=self.type_, to=self.to, qryset=queryset
+        )
+
+    def cache(self, ttl: Optional[float] = None) -> "QuerysetProxy[T]":
+        """
+        Caches rows returned by the query in the query cache of the database.
+
+        Actual call delegated to QuerySet.
+
+        :param ttl: number of seconds after which cached rows expire
+        :type ttl: Optional[float]
+        :return: QuerysetProxy
+        :rtype: QuerysetProxy
+        """
+        queryset = self.queryset.cache(ttl=ttl)
+        return self.__class__(
+            relation=self.relation, type_=self.type_, to=self.to, qryset=queryset
+        )
+
     def offset(self, offset: int) -> "QuerysetProxy[T]":
         """
         You can also offset the results by desired number of main models.
@@ -1,9 +1,14 @@
-from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, Optional, Sequence, TypeVar, cast
 
 from typing_extensions import SupportsIndex
 
 import ormar
-from ormar.exceptions import NoMatch, RelationshipInstanceError
+from ormar.exceptions import (
+    ModelPersistenceError,
+    NoMatch,
+    RelationshipInstanceError,
+)
+from ormar.models.unit_of_work import is_pending_save
 from ormar.relations.querysetproxy import QuerysetProxy
 
 if TYPE_CHECKING:  # pragma no cover
@@ -215,17 +220,41 @@ class RelationProxy(Generic[T], list[T]):
             and self.queryset_proxy.queryset is not None
         )
 
-    def _check_if_model_saved(self) -> None:
+    def _check_if_model_saved(self, allow_pending: bool = False) -> None:
         """
         Verifies if the parent model of the relation has been already saved.
         Otherwise QuerySetProxy cannot filter by parent primary key.
+
+        :param allow_pending: flag if parent waiting for insert in active
+        unit of work is allowed
+        :type allow_pending: bool
         """
+        if allow_pending and is_pending_save(self._owner):
+            return
         pk_value = self._owner.pk
         if not pk_value:
             raise RelationshipInstanceError(
                 "You cannot query relationships from unsaved model."
             )
 
+    @staticmethod
+    def _check_if_children_saved(items: Sequence["T"]) -> None:
+        """
+        Verifies if all children have primary key set (or wait for insert in
+        active unit of work), so through instances can be created for them.
+
+        :raises ModelPersistenceError: if any of the children is not saved
+        :param items: children to check
+        :type items: Sequence[Model]
+        """
+        for item in items:
+            if item.pk is None and not is_pending_save(item):
+                raise ModelPersistenceError(
+                    f"You cannot save {item.get_name()} "
+                    f"model without primary key set! \n"
+                    f"Save the child model first."
+                )
+
     def _set_queryset(self) -> "QuerySet[T]":
         """
         Creates new QuerySet with relation model and pre filters it with currents
@@ -248,6 +277,77 @@ class RelationProxy(Generic[T], list[T]):
         )
         return queryset
 
+    def _unregister_child(self, item: "T") -> None:
+        """
+        Removes the child from the relation on both sides, without any
+        database queries.
+
+        :param item: child to remove from relation
+        :type item: Model
+        """
+        index_to_remove = self._relation_cache[item.__hash__()]
+        self.pop(index_to_remove)
+
+        relation = item._orm._get(self.related_field_name)
+        if relation:
+            relation.remove(self._owner)
+        self.relation.remove(item)
+
+    def _verify_many_to_many(self, method_name: str) -> None:
+        """
+        Verifies that the relation is a many to many relation, as bulk
+        operations write only through model instances.
+
+        :raises RelationshipInstanceError: if relation is not many to many
+        :param method_name: name of the called method
+        :type method_name: str
+        """
+        if self.type_ != ormar.RelationType.MULTIPLE:
+            raise RelationshipInstanceError(
+                f"{method_name}() is available only for ManyToMany relations, "
+                f"{self._owner.get_name()}.{self.field_name} is not one."
+            )
+
+    @staticmethod
+    def _unique_by_pk(items: Sequence["T"]) -> list["T"]:
+        """
+        Removes duplicated models (with the same primary key) keeping the
+        order of the first occurrence.
+
+        :param items: models to deduplicate
+        :type items: Sequence[Model]
+        :return: list of unique models
+        :rtype: list[Model]
+        """
+        unique: dict[Any, "T"] = {}
+        for item in items:
+            key = item.pk if item.pk is not None else id(item)
+            unique.setdefault(key, item)
+        return list(unique.values())
+
+    async def _send_relation_signals(
+        self, signal_name: str, items: Sequence["T"], **kwargs: Any
+    ) -> None:
+        """
+        Sends given relation signal for each of the children.
+
+        :param signal_name: name of the signal to send
+        :type signal_name: str
+        :param items: children added or removed from relation
+        :type items: Sequence[Model]
+        :param kwargs: additional signal keyword arguments
+        :type kwargs: Any
+        """
+        signal = getattr(self._owner.signals, signal_name)
+        for item in items:
+            await signal.send(
+                sender=self._owner.__class__,
+                instance=self._owner,
+                child=item,
+                relation_name=self.field_name,
+                **kwargs,
+            )
+
     async def remove(  # type: ignore
         self, item: "T", keep_reversed: bool = True
     ) -> None:
@@ -277,18 +377,8 @@ class RelationProxy(Generic[T], list[T]):
             relation_name=self.field_name,
         )
 
-        index_to_remove = self._relation_cache[item.__hash__()]
-        self.pop(index_to_remove)
-
+        self._unregister_child(item)
         relation_name = self.related_field_name
-        relation = item._orm._get(relation_name)
-        # if relation is None:  # pragma nocover
-        #     raise ValueError(
-        #         f"{self._owner.get_name()} does not have relation {relation_name}"
-        #     )
-        if relation:
-            relation.remove(self._owner)
-        self.relation.remove(item)
         if self.type_ == ormar.RelationType.MULTIPLE:
             await self.queryset_proxy.delete_through_instance(item)
         else:
@@ -324,7 +414,7 @@ class RelationProxy(Generic[T], list[T]):
             relation_name=self.field_name,
             passed_kwargs=kwargs,
         )
-        self._check_if_model_saved()
+        self._check_if_model_saved(allow_pending=True)
         if self.type_ == ormar.RelationType.MULTIPLE:
             await self.queryset_proxy.create_through_instance(item, **kwargs)
             setattr(self._owner, self.field_name, item)
@@ -339,3 +429,96 @@ class RelationProxy(Generic[T], list[T]):
             relation_name=self.field_name,
             passed_kwargs=kwargs,
         )
+
+    async def add_many(self, items: Sequence["T"], **kwargs: Any) -> None:
+        """
+        Adds many child models to ManyToMany relation at once.
+
+        Through instances for all children are created with one bulk insert,
+        children already registered in the relation are skipped.
+
+        Sends pre_relation_add and post_relation_add signals for each child,
+        through model save signals are not sent.
+
+        :raises RelationshipInstanceError: if relation is not many to many
+        :raises ModelPersistenceError: if any of the children is not saved
+        :param items: children to add to relation
+        :type items: Sequence[Model]
+        :param kwargs: dict of additional keyword arguments for through instances
+        :type kwargs: Any
+        """
+        self._verify_many_to_many("add_many")
+        self._check_if_model_saved(allow_pending=True)
+        to_add = [item for item in self._unique_by_pk(items) if item not in self]
+        self._check_if_children_saved(to_add)
+        await self._send_relation_signals(
+            "pre_relation_add", to_add, passed_kwargs=kwargs
+        )
+        await self.queryset_proxy.create_through_instances(to_add, **kwargs)
+        setattr(self._owner, self.field_name, to_add)
+        await self._send_relation_signals(
+            "post_relation_add", to_add, passed_kwargs=kwargs
+        )
+
+    async def set(self, items: Sequence["T"], **kwargs: Any) -> None:  # noqa: A003
+        """
+        Replaces all children of ManyToMany relation with given ones.
+
+        Currently linked children are loaded once from the through model table,
+        and only the difference is written - missing children are added with
+        one bulk insert, not passed ones are unlinked with one
+        `DELETE ... IN` query, both in one transaction.
+
+        Sends relation add and remove signals for each added and removed child.
+        Removed children that were not loaded are passed to signals as
+        models with only primary key set.
+
+        :raises RelationshipInstanceError: if relation is not many to many
+        :raises ModelPersistenceError: if any of the children is not saved
+        :param items: children that should be related after the call
+        :type items: Sequence[Model]
+        :param kwargs: dict of additional keyword arguments for new through instances
+        :type kwargs: Any
+        """
+        self._verify_many_to_many("set")
+        self._check_if_model_saved(allow_pending=True)
+        items = self._unique_by_pk(items)
+        self._check_if_children_saved(items)
+        # owner waiting for insert in unit of work has no links yet
+        current_pks = (
+            set(await self.queryset_proxy.get_through_children_pks())
+            if self._owner.pk is not None
+            else set()
+        )
+        new_pks = {item.pk for item in items}
+        to_add = [item for item in items if item.pk not in current_pks]
+        loaded = {item.pk: item for item in self}
+        pkname = self.relation.to.ormar_config.pkname
+        to_remove = [
+            loaded.get(pk)
+            or cast(
+                "T",
+                self.relation.to._internal_construct(_pk_only=True, **{pkname: pk}),
+            )
+            for pk in current_pks
+            if pk not in new_pks
+        ]
+
+        await self._send_relation_signals("pre_relation_remove", to_remove)
+        await self._send_relation_signals(
+            "pre_relation_add", to_add, passed_kwargs=kwargs
+        )
+        async with self._owner.ormar_config.database.transaction():
+            await self.queryset_proxy.delete_through_instances(
+                [item.pk for item in to_remove]
+            )
+            await self.queryset_proxy.create_through_instances(to_add, **kwargs)
+
+        for item in to_remove:
+            if item in self:
+                self._unregister_child(item)
+        setattr(self._owner, self.field_name, [x for x in to_add if x not in self])
+        await self._send_relation_signals("post_relation_remove", to_remove)
+        await self._send_relation_signals(
+            "post_relation_add", to_add, passed_kwargs=kwargs
+        )
@@ -81,6 +81,29 @@ class Signal:
         )
         return True if receiver_func is not None else False
 
+    @property
+    def has_receivers(self) -> bool:
+        """
+        Checks if any receiver function is connected to the signal.
+
+        :return: result of the check
+        :rtype: bool
+        """
+        return bool(self._receivers)
+
+    def has_receivers_other_than(self, *receivers: Callable) -> bool:
+        """
+        Checks if any receiver function other than given ones is connected
+        to the signal.
+
+        :param receivers: receiver functions to ignore
+        :type receivers: Callable
+        :return: result of the check
+        :rtype: bool
+        """
+        ignored = {make_id(receiver) for receiver in receivers}
+        return any(key not in ignored for key in self._receivers)
+
     async def send(self, sender: type["Model"], **kwargs: Any) -> None:
         """
         Notifies all receiver functions with given kwargs
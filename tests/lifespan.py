@@ -1,10 +1,10 @@
 from contextlib import asynccontextmanager
-from typing import AsyncIterator
+from typing import Any, AsyncIterator, List
 
 import pytest_asyncio
 import sqlalchemy
 from fastapi import FastAPI
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import create_async_engine
 
 from ormar import OrmarConfig
@@ -69,3 +69,63 @@ def init_tests(config, scope="module"):
         await config.engine.dispose()
 
     return create_database
+
+
+class StatementCounter:
+    """Records every statement executed on the sqlalchemy engine of the config."""
+
+    def __init__(self, config: OrmarConfig) -> None:
+        self.config = config
+        self.statements: List[str] = []
+
+    def __enter__(self) -> "StatementCounter":
+        sync_engine = self.config.database.engine.sync_engine
+
+        def before_cursor_execute(
+            conn: Any,
+            cursor: Any,
+            statement: str,
+            parameters: Any,
+            context: Any,
+            executemany: bool,
+        ) -> None:
+            self.statements.append(statement)
+
+        self._listener = before_cursor_execute
+        self._sync_engine = sync_engine
+        event.listen(sync_engine, "before_cursor_execute", self._listener)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        event.remove(self._sync_engine, "before_cursor_execute", self._listener)
+
+    def _starting_with(self, *keywords: str) -> List[str]:
+        return [
+            statement
+            for statement in self.statements
+            if statement.lstrip().upper().startswith(keywords)
+        ]
+
+    @property
+    def selects(self) -> List[str]:
+        return self._starting_with("SELECT")
+
+    @property
+    def inserts(self) -> List[str]:
+        return self._starting_with("INSERT")
+
+    @property
+    def updates(self) -> List[str]:
+        return self._starting_with("UPDATE")
+
+    @property
+    def deletes(self) -> List[str]:
+        return self._starting_with("DELETE")
+
+    @property
+    def writes(self) -> List[str]:
+        return self._starting_with("INSERT", "UPDATE", "DELETE")
+
+    @property
+    def upserts(self) -> List[str]:
+        return [s for s in self.statements if "ON CONFLICT" in s or "ON DUPLICATE" in s]
@@ -211,8 +211,8 @@ async def test_bulk_update_is_atomic_under_autocommit():
 
         orig = QueryExecutor.execute_many
 
-        async def execute_then_raise(self, query, values):
-            await orig(self, query, values)
+        async def execute_then_raise(self, query, values, **kwargs):
+            await orig(self, query, values, **kwargs)
             raise RuntimeError("boom")
 
         QueryExecutor.execute_many = execute_then_raise  # type: ignore[assignment]
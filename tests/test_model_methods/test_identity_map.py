@@ -0,0 +1,182 @@
+from typing import Optional
+
+import pytest
+
+import ormar
+from ormar.relations.relation_proxy import RelationProxy
+from tests.lifespan import init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Tag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="im_tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Author(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="im_authors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Reader(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="im_readers", partial_updates=True)
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    city: str = ormar.String(max_length=100)
+
+
+class Post(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="im_posts")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    author: Optional[Author] = ormar.ForeignKey(Author, related_name="posts")
+    tags: Optional[list[Tag]] = ormar.ManyToMany(Tag)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+def same(first: ormar.Model, second: ormar.Model) -> bool:
+    # related models are returned as weakref proxies
+    return first.__repr__.__self__ is second.__repr__.__self__  # type: ignore
+
+
+async def create_data() -> Author:
+    author = await Author.objects.create(name="John")
+    python = await Tag.objects.create(name="python")
+    for title in ("first", "second"):
+        post = await Post.objects.create(title=title, author=author)
+        assert isinstance(post.tags, RelationProxy)
+        await post.tags.add(python)
+    return author
+
+
+@pytest.mark.asyncio
+async def test_identity_map_returns_same_instance_with_refreshed_fields():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            author = await create_data()
+
+            with ormar.identity_map() as identity_map:
+                first = await Author.objects.get(pk=author.pk)
+                second = await Author.objects.get(name="John")
+                assert first is second
+                assert first is not author
+                assert len(identity_map) == 1
+
+                await Author.objects.filter(pk=author.pk).update(name="Jane")
+                third = await Author.objects.get(pk=author.pk)
+                assert third is first
+                assert first.name == "Jane"
+                assert first.saved
+
+                with ormar.identity_map() as nested:
+                    assert nested is identity_map
+                    assert await Author.objects.get(pk=author.pk) is first
+                assert len(identity_map) == 1
+
+            assert len(identity_map) == 0
+            assert await Author.objects.get(pk=author.pk) is not first
+
+
+@pytest.mark.asyncio
+async def test_identity_map_keeps_unsaved_changes_of_tracked_fields():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            reader = await Reader.objects.create(name="John", city="London")
+
+            with ormar.identity_map():
+                first = await Reader.objects.get(pk=reader.pk)
+                first.name = "edited"
+
+                await Reader.objects.filter(pk=reader.pk).update(
+                    name="Jane", city="Paris"
+                )
+                assert await Reader.objects.get(pk=reader.pk) is first
+                assert first.name == "edited"
+                assert first.city == "Paris"
+                assert first.__setattr_fields__ == {"name"}
+                assert not first.saved
+
+                await first.update()
+                assert first.saved
+
+            assert (await Reader.objects.get(pk=reader.pk)).name == "edited"
+
+
+@pytest.mark.asyncio
+async def test_identity_map_keeps_unsaved_changes_of_not_tracked_model():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            author = await Author.objects.create(name="John")
+
+            with ormar.identity_map():
+                first = await Author.objects.get(pk=author.pk)
+                first.name = "edited"
+
+                await Author.objects.filter(pk=author.pk).update(name="Jane")
+                assert await Author.objects.get(pk=author.pk) is first
+                assert first.name == "edited"
+                assert not first.saved
+
+                await first.update()
+                await Author.objects.filter(pk=author.pk).update(name="Jane")
+                assert await Author.objects.get(pk=author.pk) is first
+                assert first.name == "Jane"
+                assert first.saved
+
+
+@pytest.mark.asyncio
+async def test_identity_map_shares_related_instances():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            author = await create_data()
+
+            with ormar.identity_map():
+                posts = await Post.objects.select_related(["author", "tags"]).all()
+                assert same(posts[0].author, posts[1].author)
+                assert same(posts[0].tags[0], posts[1].tags[0])
+
+                loaded = await Author.objects.select_related("posts").get(pk=author.pk)
+                assert same(loaded, posts[0].author)
+                assert [post.title for post in loaded.posts] == ["first", "second"]
+                assert same(loaded.posts[0], posts[0])
+
+                # relations selected in the query are loaded again
+                loaded = await Author.objects.select_related("posts").get(pk=author.pk)
+                assert len(loaded.posts) == 2
+
+                prefetched = await Author.objects.prefetch_related("posts").get(
+                    pk=author.pk
+                )
+                assert prefetched is loaded
+                assert len(prefetched.posts) == 2
+                assert same(prefetched.posts[1], posts[1])
+
+
+@pytest.mark.asyncio
+async def test_identity_map_forgets_deleted_and_reloads_load_all():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            author = await create_data()
+
+            with ormar.identity_map() as identity_map:
+                post = await Post.objects.get(title="first")
+                await post.delete()
+                assert identity_map.get(Post, post.pk) is None
+
+                second = await Post.objects.get(title="second")
+                await Post.objects.bulk_delete([second])
+                assert identity_map.get(Post, second.pk) is None
+
+                loaded = await Author.objects.get(pk=author.pk)
+                assert await loaded.load_all() is loaded
+                assert loaded.posts == []
@@ -0,0 +1,159 @@
+import asyncio
+import time
+from typing import Optional
+
+import pytest
+
+import ormar
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Country(ormar.Model):
+    ormar_config = base_ormar_config.copy(
+        tablename="cache_countries", cache=ormar.ModelCache(max_entries=2)
+    )
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    code: str = ormar.String(max_length=2, name="iso_code")
+
+
+class City(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="cache_cities")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    country: Optional[Country] = ormar.ForeignKey(Country)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache = Country.ormar_config.cache
+    cache.clear()
+    cache.hits = cache.misses = 0
+    yield
+
+
+def test_model_cache_lru_and_ttl():
+    cache = ormar.ModelCache(max_entries=2, ttl=0.05)
+    cache.set(1, {"id": 1})
+    cache.set(2, {"id": 2})
+    assert cache.get(1) == {"id": 1}
+    cache.set(3, {"id": 3})
+    assert cache.get(2) is None
+    assert cache.get(1) == {"id": 1}
+    time.sleep(0.06)
+    assert cache.get(1) is None
+    assert cache.stats == {"hits": 2, "misses": 2, "size": 1}
+
+    with pytest.raises(ValueError):
+        ormar.ModelCache(max_entries=0)
+
+
+@pytest.mark.asyncio
+async def test_get_by_pk_is_served_from_cache():
+    async with base_ormar_config.database:
+        poland = await Country.objects.create(name="Poland", code="PL")
+        try:
+            with StatementCounter(base_ormar_config) as counter:
+                first = await Country.objects.get(pk=poland.pk)
+                second = await Country.objects.get(id=poland.pk)
+                third = await Country.objects.get_or_none(pk=poland.pk)
+                missing = await Country.objects.get_or_none(pk=poland.pk + 100)
+            assert len(counter.selects) == 2
+            assert first == second == third == poland
+            assert first is not second
+            assert second.code == "PL"
+            assert second.saved
+            assert missing is None
+            assert Country.ormar_config.cache.stats == {
+                "hits": 2,
+                "misses": 2,
+                "size": 1,
+            }
+
+            with StatementCounter(base_ormar_config) as counter:
+                await Country.objects.get(name="Poland")
+                await Country.objects.filter(name="Poland").get(pk=poland.pk)
+            assert len(counter.selects) == 2
+
+            async with base_ormar_config.database.transaction():
+                with StatementCounter(base_ormar_config) as counter:
+                    await Country.objects.get(pk=poland.pk)
+                assert len(counter.selects) == 1
+
+            city = await City.objects.create(name="Warsaw", country=poland)
+            city = await City.objects.get(pk=city.pk)
+            with StatementCounter(base_ormar_config) as counter:
+                await city.country.load()
+            assert not counter.selects
+            assert city.country.name == "Poland"
+        finally:
+            await City.objects.delete(each=True)
+            await Country.objects.delete(each=True)
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_cache():
+    async with base_ormar_config.database:
+        poland = await Country.objects.create(name="Poland", code="PL")
+        germany = await Country.objects.create(name="Germany", code="DE")
+        try:
+            await Country.objects.get(pk=poland.pk)
+            await poland.update(name="Polska")
+            assert (await Country.objects.get(pk=poland.pk)).name == "Polska"
+
+            await Country.objects.filter(pk=poland.pk).update(code="PO")
+            assert len(Country.ormar_config.cache) == 0
+            assert (await Country.objects.get(pk=poland.pk)).code == "PO"
+
+            germany.name = "Deutschland"
+            await Country.objects.bulk_update([germany])
+            assert (await Country.objects.get(pk=germany.pk)).name == "Deutschland"
+
+            await Country.objects.get(pk=poland.pk)
+            await Country.objects.bulk_delete([poland.pk])
+            assert await Country.objects.get_or_none(pk=poland.pk) is None
+
+            await germany.delete()
+            assert await Country.objects.get_or_none(pk=germany.pk) is None
+            assert len(Country.ormar_config.cache) == 0
+        finally:
+            await Country.objects.delete(each=True)
+
+
+@pytest.mark.asyncio
+async def test_rows_cached_during_transaction_are_invalidated_after_commit():
+    async with base_ormar_config.database:
+        poland = await Country.objects.create(name="Poland", code="PL")
+        germany = await Country.objects.create(name="Germany", code="DE")
+        written = asyncio.Event()
+        read = asyncio.Event()
+
+        async def read_outside_transaction() -> None:
+            await written.wait()
+            await Country.objects.get(pk=poland.pk)
+            await Country.objects.get(pk=germany.pk)
+            read.set()
+
+        # created before the transaction so it uses separate connection
+        reader = asyncio.create_task(read_outside_transaction())
+        try:
+            async with base_ormar_config.database.transaction():
+                await poland.update(name="Polska")
+                await Country.objects.filter(pk=germany.pk).update(name="Deutschland")
+                written.set()
+                await read.wait()
+                assert len(Country.ormar_config.cache) == 2
+            await reader
+
+            assert (await Country.objects.get(pk=poland.pk)).name == "Polska"
+            assert (await Country.objects.get(pk=germany.pk)).name == "Deutschland"
+        finally:
+            await Country.objects.delete(each=True)
@@ -0,0 +1,138 @@
+from typing import Any, Callable, Dict, List
+
+import pytest
+
+import ormar
+from ormar.exceptions import NoMatch
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+# only PostgreSQL reports if the upsert inserted the row
+_NATIVE_UPSERTS = 1 if "postgresql" in base_ormar_config.database.url else 0
+
+
+class Counter(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="upsert_counters")
+
+    id: int = ormar.Integer(primary_key=True, autoincrement=False)
+    name: str = ormar.String(max_length=100)
+    value: int = ormar.Integer(default=0, name="counter_value")
+    note: str = ormar.String(max_length=100, default="")
+    version: int = ormar.Integer(default=1, on_update=2)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+class _SignalRecorder:
+    def __init__(self, *names: str) -> None:
+        self.names = names
+        self.received: List[str] = []
+        self._receivers: Dict[str, Callable] = {}
+
+    def __enter__(self) -> "_SignalRecorder":
+        for name in self.names:
+
+            async def receiver(sender: Any, instance: Any, _name=name, **kwargs):
+                self.received.append(_name)
+
+            self._receivers[name] = receiver
+            getattr(Counter.ormar_config.signals, name).connect(receiver)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        for name, receiver in self._receivers.items():
+            getattr(Counter.ormar_config.signals, name).disconnect(receiver)
+
+
+@pytest.mark.asyncio
+async def test_update_or_create_creates_and_updates():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            with _SignalRecorder("post_save", "post_update") as signals:
+                with StatementCounter(base_ormar_config) as counter:
+                    created = await Counter.objects.update_or_create(
+                        id=1, name="visits", value=5
+                    )
+                assert len(counter.upserts) == _NATIVE_UPSERTS
+                assert signals.received == ["post_save"]
+                assert created.saved
+                assert created.version == 1
+
+                await Counter.objects.filter(id=1).update(note="keep me")
+
+                with StatementCounter(base_ormar_config) as counter:
+                    updated = await Counter.objects.update_or_create(
+                        pk=1, name="visits", value=6
+                    )
+                assert len(counter.upserts) == _NATIVE_UPSERTS
+                assert signals.received == ["post_save", "post_update"]
+
+            assert updated.value == 6
+            assert updated.note == "keep me"
+            assert updated.version == 2
+            assert updated.saved
+            loaded = await Counter.objects.get(id=1)
+            assert loaded.value == 6
+            assert loaded.note == "keep me"
+            assert loaded.version == 2
+            assert await Counter.objects.count() == 1
+
+
+@pytest.mark.asyncio
+async def test_update_or_create_falls_back_without_required_fields():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await Counter.objects.create(id=2, name="likes", value=1)
+            with StatementCounter(base_ormar_config) as counter:
+                updated = await Counter.objects.update_or_create(id=2, value=3)
+            assert counter.upserts == []
+            assert updated.name == "likes"
+            assert updated.value == 3
+
+            with pytest.raises(NoMatch):
+                await Counter.objects.update_or_create(id=20, value=3)
+
+
+@pytest.mark.asyncio
+async def test_pre_signal_receivers_disable_native_upsert():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await Counter.objects.create(id=3, name="shares")
+            with _SignalRecorder("pre_update", "post_update") as signals:
+                with StatementCounter(base_ormar_config) as counter:
+                    await Counter.objects.update_or_create(
+                        id=3, name="shares", value=10
+                    )
+            assert counter.upserts == []
+            assert signals.received == ["pre_update", "post_update"]
+            assert (await Counter.objects.get(id=3)).value == 10
+
+            with _SignalRecorder("pre_save", "post_save") as signals:
+                await Counter.objects.update_or_create(id=30, name="new", value=1)
+            assert signals.received == ["pre_save", "post_save"]
+            assert (await Counter.objects.get(id=30)).name == "new"
+
+
+@pytest.mark.asyncio
+async def test_force_save_upsert_inserts_and_updates():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            with _SignalRecorder("post_save", "post_update") as signals:
+                with StatementCounter(base_ormar_config) as counter:
+                    counter_model = await Counter(id=4, name="stars").upsert(
+                        __force_save__=True
+                    )
+                assert len(counter.upserts) == _NATIVE_UPSERTS
+                assert counter_model.saved
+
+                counter_model.value = 7
+                with StatementCounter(base_ormar_config) as counter:
+                    await counter_model.upsert(__force_save__=True)
+                assert len(counter.upserts) == _NATIVE_UPSERTS
+                assert signals.received == ["post_save", "post_update"]
+
+            loaded = await Counter.objects.get(id=4)
+            assert loaded.value == 7
+            assert loaded.version == 2
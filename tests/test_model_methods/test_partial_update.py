@@ -0,0 +1,195 @@
+from datetime import datetime
+from typing import Optional
+
+import pytest
+
+import ormar
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+partial_ormar_config = base_ormar_config.copy(partial_updates=True)
+
+
+class Author(ormar.Model):
+    ormar_config = partial_ormar_config.copy(tablename="partial_authors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Book(ormar.Model):
+    ormar_config = partial_ormar_config.copy(tablename="partial_books")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    year: int = ormar.Integer(default=2000)
+    author: Optional[Author] = ormar.ForeignKey(Author)
+
+
+class Stamped(ormar.Model):
+    ormar_config = partial_ormar_config.copy(tablename="partial_stamped")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    note: str = ormar.String(max_length=100, default="")
+    updated_at: datetime = ormar.DateTime(
+        default=datetime(2000, 1, 1), on_update=datetime.now
+    )
+
+
+class FullBook(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="full_books")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    year: int = ormar.Integer(default=2000)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+def test_partial_updates_flag_is_copied():
+    assert not base_ormar_config.partial_updates
+    assert partial_ormar_config.partial_updates
+    assert Book.ormar_config.partial_updates
+    assert not FullBook.ormar_config.partial_updates
+    assert not partial_ormar_config.copy(partial_updates=False).partial_updates
+
+
+@pytest.mark.asyncio
+async def test_update_writes_only_changed_fields():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await Book.objects.create(title="Hobbit", year=1937)
+            book = await Book.objects.get(title="Hobbit")
+
+            book.year = 1938
+            with StatementCounter(base_ormar_config) as counter:
+                await book.update()
+            assert len(counter.updates) == 1
+            assert "year" in counter.updates[0]
+            assert "title" not in counter.updates[0]
+
+            await Book.objects.filter(id=book.id).update(title="The Hobbit")
+            await book.update(year=1951)
+            book = await Book.objects.get(id=book.id)
+            assert book.title == "The Hobbit"
+            assert book.year == 1951
+
+
+@pytest.mark.asyncio
+async def test_update_skips_query_when_nothing_changed():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            book = await Book.objects.create(title="Dune", year=1965)
+            with StatementCounter(base_ormar_config) as counter:
+                await book.update()
+                await book.upsert()
+            assert counter.statements == []
+
+            loaded = await Book.objects.get(id=book.id)
+            with StatementCounter(base_ormar_config) as counter:
+                await loaded.update()
+            assert counter.statements == []
+            assert loaded.saved
+
+
+@pytest.mark.asyncio
+async def test_relation_change_is_tracked():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            author = await Author.objects.create(name="Tolkien")
+            book = await Book.objects.create(title="Silmarillion")
+            book.author = author
+            with StatementCounter(base_ormar_config) as counter:
+                await book.update()
+            assert len(counter.updates) == 1
+            assert "author" in counter.updates[0]
+            assert "title" not in counter.updates[0]
+
+            book = await Book.objects.select_related("author").get(id=book.id)
+            assert book.author.name == "Tolkien"
+
+
+@pytest.mark.asyncio
+async def test_loading_relations_is_not_tracked():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            author = await Author.objects.create(name="Tolkien")
+            await Book.objects.create(title="Hobbit", author=author)
+
+            author = await Author.objects.prefetch_related("books").get()
+            assert author.books[0].title == "Hobbit"
+            assert author.__setattr_fields__ == set()
+
+            book = await Book.objects.prefetch_related("author").get()
+            assert book.author.name == "Tolkien"
+            assert book.__setattr_fields__ == set()
+
+            author = await Author.objects.get()
+            await author.books.all()
+            assert author.__setattr_fields__ == set()
+
+            author = await Author.objects.prefetch_related("books").get()
+            with StatementCounter(base_ormar_config) as counter:
+                await author.update()
+            assert counter.statements == []
+
+
+@pytest.mark.asyncio
+async def test_not_loaded_model_updates_passed_fields():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            book = await Book.objects.create(title="Emma", year=1815)
+            detached = Book(id=book.id, title="Persuasion")
+            await detached.update()
+            book = await Book.objects.get(id=book.id)
+            assert book.title == "Persuasion"
+            assert book.year == 1815
+
+
+@pytest.mark.asyncio
+async def test_onupdate_fields_are_written_only_with_changes():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            stamped = await Stamped.objects.create(name="first")
+            stamped = await Stamped.objects.get(id=stamped.id)
+            with StatementCounter(base_ormar_config) as counter:
+                await stamped.update()
+            assert counter.statements == []
+            assert stamped.updated_at == datetime(2000, 1, 1)
+
+            stamped.note = "changed"
+            with StatementCounter(base_ormar_config) as counter:
+                await stamped.update()
+            assert len(counter.updates) == 1
+            assert "updated_at" in counter.updates[0]
+            assert "name" not in counter.updates[0]
+            assert stamped.updated_at > datetime(2000, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_explicit_columns_and_full_mode_still_work():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            book = await Book.objects.create(title="Ulysses", year=1922)
+            with StatementCounter(base_ormar_config) as counter:
+                await book.update(_columns=["title"])
+            assert len(counter.updates) == 1
+
+            full = await FullBook.objects.create(title="Ulysses", year=1922)
+            with StatementCounter(base_ormar_config) as counter:
+                await full.update()
+            assert len(counter.updates) == 1
+            assert "title" in counter.updates[0]
+            assert "year" in counter.updates[0]
+
+
+@pytest.mark.asyncio
+async def test_bulk_created_models_are_clean():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            books = [Book(title="A"), Book(title="B")]
+            await Book.objects.bulk_create(books)
+            assert all(not book.__setattr_fields__ for book in books)
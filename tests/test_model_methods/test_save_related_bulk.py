@@ -0,0 +1,198 @@
+from typing import Optional
+
+import pytest
+
+import ormar
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Country(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="bulk_countries")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Skill(ormar.Model):
+    ormar_config = base_ormar_config.copy(
+        tablename="bulk_skills", cache=ormar.ModelCache()
+    )
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class EmployeeSkill(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="bulk_employees_skills")
+
+    id: int = ormar.Integer(primary_key=True)
+    level: int = ormar.Integer(default=1)
+
+
+class Company(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="bulk_companies")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100, name="company_name")
+    status: Optional[str] = ormar.String(
+        max_length=20, server_default="active", nullable=True
+    )
+    country: Optional[Country] = ormar.ForeignKey(Country)
+
+
+class Department(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="bulk_departments")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    company: Optional[Company] = ormar.ForeignKey(Company, related_name="departments")
+
+
+class Employee(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="bulk_employees")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    department: Optional[Department] = ormar.ForeignKey(
+        Department, related_name="employees"
+    )
+    skills: Optional[list[Skill]] = ormar.ManyToMany(Skill, through=EmployeeSkill)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+def build_payload(departments: int, employees: int) -> dict:
+    return {
+        "name": "Acme",
+        "country": {"name": "Poland"},
+        "departments": [
+            {
+                "name": f"dep{d}",
+                "employees": [
+                    {
+                        "name": f"emp{d}-{e}",
+                        "skills": [{"name": f"skill{d}-{e}"}],
+                    }
+                    for e in range(employees)
+                ],
+            }
+            for d in range(departments)
+        ],
+    }
+
+
+async def save_tree(company: Company) -> int:
+    count = await company.save_related(follow=True, save_all=True, bulk=True)
+    return count
+
+
+@pytest.mark.asyncio
+async def test_bulk_save_related_writes_levels_with_bulk_statements():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            small = Company(**build_payload(departments=2, employees=2))
+            with StatementCounter(base_ormar_config) as counter:
+                count = await save_tree(small)
+            small_writes = len(counter.writes)
+            assert count == 1 + 1 + 2 + 4 + 4
+
+            large = Company(**build_payload(departments=5, employees=10))
+            with StatementCounter(base_ormar_config) as counter:
+                count = await save_tree(large)
+            assert count == 1 + 1 + 5 + 50 + 50
+            assert len(counter.writes) == small_writes
+
+            assert large.pk is not None
+            assert large.status == "active"
+            assert all(dep.pk is not None for dep in large.departments)
+
+            loaded = await Company.objects.select_all(follow=True).get(pk=large.pk)
+            assert loaded.country.name == "Poland"
+            assert len(loaded.departments) == 5
+            employees = [emp for dep in loaded.departments for emp in dep.employees]
+            assert len(employees) == 50
+            assert all(
+                emp.skills[0].name == emp.name.replace("emp", "skill")
+                for emp in employees
+            )
+
+
+@pytest.mark.asyncio
+async def test_bulk_save_related_updates_existing_and_links_through_fields():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            company = await Company.objects.create(name="Acme")
+            department = await Department.objects.create(name="IT", company=company)
+            python = await Skill.objects.create(name="python")
+
+            employee = Employee(name="John", department=department)
+            employee.skills.append(python)
+            python.employeeskill = EmployeeSkill(level=5)
+            department.name = "R&D"
+            count = await department.save_related(follow=True, save_all=True, bulk=True)
+            assert count == 4
+
+            loaded = await Employee.objects.select_related(
+                ["skills", "department"]
+            ).get(name="John")
+            assert loaded.department.name == "R&D"
+            assert loaded.skills[0].name == "python"
+            assert loaded.skills[0].employeeskill.level == 5
+
+            count = await company.save_related(follow=True, bulk=True)
+            assert count == 0
+
+            department.name = "Research"
+            with StatementCounter(base_ormar_config) as counter:
+                count = await company.save_related(follow=True, bulk=True)
+            assert count == 1
+            assert len(counter.writes) == 1
+            assert counter.writes[0].startswith("UPDATE")
+            assert (await Department.objects.get(pk=department.pk)).name == "Research"
+
+
+@pytest.mark.asyncio
+async def test_bulk_save_related_updates_existing_through_links_in_bulk():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            company = Company(**build_payload(departments=1, employees=3))
+            await save_tree(company)
+            employees = company.departments[0].employees
+            for employee in employees:
+                employee.skills[0].employeeskill = EmployeeSkill(level=7)
+
+            with StatementCounter(base_ormar_config) as counter:
+                await save_tree(company)
+            through_updates = [
+                s for s in counter.updates if "bulk_employees_skills" in s
+            ]
+            skill_updates = [s for s in counter.updates if "UPDATE bulk_skills" in s]
+            assert len(through_updates) == 1
+            assert len(skill_updates) == 1
+
+            links = await EmployeeSkill.objects.all()
+            assert [link.level for link in links] == [7, 7, 7]
+
+
+@pytest.mark.asyncio
+async def test_bulk_save_related_upserts_models_with_signals_one_by_one():
+    saved = []
+
+    @ormar.post_save(Department)
+    async def after_save(sender, instance, **kwargs):
+        saved.append(instance.name)
+
+    try:
+        async with base_ormar_config.database:
+            async with base_ormar_config.database.transaction(force_rollback=True):
+                company = Company(**build_payload(departments=3, employees=1))
+                count = await save_tree(company)
+                assert count == 1 + 1 + 3 + 3 + 3
+                assert sorted(saved) == ["dep0", "dep1", "dep2"]
+                assert await Employee.objects.count() == 3
+    finally:
+        Department.ormar_config.signals.post_save.disconnect(after_save)
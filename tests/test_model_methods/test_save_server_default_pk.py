@@ -4,7 +4,9 @@ Covers two closely related concerns:
 
 1. N+1 fix (PR #919) — when the pk is the only ``server_default`` field, the
    INSERT's RETURNING clause already provides the pk, so ``save()`` must not
-   issue a second SELECT to reload the model.
+   issue a second SELECT to reload the model. Non-pk server defaults are
+   returned by the INSERT as well, the reload remains only on backends
+   without RETURNING (Oracle MySQL).
 
 2. Pk-recovery loud-fail — on backends that cannot return a server-generated
    pk (Oracle MySQL has no RETURNING), ``save()`` must raise
@@ -13,14 +15,15 @@ Covers two closely related concerns:
    then mistook for the pk).
 """
 
-from typing import Any, List
+from datetime import datetime
+from typing import List, Optional
 
 import pytest
-from sqlalchemy import event, text
+from sqlalchemy import func, text
 
 import ormar
 from ormar.exceptions import ModelPersistenceError
-from tests.lifespan import init_tests
+from tests.lifespan import StatementCounter, init_tests
 from tests.settings import create_config
 
 base_ormar_config = create_config()
@@ -55,35 +58,17 @@ class ServerDefaultPkAndNonPk(ormar.Model):
     company: str = ormar.String(max_length=100, server_default="Acme")
 
 
-create_test_database = init_tests(base_ormar_config)
-
-
-class _StatementCounter:
-    """Records every statement executed on the sqlalchemy engine."""
-
-    def __init__(self) -> None:
-        self.statements: List[str] = []
-
-    def __enter__(self) -> "_StatementCounter":
-        sync_engine = base_ormar_config.database.engine.sync_engine
+class ServerDefaultAliased(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="server_default_aliased")
 
-        def before_cursor_execute(
-            conn: Any,
-            cursor: Any,
-            statement: str,
-            parameters: Any,
-            context: Any,
-            executemany: bool,
-        ) -> None:
-            self.statements.append(statement)
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    created: Optional[datetime] = ormar.DateTime(
+        server_default=func.now(), name="created_at"
+    )
 
-        self._listener = before_cursor_execute
-        self._sync_engine = sync_engine
-        event.listen(sync_engine, "before_cursor_execute", self._listener)
-        return self
 
-    def __exit__(self, *exc: Any) -> None:
-        event.remove(self._sync_engine, "before_cursor_execute", self._listener)
+create_test_database = init_tests(base_ormar_config)
 
 
 def _table_selects(statements: List[str], tablename: str) -> List[str]:
@@ -107,7 +92,7 @@ async def test_save_does_not_reload_when_only_pk_has_server_default():  # noqa:
     """INSERT returns the server-generated pk, so no SELECT should follow."""
     async with base_ormar_config.database:
         async with base_ormar_config.database.transaction(force_rollback=True):
-            with _StatementCounter() as counter:
+            with StatementCounter(base_ormar_config) as counter:
                 instance = ServerDefaultPk(name="first")
                 await instance.save()
 
@@ -119,11 +104,12 @@ async def test_save_does_not_reload_when_only_pk_has_server_default():  # noqa:
 
 
 @pytest.mark.asyncio
-async def test_save_still_reloads_when_non_pk_has_server_default():
-    """Regression guard: non-pk server defaults must still trigger a reload."""
+async def test_save_returns_non_pk_server_default():
+    """Non-pk server defaults come back with the INSERT, reload only without
+    RETURNING support."""
     async with base_ormar_config.database:
         async with base_ormar_config.database.transaction(force_rollback=True):
-            with _StatementCounter() as counter:
+            with StatementCounter(base_ormar_config) as counter:
                 instance = ServerDefaultNonPk(id=1, name="first")
                 await instance.save()
 
@@ -131,7 +117,8 @@ async def test_save_still_reloads_when_non_pk_has_server_default():
                 counter.statements, ServerDefaultNonPk.ormar_config.tablename
             )
             assert instance.company == "Acme"
-            assert len(selects) == 1, counter.statements
+            expected = 0 if base_ormar_config.database.dialect.insert_returning else 1
+            assert len(selects) == expected, counter.statements
 
 
 @pytest.mark.asyncio
@@ -143,11 +130,11 @@ async def test_save_still_reloads_when_non_pk_has_server_default():
         "test_save_raises_when_server_default_pk_cannot_be_recovered instead."
     ),
 )
-async def test_save_reloads_once_when_both_pk_and_non_pk_have_server_default():  # noqa: E501  # pragma: no cover
-    """Mixed case: still need exactly one reload for the non-pk column."""
+async def test_save_returns_both_pk_and_non_pk_server_default():  # noqa: E501  # pragma: no cover
+    """Mixed case: pk and non-pk column are both returned by the INSERT."""
     async with base_ormar_config.database:
         async with base_ormar_config.database.transaction(force_rollback=True):
-            with _StatementCounter() as counter:
+            with StatementCounter(base_ormar_config) as counter:
                 instance = ServerDefaultPkAndNonPk(name="first")
                 await instance.save()
 
@@ -156,7 +143,7 @@ async def test_save_reloads_once_when_both_pk_and_non_pk_have_server_default():
             )
             assert instance.pk is not None
             assert instance.company == "Acme"
-            assert len(selects) == 1, counter.statements
+            assert selects == [], counter.statements
 
 
 @pytest.mark.asyncio
@@ -177,3 +164,19 @@ async def test_save_raises_when_server_default_pk_cannot_be_recovered():  # noqa
             with pytest.raises(ModelPersistenceError, match="primary key"):
                 await instance.save()
             assert instance.pk is None
+
+
+@pytest.mark.asyncio
+async def test_save_returns_aliased_server_default_column():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            with StatementCounter(base_ormar_config) as counter:
+                instance = await ServerDefaultAliased(name="first").save()
+
+            selects = _table_selects(
+                counter.statements, ServerDefaultAliased.ormar_config.tablename
+            )
+            assert isinstance(instance.created, datetime)
+            assert instance.saved
+            expected = 0 if base_ormar_config.database.dialect.insert_returning else 1
+            assert len(selects) == expected, counter.statements
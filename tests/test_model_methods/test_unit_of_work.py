@@ -0,0 +1,217 @@
+from typing import Optional
+
+import pytest
+
+import ormar
+from ormar.exceptions import QueryDefinitionError
+from ormar.relations.relation_proxy import RelationProxy
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Tag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="uow_tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Author(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="uow_authors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    active: bool = ormar.Boolean(default=True)
+
+
+class Post(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="uow_posts")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    views: int = ormar.Integer(default=0)
+    author: Optional[Author] = ormar.ForeignKey(Author, related_name="posts")
+    tags: Optional[list[Tag]] = ormar.ManyToMany(Tag)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+async def create_authors_with_posts(authors: int, posts: int) -> list[Author]:
+    created = []
+    async with ormar.unit_of_work(base_ormar_config.database):
+        tag = await Tag(name="python").save()
+        for a in range(authors):
+            author = await Author(name=f"author{a}").save()
+            for p in range(posts):
+                post = await Post(title=f"post{a}-{p}", author=author).save()
+                assert isinstance(post.tags, RelationProxy)
+                await post.tags.add(tag)
+            created.append(author)
+    return created
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_inserts_with_bulk_statements_on_exit():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            with StatementCounter(base_ormar_config) as counter:
+                await create_authors_with_posts(authors=2, posts=2)
+            small_writes = len(counter.writes)
+
+            with StatementCounter(base_ormar_config) as counter:
+                authors = await create_authors_with_posts(authors=5, posts=10)
+            assert len(counter.writes) == small_writes
+
+            assert all(author.pk is not None and author.saved for author in authors)
+            loaded = await Author.objects.select_related(["posts", "posts__tags"]).get(
+                pk=authors[-1].pk
+            )
+            assert len(loaded.posts) == 10
+            assert all(post.tags[0].name == "python" for post in loaded.posts)
+            assert await Post.objects.count() == 2 * 2 + 5 * 10
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_defers_writes_and_sends_bulk_signals():
+    created = []
+
+    @ormar.post_bulk_create([Author, Post])
+    async def after_bulk_create(sender, instances, **kwargs):
+        created.append((sender, len(instances)))
+
+    try:
+        async with base_ormar_config.database:
+            async with base_ormar_config.database.transaction(force_rollback=True):
+                async with ormar.unit_of_work(base_ormar_config.database) as uow:
+                    author = await Author(name="John").save()
+                    await Post(title="first", author=author).save()
+                    await Post(title="second", author=author).save()
+                    assert author.pk is None
+                    assert uow.has_changes
+                    assert await Author.objects.count() == 0
+                assert not uow.has_changes
+                assert created == [(Author, 1), (Post, 2)]
+                assert await Post.objects.filter(author=author).count() == 2
+    finally:
+        Author.ormar_config.signals.post_bulk_create.disconnect(after_bulk_create)
+        Post.ormar_config.signals.post_bulk_create.disconnect(after_bulk_create)
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_batches_updates_and_deletes():
+    updated = []
+    deleted = []
+
+    @ormar.post_bulk_update(Post)
+    async def after_bulk_update(sender, instances, **kwargs):
+        updated.append(len(instances))
+
+    @ormar.post_bulk_delete([Author, Post])
+    async def after_bulk_delete(sender, instances, pks, **kwargs):
+        deleted.append((sender, len(instances)))
+
+    try:
+        async with base_ormar_config.database:
+            async with base_ormar_config.database.transaction(force_rollback=True):
+                authors = await create_authors_with_posts(authors=2, posts=3)
+                posts = await Post.objects.filter(author=authors[0]).all()
+                to_delete = await Post.objects.filter(author=authors[1]).all()
+
+                with StatementCounter(base_ormar_config) as counter:
+                    async with ormar.unit_of_work(base_ormar_config.database):
+                        for post in posts:
+                            await post.update(_columns=["views"], views=10)
+                        await posts[0].update(title="renamed")
+                        await authors[1].delete()
+                        for post in to_delete:
+                            await post.delete()
+                        pending = await Author(name="never saved").save()
+                        await pending.delete()
+                updates = [s for s in counter.writes if s.startswith("UPDATE")]
+                deletes = [s for s in counter.writes if s.startswith("DELETE")]
+                assert len(updates) == 2
+                assert len(deletes) == 2
+                assert not any(s.startswith("INSERT") for s in counter.writes)
+                assert sorted(updated) == [1, 2]
+                assert deleted == [(Post, 3), (Author, 1)]
+
+                assert await Author.objects.count() == 1
+                loaded = await Post.objects.order_by("id").all()
+                assert [post.views for post in loaded] == [10, 10, 10]
+                assert loaded[0].title == "renamed"
+    finally:
+        Post.ormar_config.signals.post_bulk_update.disconnect(after_bulk_update)
+        Author.ormar_config.signals.post_bulk_delete.disconnect(after_bulk_delete)
+        Post.ormar_config.signals.post_bulk_delete.disconnect(after_bulk_delete)
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_many_to_many_add_and_remove():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            python = await Tag.objects.create(name="python")
+            orm = await Tag.objects.create(name="orm")
+            post = await Post.objects.create(title="ormar")
+            await post.tags.add(python)
+
+            async with ormar.unit_of_work(base_ormar_config.database):
+                await post.tags.remove(python)
+                await post.tags.add(orm)
+                sql = await Tag(name="sql").save()
+                await post.tags.add(sql)
+                await post.tags.remove(sql)
+
+            loaded = await Post.objects.select_related("tags").get(pk=post.pk)
+            assert [tag.name for tag in loaded.tags] == ["orm"]
+            assert sql.pk is not None
+
+            async with ormar.unit_of_work(base_ormar_config.database):
+                await post.tags.set([python, orm])
+
+            loaded = await Post.objects.select_related("tags").get(pk=post.pk)
+            assert sorted(tag.name for tag in loaded.tags) == ["orm", "python"]
+
+            async with ormar.unit_of_work(base_ormar_config.database):
+                draft = await Post(title="draft").save()
+                with StatementCounter(base_ormar_config) as counter:
+                    await draft.tags.set([python])
+                assert counter.selects == []
+
+            loaded = await Post.objects.select_related("tags").get(pk=draft.pk)
+            assert [tag.name for tag in loaded.tags] == ["python"]
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_discards_changes_on_error_and_nests():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            with pytest.raises(ValueError):
+                async with ormar.unit_of_work(base_ormar_config.database):
+                    await Author(name="John").save()
+                    raise ValueError("boom")
+            assert await Author.objects.count() == 0
+
+            database = base_ormar_config.database
+            async with ormar.unit_of_work(database) as outer:
+                async with ormar.unit_of_work(database) as inner:
+                    assert inner is outer
+                    author = await Author(name="Jane").save()
+                assert author.pk is None
+            assert author.pk is not None
+
+            async with ormar.unit_of_work(database) as uow:
+                author.name = "Janet"
+                await author.upsert(__force_save__=True)
+                await Author(id=author.pk + 100, name="Upserted").upsert(
+                    __force_save__=True
+                )
+                await uow.flush()
+                assert await Author.objects.count() == 2
+            assert (await Author.objects.get(pk=author.pk)).name == "Janet"
+
+            with pytest.raises(QueryDefinitionError):
+                async with ormar.unit_of_work(database):
+                    await author.update(views=Post.views + 1)
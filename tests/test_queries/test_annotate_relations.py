@@ -0,0 +1,138 @@
+from typing import Optional
+
+import pytest
+import pytest_asyncio
+
+import ormar
+from ormar.exceptions import QueryDefinitionError
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Tag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="ar_tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Author(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="ar_authors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Post(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="ar_posts")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    author: Optional[Author] = ormar.ForeignKey(Author)
+    tags = ormar.ManyToMany(Tag)
+
+
+class Comment(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="ar_comments")
+
+    id: int = ormar.Integer(primary_key=True)
+    likes: int = ormar.Integer(default=0)
+    post: Optional[Post] = ormar.ForeignKey(Post, related_name="comments")
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest_asyncio.fixture()
+async def posts():
+    async with base_ormar_config.database:
+        author = await Author.objects.create(name="Ann")
+        news = await Tag.objects.create(name="news")
+        tech = await Tag.objects.create(name="tech")
+        first = await Post.objects.create(title="first", author=author)
+        second = await Post.objects.create(title="second", author=author)
+        await Post.objects.create(title="empty")
+        await first.tags.add(news)
+        await first.tags.add(tech)
+        await second.tags.add(news)
+        for likes in (1, 2, 3):
+            await Comment.objects.create(likes=likes, post=first)
+        await Comment.objects.create(likes=10, post=second)
+        yield
+        await Comment.objects.delete(each=True)
+        for post in await Post.objects.select_related("tags").all():
+            await post.tags.clear()
+        await Post.objects.delete(each=True)
+        await Tag.objects.delete(each=True)
+        await Author.objects.delete(each=True)
+
+
+@pytest.mark.asyncio
+async def test_annotations_count_related_models_without_loading_them(posts):
+    with StatementCounter(base_ormar_config) as counter:
+        loaded = (
+            await Post.objects.select_related("author")
+            .annotate(
+                comment_count=ormar.Count("comments"),
+                tag_count=ormar.Count("tags"),
+                total_likes=ormar.Sum("comments__likes"),
+            )
+            .order_by("id")
+            .all()
+        )
+    assert len(counter.selects) == 1
+    assert [
+        (post.title, post.comment_count, post.tag_count, post.total_likes)
+        for post in loaded
+    ] == [("first", 3, 2, 6), ("second", 1, 1, 10), ("empty", 0, 0, None)]
+    assert loaded[0].author.name == "Ann"
+    assert "comment_count" not in loaded[0].model_dump()
+    with pytest.raises(AttributeError):
+        loaded[0].not_annotated
+
+    post = await Post.objects.annotate(n=ormar.Max("comments__likes")).get(
+        title="first"
+    )
+    assert post.n == 3
+    tagged = await Tag.objects.annotate(posts_count=ormar.Count("posts")).get(
+        name="news"
+    )
+    assert tagged.posts_count == 2
+
+
+@pytest.mark.asyncio
+async def test_annotations_in_values_and_relation_querysets(posts):
+    rows = (
+        await Post.objects.annotate(comment_count=ormar.Count("comments"))
+        .filter(title__in=["first", "second"])
+        .order_by("title")
+        .values(["title"])
+    )
+    assert rows == [
+        {"title": "first", "comment_count": 3},
+        {"title": "second", "comment_count": 1},
+    ]
+
+    author = await Author.objects.get(name="Ann")
+    titles = await author.posts.annotate(n=ormar.Count("comments")).order_by("id").all()
+    assert [(post.title, post.n) for post in titles] == [("first", 3), ("second", 1)]
+
+    post = await Post.objects.get(title="first")
+    tags = await post.tags.annotate(n=ormar.Count("posts")).order_by("name").all()
+    assert [(tag.name, tag.n) for tag in tags] == [("news", 2), ("tech", 1)]
+
+
+@pytest.mark.asyncio
+async def test_invalid_annotations_raise(posts):
+    with pytest.raises(QueryDefinitionError):
+        await Post.objects.annotate(n=ormar.Count("title")).all()
+    with pytest.raises(QueryDefinitionError):
+        await Post.objects.annotate(n=ormar.Count("author")).all()
+    with pytest.raises(QueryDefinitionError):
+        await Post.objects.annotate(n=ormar.Count("comments")).order_by("-n").all()
+    with pytest.raises(QueryDefinitionError):
+        await Post.objects.annotate(
+            n=ormar.Count("comments"), having={"n__gt": 1}
+        ).all()
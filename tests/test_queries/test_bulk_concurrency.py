@@ -0,0 +1,103 @@
+import pytest
+
+import ormar
+from ormar.exceptions import BulkOperationError, QueryDefinitionError
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Item(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="concurrent_items")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100, unique=True)
+    quantity: int = ormar.Integer(default=0)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_and_update_concurrently():
+    async with base_ormar_config.database:
+        try:
+            items = [Item(name=f"Item {i}") for i in range(10)]
+            with StatementCounter(base_ormar_config) as counter:
+                await Item.objects.bulk_create(items, batch_size=4, concurrency=3)
+            assert len(counter.inserts) == 3
+            assert all(item.saved for item in items)
+            assert await Item.objects.count() == 10
+
+            items = await Item.objects.order_by("id").all()
+            for item in items:
+                item.quantity = 5
+
+            received = []
+
+            @ormar.post_bulk_update(Item)
+            async def after_bulk_update(sender, instances, **kwargs):
+                received.extend(instances)
+
+            try:
+                await Item.objects.bulk_update(
+                    items, columns=["quantity"], concurrency=2
+                )
+            finally:
+                Item.ormar_config.signals.post_bulk_update.disconnect(after_bulk_update)
+            assert len(received) == 10
+            assert all(item.saved for item in items)
+            assert await Item.objects.filter(quantity=5).count() == 10
+        finally:
+            await Item.objects.delete(each=True)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_chunks_errors_are_collected():
+    async with base_ormar_config.database:
+        try:
+            await Item.objects.create(name="Taken")
+            items = [Item(name=f"Item {i}") for i in range(4)]
+            items.append(Item(name="Taken"))
+            items.extend(Item(name=f"Other {i}") for i in range(2))
+
+            with pytest.raises(BulkOperationError) as exc_info:
+                await Item.objects.bulk_create(items, batch_size=2, concurrency=4)
+            assert [index for index, _ in exc_info.value.errors] == [2]
+
+            assert [item.saved for item in items] == [
+                True,
+                True,
+                True,
+                True,
+                False,
+                False,
+                True,
+            ]
+            assert await Item.objects.count() == 6
+        finally:
+            await Item.objects.delete(each=True)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_bulk_create_runs_outside_transaction():
+    async with base_ormar_config.database:
+        try:
+            async with base_ormar_config.database.transaction(force_rollback=True):
+                await Item.objects.bulk_create(
+                    [Item(name=f"Item {i}") for i in range(4)], concurrency=2
+                )
+            assert await Item.objects.count() == 4
+        finally:
+            await Item.objects.delete(each=True)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_has_to_be_positive():
+    async with base_ormar_config.database:
+        with pytest.raises(QueryDefinitionError):
+            await Item.objects.bulk_create([Item(name="Never")], concurrency=0)
+        with pytest.raises(QueryDefinitionError):
+            await Item.objects.bulk_update([Item(id=1, name="Never")], concurrency=0)
+        assert await Item.objects.count() == 0
@@ -0,0 +1,90 @@
+from typing import AsyncIterator, Optional
+
+import pytest
+
+import ormar
+from ormar.exceptions import QueryDefinitionError
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Author(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="copy_authors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Book(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="copy_books")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100, name="book_title")
+    pages: int = ormar.Integer(default=100)
+    meta: Optional[dict] = ormar.JSON(nullable=True)
+    author: Optional[Author] = ormar.ForeignKey(Author)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+def supports_copy() -> bool:
+    dialect = base_ormar_config.database.dialect
+    return dialect.name == "postgresql" and dialect.driver == "asyncpg"
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_with_copy_method():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            author = await Author.objects.create(name="Tolkien")
+            books = [
+                Book(title=f"Book {i}", meta={"i": i}, author=author) for i in range(5)
+            ]
+            books.append(Book(title="Short", pages=10, author=author))
+
+            with StatementCounter(base_ormar_config) as counter:
+                await Book.objects.bulk_create(books, batch_size=2, method="copy")
+            if supports_copy():  # pragma: no cover
+                assert counter.inserts == []
+            else:
+                assert len(counter.inserts) == 3
+
+            assert all(not book.__setattr_fields__ for book in books)
+            loaded = await Book.objects.select_related("author").order_by("id").all()
+            assert len(loaded) == 6
+            assert loaded[0].meta == {"i": 0}
+            assert loaded[-1].title == "Short"
+            assert loaded[-1].pages == 10
+            assert {book.pages for book in loaded[:-1]} == {100}
+            assert {book.author.name for book in loaded} == {"Tolkien"}
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_stream_with_copy_method():
+    async def generate() -> AsyncIterator[dict]:
+        for i in range(5):
+            yield {"title": f"Streamed {i}"}
+
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            inserted = await Book.objects.bulk_create_stream(
+                generate(), batch_size=2, method="copy"
+            )
+            assert inserted == 5
+            assert await Book.objects.filter(title__startswith="Streamed").count() == 5
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_unknown_method():
+    async def generate() -> AsyncIterator[dict]:
+        yield {"title": "Never"}  # pragma: no cover
+
+    async with base_ormar_config.database:
+        with pytest.raises(QueryDefinitionError):
+            await Book.objects.bulk_create([Book(title="Never")], method="csv")
+        with pytest.raises(QueryDefinitionError):
+            await Book.objects.bulk_create_stream(generate(), method="csv")
+        assert await Book.objects.count() == 0
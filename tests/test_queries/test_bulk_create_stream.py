@@ -0,0 +1,120 @@
+from typing import Any, AsyncIterator, Optional
+
+import pydantic
+import pytest
+
+import ormar
+from ormar.exceptions import QueryDefinitionError
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Category(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="stream_categories")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Product(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="stream_products")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100, name="product_name")
+    rating: int = ormar.Integer(default=1)
+    category: Optional[Category] = ormar.ForeignKey(Category)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+async def generate_products(count: int, category: Category) -> AsyncIterator[Any]:
+    for i in range(count):
+        if i % 2:
+            yield {"name": f"product{i}", "category": category}
+        else:
+            yield Product(name=f"product{i}", rating=5, category=category)
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_stream_in_batches():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            category = await Category.objects.create(name="Toys")
+            reported = []
+            signalled = []
+
+            async def on_bulk_create(sender: Any, instances: list, **kwargs: Any):
+                signalled.append(len(instances))
+
+            Product.ormar_config.signals.post_bulk_create.connect(on_bulk_create)
+            try:
+                with StatementCounter(base_ormar_config) as counter:
+                    inserted = await Product.objects.bulk_create_stream(
+                        generate_products(7, category),
+                        batch_size=3,
+                        progress=reported.append,
+                    )
+            finally:
+                Product.ormar_config.signals.post_bulk_create.disconnect(on_bulk_create)
+            assert inserted == 7
+            assert reported == [3, 6, 7]
+            assert signalled == [3, 3, 1]
+            assert len(counter.inserts) == 3
+
+            products = await Product.objects.select_related("category").all()
+            assert len(products) == 7
+            assert {p.category.name for p in products} == {"Toys"}
+            assert {p.rating for p in products} == {1, 5}
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_stream_async_progress_and_empty():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            category = await Category.objects.create(name="Books")
+            reported = []
+
+            async def report(count: int) -> None:
+                reported.append(count)
+
+            inserted = await Product.objects.bulk_create_stream(
+                generate_products(4, category), batch_size=2, progress=report
+            )
+            assert inserted == 4
+            assert reported == [2, 4]
+
+            inserted = await Product.objects.bulk_create_stream(
+                generate_products(0, category)
+            )
+            assert inserted == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_stream_validates_dicts():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+
+            async def invalid() -> AsyncIterator[dict]:
+                yield {"name": "ok"}
+                yield {"name": "wrong", "rating": "not a number"}
+
+            with pytest.raises(pydantic.ValidationError):
+                await Product.objects.bulk_create_stream(invalid())
+
+            with pytest.raises(QueryDefinitionError):
+                await Product.objects.bulk_create_stream(invalid(), batch_size=0)
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_with_batch_size():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            products = [Product(name=f"p{i}") for i in range(5)]
+            with StatementCounter(base_ormar_config) as counter:
+                await Product.objects.bulk_create(products, batch_size=2)
+            assert len(counter.inserts) == 3
+            assert all(product.saved for product in products)
+            assert await Product.objects.count() == 5
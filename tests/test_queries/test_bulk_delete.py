@@ -0,0 +1,121 @@
+from typing import Optional
+
+import pytest
+
+import ormar
+from ormar.exceptions import (
+    ModelListEmptyError,
+    ModelPersistenceError,
+    QueryDefinitionError,
+)
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Category(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="bulk_delete_categories")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Item(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="bulk_delete_items")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    category: Optional[Category] = ormar.ForeignKey(Category)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_instances_in_chunks():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await Item.objects.bulk_create([Item(name=f"item{i}") for i in range(7)])
+            items = await Item.objects.all()
+
+            with StatementCounter(base_ormar_config) as counter:
+                deleted = await Item.objects.bulk_delete(items[:5], batch_size=2)
+            assert deleted == 5
+            assert len(counter.deletes) == 3
+            assert all(not item.saved for item in items[:5])
+            assert await Item.objects.count() == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_pks_and_mixed():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await Item.objects.bulk_create([Item(name=f"item{i}") for i in range(4)])
+            items = await Item.objects.order_by("id").all()
+
+            deleted = await Item.objects.bulk_delete([items[0].pk, items[1]])
+            assert deleted == 2
+            assert not items[1].saved
+            remaining = await Item.objects.values_list("name", flatten=True)
+            assert sorted(remaining) == ["item2", "item3"]
+
+            assert await Item.objects.bulk_delete([9999]) == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_removes_from_parent_relation():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            category = await Category.objects.create(name="Tools")
+            hammer = await Item.objects.create(name="hammer", category=category)
+            saw = await Item.objects.create(name="saw", category=category)
+            assert len(category.items) == 2
+
+            await Item.objects.bulk_delete([hammer])
+            assert category.items == [saw]
+            assert hammer.category == category
+
+            category = await Category.objects.select_related("items").get()
+            assert [item.name for item in category.items] == ["saw"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_sends_one_signal():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            received = []
+
+            @ormar.post_bulk_delete(Item)
+            async def after_bulk_delete(sender, instances, pks, **kwargs):
+                received.append((sender, list(instances), list(pks)))
+
+            @ormar.post_delete(Item)
+            async def after_delete(sender, instance, **kwargs):  # pragma: no cover
+                received.append(instance)
+
+            try:
+                items = [await Item.objects.create(name=f"i{x}") for x in range(3)]
+                await Item.objects.bulk_delete(items, batch_size=1)
+            finally:
+                Item.ormar_config.signals.post_bulk_delete.disconnect(after_bulk_delete)
+                Item.ormar_config.signals.post_delete.disconnect(after_delete)
+
+            assert len(received) == 1
+            sender, instances, pks = received[0]
+            assert sender == Item
+            assert instances == items
+            assert pks == [item.pk for item in items]
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_errors():
+    async with base_ormar_config.database:
+        with pytest.raises(ModelListEmptyError):
+            await Item.objects.bulk_delete([])
+
+        with pytest.raises(ModelPersistenceError):
+            await Item.objects.bulk_delete([Item(name="unsaved")])
+
+        with pytest.raises(QueryDefinitionError):
+            await Item.objects.bulk_delete([1], batch_size=0)
@@ -0,0 +1,90 @@
+from typing import Optional
+
+import pytest
+import pytest_asyncio
+
+import ormar
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Shelf(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="ce_shelves")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Volume(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="ce_volumes")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    shelf: Optional[Shelf] = ormar.ForeignKey(Shelf, related_name="volumes")
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest_asyncio.fixture()
+async def shelves():
+    async with base_ormar_config.database:
+        top = await Shelf.objects.create(name="top")
+        await Shelf.objects.create(name="bottom")
+        for title in ("a", "b", "c"):
+            await Volume.objects.create(title=title, shelf=top)
+        yield
+        await Volume.objects.delete(each=True)
+        await Shelf.objects.delete(each=True)
+
+
+@pytest.mark.asyncio
+async def test_count_selects_only_what_is_needed(shelves):
+    with StatementCounter(base_ormar_config) as counter:
+        assert await Volume.objects.count() == 3
+        assert await Volume.objects.select_related("shelf").count() == 3
+        assert await Volume.objects.filter(shelf__name="top").count() == 3
+    for statement in counter.selects:
+        assert "count(*)" in statement
+        assert "DISTINCT" not in statement
+        assert "ORDER BY" not in statement
+        assert "subquery" not in statement
+        assert "ce_volumes.title" not in statement
+
+    with StatementCounter(base_ormar_config) as counter:
+        assert await Shelf.objects.select_related("volumes").count() == 2
+        assert await Shelf.objects.select_related("volumes").count(distinct=False) == 4
+        assert await Shelf.objects.filter(volumes__title__in=["a", "b"]).count() == 1
+    distinct, not_distinct, filtered = counter.selects
+    assert "count(DISTINCT ce_shelves.id)" in distinct
+    assert "count(*)" in not_distinct
+    assert "count(DISTINCT ce_shelves.id)" in filtered
+    assert all("ORDER BY" not in statement for statement in counter.selects)
+
+
+@pytest.mark.asyncio
+async def test_count_and_exists_respect_pagination(shelves):
+    assert await Volume.objects.limit(2).count() == 2
+    assert await Volume.objects.offset(2).count() == 1
+    assert await Shelf.objects.select_related("volumes").limit(1).count() == 1
+    assert (
+        await Shelf.objects.select_related("volumes")
+        .order_by("id")
+        .limit(1)
+        .count(distinct=False)
+        == 3
+    )
+    assert await Volume.objects.offset(2).exists()
+    assert not await Volume.objects.offset(3).exists()
+
+    with StatementCounter(base_ormar_config) as counter:
+        assert await Volume.objects.filter(title="a").exists()
+        assert not await Volume.objects.filter(title="z").exists()
+        assert await Shelf.objects.select_related("volumes").exists()
+    for statement in counter.selects:
+        assert statement.startswith("SELECT 1")
+        assert "LIMIT" in statement
+        assert "ORDER BY" not in statement
+        assert "EXISTS" not in statement
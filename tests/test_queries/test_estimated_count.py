@@ -0,0 +1,117 @@
+import asyncio
+from typing import Optional
+
+import pytest
+import pytest_asyncio
+import sqlalchemy
+
+import ormar
+from ormar.exceptions import QueryDefinitionError
+from ormar.queryset.queries.estimate_query import is_timeout_error
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Shelf(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="ec_shelves")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Volume(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="ec_volumes")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    shelf: Optional[Shelf] = ormar.ForeignKey(Shelf, related_name="volumes")
+
+
+create_test_database = init_tests(base_ormar_config)
+
+_IS_SQLITE = "sqlite" in base_ormar_config.database.url
+
+
+@pytest_asyncio.fixture()
+async def shelves():
+    async with base_ormar_config.database:
+        top = await Shelf.objects.create(name="top")
+        await Shelf.objects.create(name="bottom")
+        for title in ("a", "b", "c"):
+            await Volume.objects.create(title=title, shelf=top)
+        yield
+        await Volume.objects.delete(each=True)
+        await Shelf.objects.delete(each=True)
+
+
+async def analyze() -> None:
+    async with base_ormar_config.database.get_query_executor() as executor:
+        await executor.execute(sqlalchemy.text("ANALYZE"))
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not _IS_SQLITE, reason="other databases return estimates")
+async def test_estimated_count_without_statistics_is_exact(shelves):
+    assert await Volume.objects.estimated_count() == 3
+    assert await Volume.objects.filter(title__in=["a", "b"]).estimated_count() == 2
+    assert await Shelf.objects.select_related("volumes").estimated_count() == 2
+    assert await Volume.objects.limit(2).estimated_count() == 2
+    shelf = await Shelf.objects.get(name="top")
+    assert await shelf.volumes.estimated_count() == 3
+
+    queryset = Volume.objects.order_by("id")
+    await queryset
+    with StatementCounter(base_ormar_config) as counter:
+        assert await queryset.estimated_count() == 3
+    assert counter.selects == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not _IS_SQLITE, reason="reads sqlite_stat1 statistics")
+async def test_estimated_count_uses_table_statistics(shelves):
+    await analyze()
+    shelf = await Shelf.objects.get(name="top")
+    await Volume.objects.create(title="d", shelf=shelf)
+
+    with StatementCounter(base_ormar_config) as counter:
+        assert await Volume.objects.estimated_count() == 3
+        assert await Volume.objects.offset(1).estimated_count() == 2
+        assert await Volume.objects.limit(1).estimated_count() == 1
+    assert all("ec_volumes.id" not in statement for statement in counter.selects)
+    assert await Volume.objects.count() == 4
+    assert await Volume.objects.filter(title__in=["a", "d"]).estimated_count() == 2
+
+
+@pytest.mark.asyncio
+async def test_estimated_count_exact_fallback_is_capped(shelves, monkeypatch):
+    async def slow_count(self, distinct: bool = True) -> int:
+        await asyncio.sleep(1)
+        return 0
+
+    monkeypatch.setattr(ormar.QuerySet, "count", slow_count)
+    queryset = Volume.objects.filter(title="a")
+    if _IS_SQLITE:
+        assert await queryset.estimated_count(timeout=0.01) is None
+        assert await queryset.estimated_count(timeout=None) == 0
+    else:  # pragma: no cover
+        assert await queryset.estimated_count(timeout=0.01) is not None
+
+
+@pytest.mark.asyncio
+async def test_estimated_count_of_grouped_queryset_raises(shelves):
+    with pytest.raises(QueryDefinitionError):
+        await Volume.objects.group_by("shelf").estimated_count()
+
+
+def test_server_side_timeout_errors_are_recognized():
+    class QueryCanceledError(Exception):
+        sqlstate = "57014"
+
+    def wrap(original: Exception) -> sqlalchemy.exc.DBAPIError:
+        return sqlalchemy.exc.DBAPIError("SELECT 1", {}, original)
+
+    assert is_timeout_error(wrap(QueryCanceledError()))
+    assert is_timeout_error(wrap(Exception(3024, "maximum execution time exceeded")))
+    assert not is_timeout_error(wrap(Exception(1062, "Duplicate entry")))
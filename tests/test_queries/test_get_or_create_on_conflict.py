@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+import sqlalchemy
+
+import ormar
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Tag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="conflict_tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100, unique=True, name="tag_name")
+    color: str = ormar.String(max_length=20, default="red")
+
+
+class Slot(ormar.Model):
+    ormar_config = base_ormar_config.copy(
+        tablename="conflict_slots",
+        constraints=[ormar.UniqueColumns("day", "hour")],
+    )
+
+    id: int = ormar.Integer(primary_key=True)
+    day: int = ormar.Integer()
+    hour: int = ormar.Integer()
+    label: str = ormar.String(max_length=100, default="")
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+def supports_conflict_clause() -> bool:
+    dialect = base_ormar_config.database.dialect
+    return dialect.name in ("postgresql", "sqlite") and dialect.insert_returning
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_by_unique_field():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            with StatementCounter(base_ormar_config) as counter:
+                tag, created = await Tag.objects.get_or_create(
+                    name="python", _defaults={"color": "blue"}
+                )
+            assert created
+            assert tag.saved
+            assert tag.id is not None
+            assert tag.color == "blue"
+            if supports_conflict_clause():
+                assert len(counter.statements) == 1
+                assert "ON CONFLICT" in counter.statements[0]
+
+            with StatementCounter(base_ormar_config) as counter:
+                same, created = await Tag.objects.get_or_create(
+                    name="python", _defaults={"color": "green"}
+                )
+            assert not created
+            assert same.id == tag.id
+            assert same.color == "blue"
+            if supports_conflict_clause():
+                assert len(counter.statements) == 2
+            assert await Tag.objects.count() == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_by_pk_and_unique_columns():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            tag, created = await Tag.objects.get_or_create(pk=10, name="rust")
+            assert created
+            assert tag.id == 10
+            tag, created = await Tag.objects.get_or_create(pk=10, name="rust")
+            assert not created
+            assert tag.id == 10
+
+            slot, created = await Slot.objects.get_or_create(
+                day=1, hour=9, _defaults={"label": "standup"}
+            )
+            assert created
+            slot2, created = await Slot.objects.get_or_create(day=1, hour=9)
+            assert not created
+            assert slot2.id == slot.id
+            assert slot2.label == "standup"
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_conflict_not_matching_other_criteria():
+    async with base_ormar_config.database:
+        await Tag.objects.create(name="go", color="cyan")
+        try:
+            with StatementCounter(base_ormar_config) as counter:
+                with pytest.raises(sqlalchemy.exc.IntegrityError):
+                    await Tag.objects.get_or_create(name="go", color="blue")
+            assert all("ON CONFLICT" not in s for s in counter.statements)
+            assert await Tag.objects.count() == 1
+        finally:
+            await Tag.objects.delete(each=True)
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_without_unique_lookup_uses_select():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await Slot.objects.create(day=2, hour=10, label="lunch")
+            with StatementCounter(base_ormar_config) as counter:
+                slot, created = await Slot.objects.get_or_create(label="lunch")
+            assert not created
+            assert slot.hour == 10
+            assert all("ON CONFLICT" not in s for s in counter.statements)
+
+            slot, created = await Slot.objects.filter(day=3).get_or_create(
+                hour=11, _defaults={"day": 3}
+            )
+            assert created
+            assert slot.day == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_or_create_returns_one_row():
+    async with base_ormar_config.database:
+        try:
+            results = await asyncio.gather(
+                *[Tag.objects.get_or_create(name="shared") for _ in range(5)]
+            )
+            assert len({tag.id for tag, _ in results}) == 1
+            if supports_conflict_clause():
+                assert sum(created for _, created in results) == 1
+            assert await Tag.objects.count() == 1
+        finally:
+            await Tag.objects.delete(each=True)
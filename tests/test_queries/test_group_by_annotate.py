@@ -0,0 +1,185 @@
+from typing import Optional
+
+import pytest
+import pytest_asyncio
+
+import ormar
+from ormar.exceptions import QueryDefinitionError
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Category(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="ga_categories")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Product(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="ga_products")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    price: float = ormar.Float()
+    color: str = ormar.String(max_length=20)
+    category: Optional[Category] = ormar.ForeignKey(Category, related_name="products")
+
+
+class Review(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="ga_reviews")
+
+    id: int = ormar.Integer(primary_key=True)
+    stars: int = ormar.Integer()
+    product: Optional[Product] = ormar.ForeignKey(Product, related_name="reviews")
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest_asyncio.fixture()
+async def products():
+    async with base_ormar_config.database:
+        tools = await Category.objects.create(name="Tools")
+        toys = await Category.objects.create(name="Toys")
+        hammer = await Product.objects.create(
+            name="Hammer", price=10.0, color="red", category=tools
+        )
+        await Product.objects.create(
+            name="Saw", price=30.0, color="blue", category=tools
+        )
+        await Product.objects.create(name="Ball", price=5.0, color="red", category=toys)
+        await Review.objects.create(stars=5, product=hammer)
+        await Review.objects.create(stars=3, product=hammer)
+        yield
+        await Review.objects.delete(each=True)
+        await Product.objects.delete(each=True)
+        await Category.objects.delete(each=True)
+
+
+@pytest.mark.asyncio
+async def test_group_by_computes_aggregates_in_one_query(products):
+    with StatementCounter(base_ormar_config) as counter:
+        rows = (
+            await Product.objects.group_by("color")
+            .annotate(
+                total=ormar.Sum("price"),
+                n=ormar.Count("id"),
+                cheapest=ormar.Min("price"),
+                priciest=ormar.Max("price"),
+                average=ormar.Avg("price"),
+            )
+            .order_by("color")
+            .values()
+        )
+    assert len(counter.selects) == 1
+    assert "GROUP BY" in counter.selects[0]
+    assert rows == [
+        {
+            "color": "blue",
+            "total": 30.0,
+            "n": 1,
+            "cheapest": 30.0,
+            "priciest": 30.0,
+            "average": 30.0,
+        },
+        {
+            "color": "red",
+            "total": 15.0,
+            "n": 2,
+            "cheapest": 5.0,
+            "priciest": 10.0,
+            "average": 7.5,
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_group_by_related_fields_with_having_and_ordering(products):
+    rows = (
+        await Product.objects.filter(price__gt=1)
+        .group_by("category__name")
+        .annotate(total=ormar.Sum("price"), n=ormar.Count("pk"))
+        .order_by("-total")
+        .values()
+    )
+    assert rows == [
+        {"category__name": "Tools", "total": 40.0, "n": 2},
+        {"category__name": "Toys", "total": 5.0, "n": 1},
+    ]
+
+    names = (
+        await Product.objects.group_by("category__name")
+        .annotate(total=ormar.Sum("price"), having={"total__gte": 10})
+        .values_list()
+    )
+    assert names == [("Tools", 40.0)]
+
+    reviews = (
+        await Category.objects.group_by("name")
+        .annotate(
+            reviews=ormar.Count("products__reviews"),
+            stars=ormar.Sum("products__reviews__stars"),
+            colors=ormar.Count("products__color", distinct=True),
+        )
+        .order_by("name")
+        .values()
+    )
+    assert reviews == [
+        {"name": "Tools", "reviews": 2, "stars": 8, "colors": 2},
+        {"name": "Toys", "reviews": 0, "stars": None, "colors": 1},
+    ]
+
+    tools = await Category.objects.get(name="Tools")
+    colors = (
+        await tools.products.group_by("color")
+        .annotate(n=ormar.Count("id"))
+        .order_by("color")
+        .values_list()
+    )
+    assert colors == [("blue", 1), ("red", 1)]
+    flat = (
+        await Product.objects.group_by("color")
+        .order_by("color")
+        .values_list(flatten=True)
+    )
+    assert flat == ["blue", "red"]
+
+
+@pytest.mark.asyncio
+async def test_invalid_group_by_definitions_raise(products):
+    with pytest.raises(QueryDefinitionError):
+        await Product.objects.annotate(total=ormar.Sum("price")).values()
+    with pytest.raises(QueryDefinitionError):
+        await (
+            Product.objects.group_by("color").annotate(total=ormar.Sum("name")).values()
+        )
+    with pytest.raises(QueryDefinitionError):
+        await Product.objects.group_by("colour").values()
+    with pytest.raises(QueryDefinitionError):
+        Product.objects.group_by("color").annotate(total="price")
+    with pytest.raises(QueryDefinitionError):
+        Product.objects.group_by("color").annotate(price=ormar.Sum("price"))
+    for name in ("save", "pk", "update", "ormar_config"):
+        with pytest.raises(QueryDefinitionError):
+            Product.objects.group_by("color").annotate(**{name: ormar.Count("id")})
+    with pytest.raises(QueryDefinitionError):
+        await (
+            Product.objects.group_by("color")
+            .annotate(n=ormar.Count("id"), having={"color": "red"})
+            .values()
+        )
+    with pytest.raises(QueryDefinitionError):
+        await (
+            Product.objects.group_by("color")
+            .annotate(n=ormar.Count("id"), having={"n__contains": 1})
+            .values()
+        )
+    with pytest.raises(QueryDefinitionError):
+        await Product.objects.group_by("color").all()
+    with pytest.raises(QueryDefinitionError):
+        await Product.objects.group_by("color").values(["name"])
+    with pytest.raises(QueryDefinitionError):
+        Product.objects.group_by()
@@ -0,0 +1,109 @@
+import asyncio
+from typing import Optional
+
+import pytest
+import pytest_asyncio
+
+import ormar
+from ormar.exceptions import NoMatch, QueryDefinitionError
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Publisher(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="ib_publishers")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Book(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="ib_books")
+
+    id: int = ormar.Integer(primary_key=True)
+    isbn: str = ormar.String(max_length=20, unique=True)
+    title: str = ormar.String(max_length=100)
+    publisher: Optional[Publisher] = ormar.ForeignKey(Publisher)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest_asyncio.fixture()
+async def books():
+    async with base_ormar_config.database:
+        publisher = await Publisher.objects.create(name="Penguin")
+        await Book.objects.bulk_create(
+            [
+                Book(isbn=f"isbn-{i}", title=f"book {i}", publisher=publisher)
+                for i in range(10)
+            ]
+        )
+        yield await Book.objects.order_by("id").all()
+        await Book.objects.delete(each=True)
+        await Publisher.objects.delete(each=True)
+
+
+@pytest.mark.asyncio
+async def test_in_bulk_loads_models_by_pk_and_unique_field(books):
+    pks = [book.pk for book in books]
+    with StatementCounter(base_ormar_config) as counter:
+        loaded = await Book.objects.select_related("publisher").in_bulk(
+            pks + [pks[0], 999], batch_size=4
+        )
+    assert len(counter.selects) == 3
+    assert sorted(loaded) == sorted(pks)
+    assert loaded[pks[3]].title == "book 3"
+    assert loaded[pks[3]].publisher.name == "Penguin"
+
+    by_isbn = await Book.objects.filter(title__endswith="1").in_bulk(
+        ["isbn-1", "isbn-2"], field="isbn"
+    )
+    assert list(by_isbn) == ["isbn-1"]
+    assert await Book.objects.in_bulk([]) == {}
+
+    with pytest.raises(QueryDefinitionError):
+        await Book.objects.in_bulk(["book 1"], field="title")
+    with pytest.raises(QueryDefinitionError):
+        await Book.objects.in_bulk([1], field="publisher")
+    with pytest.raises(QueryDefinitionError):
+        await Book.objects.limit(2).in_bulk([1])
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_coalesces_concurrent_loads(books):
+    loader = Book.objects.batch_loader()
+    pks = [book.pk for book in books]
+    with StatementCounter(base_ormar_config) as counter:
+        loaded = await asyncio.gather(
+            *[loader.load(pk) for pk in pks],
+            loader.load(pks[0]),
+            loader.load_or_none(999),
+        )
+    assert len(counter.selects) == 1
+    assert loader.batches == 1
+    assert [book.pk for book in loaded[:10]] == pks
+    assert loaded[10] is loaded[0]
+    assert loaded[11] is None
+
+    with pytest.raises(NoMatch):
+        await loader.load(999)
+
+    delayed = Book.objects.batch_loader(field="isbn", delay=0.01)
+
+    async def load_later(isbn: str) -> Book:
+        await asyncio.sleep(0.001)
+        return await delayed.load(isbn)
+
+    with StatementCounter(base_ormar_config) as counter:
+        first, second = await asyncio.gather(
+            delayed.load("isbn-1"), load_later("isbn-2")
+        )
+    assert len(counter.selects) == 1
+    assert (first.title, second.title) == ("book 1", "book 2")
+
+    async with base_ormar_config.database.transaction():
+        assert (await loader.load(pks[1])).title == "book 1"
+    assert loader.batches == 2
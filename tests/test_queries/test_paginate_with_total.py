@@ -0,0 +1,117 @@
+from typing import Optional
+
+import pytest
+import pytest_asyncio
+
+import ormar
+from ormar.exceptions import QueryDefinitionError
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Shelf(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="pt_shelves")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Volume(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="pt_volumes")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    shelf: Optional[Shelf] = ormar.ForeignKey(Shelf, related_name="volumes")
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest_asyncio.fixture()
+async def shelves():
+    async with base_ormar_config.database:
+        top = await Shelf.objects.create(name="top")
+        middle = await Shelf.objects.create(name="middle")
+        await Shelf.objects.create(name="bottom")
+        for title in ("a", "b", "c", "d", "e"):
+            await Volume.objects.create(title=title, shelf=top)
+        await Volume.objects.create(title="f", shelf=middle)
+        yield
+        await Volume.objects.delete(each=True)
+        await Shelf.objects.delete(each=True)
+
+
+@pytest.mark.asyncio
+async def test_page_and_total_are_fetched_in_one_query(shelves):
+    with StatementCounter(base_ormar_config) as counter:
+        volumes, total = await Volume.objects.order_by("title").paginate_with_total(
+            page=2, page_size=2
+        )
+    assert [volume.title for volume in volumes] == ["c", "d"]
+    assert total == 6
+    assert len(counter.selects) == 1
+    assert "OVER ()" in counter.selects[0]
+
+    volumes, total = await Volume.objects.filter(
+        title__in=["a", "b", "f"]
+    ).paginate_with_total(page=1, page_size=10)
+    assert len(volumes) == 3
+    assert total == 3
+
+
+@pytest.mark.asyncio
+async def test_total_counts_models_with_select_related_limit_subquery(shelves):
+    with StatementCounter(base_ormar_config) as counter:
+        loaded, total = (
+            await Shelf.objects.select_related("volumes")
+            .order_by("name")
+            .paginate_with_total(page=1, page_size=2)
+        )
+    assert [shelf.name for shelf in loaded] == ["bottom", "middle"]
+    assert [len(shelf.volumes) for shelf in loaded] == [0, 1]
+    assert total == 3
+    assert len(counter.selects) == 1
+
+    loaded, total = await Shelf.objects.filter(
+        volumes__title__in=["a", "b", "f"]
+    ).paginate_with_total(page=2, page_size=1)
+    assert [shelf.name for shelf in loaded] == ["middle"]
+    assert total == 2
+
+    top = await Shelf.objects.get(name="top")
+    volumes, total = await top.volumes.order_by("-title").paginate_with_total(
+        page=1, page_size=2
+    )
+    assert [volume.title for volume in volumes] == ["e", "d"]
+    assert total == 5
+
+
+@pytest.mark.asyncio
+async def test_total_of_empty_and_past_last_pages(shelves):
+    with StatementCounter(base_ormar_config) as counter:
+        assert await Volume.objects.filter(title="z").paginate_with_total(1) == ([], 0)
+    assert len(counter.selects) == 1
+
+    with StatementCounter(base_ormar_config) as counter:
+        volumes, total = await Volume.objects.limit(1).paginate_with_total(
+            page=5, page_size=2
+        )
+    assert volumes == []
+    assert total == 6
+    assert len(counter.selects) == 2
+
+    with pytest.raises(QueryDefinitionError):
+        await Volume.objects.paginate_with_total(page=0)
+
+
+@pytest.mark.asyncio
+async def test_total_counts_models_with_raw_sql_limit_and_joined_children(shelves):
+    queryset = Shelf.objects.select_related("volumes").order_by("name")
+    assert await queryset.count() == 3
+    loaded, total = await queryset.limit(2, limit_raw_sql=True).paginate_with_total(
+        page=1, page_size=2
+    )
+    assert [shelf.name for shelf in loaded] == ["bottom", "middle"]
+    assert total == 3
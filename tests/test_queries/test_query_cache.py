@@ -0,0 +1,167 @@
+import time
+from typing import Optional
+
+import pytest
+import pytest_asyncio
+
+import ormar
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import ASYNC_DATABASE_URL, create_config
+
+base_ormar_config = create_config()
+
+
+class Category(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="qc_categories")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Product(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="qc_products")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    price: int = ormar.Integer(default=0)
+    category: Optional[Category] = ormar.ForeignKey(Category)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest_asyncio.fixture()
+async def products():
+    async with base_ormar_config.database:
+        food = await Category.objects.create(name="food")
+        await Product.objects.bulk_create(
+            [Product(name=f"product{i}", price=i, category=food) for i in range(5)]
+        )
+        yield food
+        await Product.objects.delete(each=True)
+        await Category.objects.delete(each=True)
+
+
+def listing() -> ormar.QuerySet:
+    return (
+        Product.objects.select_related("category")
+        .filter(price__gte=1)
+        .order_by("-price")
+        .limit(3)
+        .cache(ttl=60)
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_queryset_reads_rows_once(products):
+    with StatementCounter(base_ormar_config) as counter:
+        first = await listing().all()
+        second = await listing().all()
+        values = await listing().values(["name", "category__name"])
+        values_again = await listing().values(["name", "category__name"])
+        one = await Product.objects.cache().get(name="product1")
+        await Product.objects.cache().get(name="product1")
+        await Product.objects.cache().first()
+        await Product.objects.cache().first()
+    assert len(counter.selects) == 4
+    assert [product.name for product in second] == ["product4", "product3", "product2"]
+    assert [product.name for product in first] == [product.name for product in second]
+    assert first[0] is not second[0]
+    assert second[0].category.name == "food"
+    assert values == values_again
+    assert values[0] == {"name": "product4", "category__name": "food"}
+    assert one.price == 1
+
+    stats = base_ormar_config.database.get_query_cache().stats
+    assert stats["hits"] >= 4
+
+    with StatementCounter(base_ormar_config) as counter:
+        await listing().filter(price__gte=2).all()
+        await Product.objects.filter(price__gte=1).all()
+    assert len(counter.selects) == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_cached_queries(products):
+    food = products
+    await listing().all()
+
+    product = await Product.objects.get(name="product4")
+    await product.update(price=40)
+    assert (await listing().all())[0].price == 40
+
+    await Category.objects.filter(pk=food.pk).update(name="snacks")
+    assert (await listing().all())[0].category.name == "snacks"
+
+    await Product.objects.bulk_create([Product(name="new", price=100)])
+    assert (await listing().all())[0].name == "new"
+
+    new = await Product.objects.get(name="new")
+    new.name = "renamed"
+    await Product.objects.bulk_update([new], columns=["name"])
+    assert (await listing().all())[0].name == "renamed"
+    await Product.objects.cache().get(pk=new.pk)
+    new.name = "new"
+    await Product.objects.bulk_update([new], columns=["name"])
+    assert (await Product.objects.cache().get(pk=new.pk)).name == "new"
+
+    await Product.objects.filter(name="new").delete()
+    assert (await listing().all())[0].name == "product4"
+
+    async with base_ormar_config.database.transaction():
+        await Product.objects.filter(name="product4").update(price=0)
+        with StatementCounter(base_ormar_config) as counter:
+            rows = await listing().all()
+        assert len(counter.selects) == 1
+        assert rows[0].name == "product3"
+
+    with StatementCounter(base_ormar_config) as counter:
+        rows = await listing().all()
+    assert len(counter.selects) == 1
+    assert rows[0].name == "product3"
+
+
+@pytest.mark.asyncio
+async def test_cached_query_expires_after_ttl(products):
+    await Product.objects.filter(price__lt=3).cache(ttl=0.05).all()
+    with StatementCounter(base_ormar_config) as counter:
+        await Product.objects.filter(price__lt=3).cache(ttl=0.05).all()
+        time.sleep(0.06)
+        await Product.objects.filter(price__lt=3).cache(ttl=0.05).all()
+    assert len(counter.selects) == 1
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "cache.db")
+    worker1 = ormar.SQLiteQueryCache(path)
+    worker2 = ormar.SQLiteQueryCache(path)
+
+    versions = await worker1.get_versions(["products"])
+    assert versions == {"products": 0}
+    await worker1.set("key", (versions, [{"id": 1}]), ttl=60)
+    assert await worker2.get("key") == ({"products": 0}, [{"id": 1}])
+
+    await worker2.bump_versions(["products"])
+    assert await worker1.get_versions(["products", "other"]) == {
+        "products": 1,
+        "other": 0,
+    }
+
+    await worker1.set("expired", "value", ttl=-1)
+    assert await worker2.get("expired") is None
+    await worker2.clear()
+    assert await worker1.get("key") is None
+
+
+def test_default_query_cache_is_created_on_first_use():
+    database = ormar.DatabaseConnection(ASYNC_DATABASE_URL)
+    assert database.query_cache is None
+    cache = database.get_query_cache()
+    assert isinstance(cache, ormar.InMemoryQueryCache)
+    assert database.get_query_cache() is cache
+
+
+def test_query_cache_backend_is_abstract():
+    with pytest.raises(TypeError):
+        ormar.QueryCacheBackend()  # type: ignore
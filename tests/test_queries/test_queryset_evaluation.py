@@ -0,0 +1,119 @@
+import pytest
+import pytest_asyncio
+
+import ormar
+from ormar.exceptions import QueryDefinitionError
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Planet(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="qe_planets")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+    moons: int = ormar.Integer(default=0)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest_asyncio.fixture()
+async def planets():
+    async with base_ormar_config.database:
+        await Planet.objects.bulk_create(
+            [
+                Planet(name=name, moons=moons)
+                for name, moons in (("Mercury", 0), ("Earth", 1), ("Mars", 2))
+            ]
+            + [Planet(name="Jupiter", moons=95), Planet(name="Saturn", moons=146)]
+        )
+        yield
+        await Planet.objects.delete(each=True)
+
+
+@pytest.mark.asyncio
+async def test_awaited_queryset_answers_from_evaluated_results(planets):
+    queryset = Planet.objects.order_by("id")
+    with StatementCounter(base_ormar_config) as counter:
+        evaluated = await queryset
+        assert [planet.name for planet in evaluated] == [
+            "Mercury",
+            "Earth",
+            "Mars",
+            "Jupiter",
+            "Saturn",
+        ]
+        assert (await queryset)[0] is evaluated[0]
+        assert await queryset.all() == evaluated
+        assert await queryset.count() == 5
+        assert await queryset.exists()
+        assert [planet.name for planet in await queryset[1:3]] == ["Earth", "Mars"]
+        assert [planet.name for planet in await queryset[-2:]] == [
+            "Jupiter",
+            "Saturn",
+        ]
+        assert [planet.name for planet in await queryset[-1]] == ["Saturn"]
+        assert [planet.name for planet in await queryset[2].all()] == ["Mars"]
+    assert len(counter.selects) == 1
+
+    with pytest.raises(QueryDefinitionError):
+        queryset[:-1]
+
+
+@pytest.mark.asyncio
+async def test_derived_querysets_are_not_evaluated(planets):
+    queryset = Planet.objects.order_by("id")
+    await queryset
+    with StatementCounter(base_ormar_config) as counter:
+        filtered = await queryset.filter(moons__gt=1)
+        assert [planet.name for planet in filtered] == ["Mars", "Jupiter", "Saturn"]
+        assert await queryset.count(distinct=False) == 5
+        assert [planet.name for planet in await queryset[1:3][:1]] == ["Mercury"]
+    assert len(counter.selects) == 3
+
+    empty = Planet.objects.filter(moons__gt=1000)
+    assert await empty == []
+    assert not await empty.exists()
+    assert await empty.count() == 0
+
+    await Planet.objects.create(name="Neptune", moons=16)
+    assert await queryset.count() == 5
+    assert await Planet.objects.count() == 6
+
+    await queryset.filter(name="Neptune").delete()
+    await queryset.update(each=True, moons=0)
+    assert await queryset.count() == 5
+    assert all(planet.moons == 0 for planet in await queryset)
+
+
+@pytest.mark.asyncio
+async def test_writes_through_queryset_discard_evaluated_results(planets):
+    queryset = Planet.objects.order_by("id")
+    await queryset
+    neptune = await queryset.create(name="Neptune", moons=16)
+    assert await queryset.count() == 6
+
+    await queryset
+    await queryset.bulk_create([Planet(name="Uranus", moons=28)])
+    assert [planet.name for planet in await queryset][-1] == "Uranus"
+
+    await queryset
+    neptune.moons = 14
+    await queryset.bulk_update([neptune], columns=["moons"])
+    assert (await queryset.all())[-2].moons == 14
+
+    await queryset
+    await queryset.bulk_delete([neptune])
+    assert await queryset.count() == 6
+
+    await queryset
+    await queryset.update_or_create(pk=neptune.pk, name="Neptune", moons=16)
+    assert await queryset.count() == 7
+
+    empty = Planet.objects.filter(name="Pluto")
+    assert not await empty.exists()
+    await empty.get_or_create(name="Pluto")
+    assert await empty.exists()
@@ -0,0 +1,125 @@
+import asyncio
+from typing import Optional
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+import ormar
+from ormar.databases.request_cache import get_request_cache
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Author(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="rc_authors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Post(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="rc_posts")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    author: Optional[Author] = ormar.ForeignKey(Author)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest_asyncio.fixture()
+async def author():
+    async with base_ormar_config.database:
+        author = await Author.objects.create(name="Ann")
+        await Post.objects.create(title="first", author=author)
+        await Post.objects.create(title="second", author=author)
+        yield author
+        await Post.objects.delete(each=True)
+        await Author.objects.delete(each=True)
+
+
+@pytest.mark.asyncio
+async def test_queries_in_scope_are_memoized(author):
+    with ormar.request_cache() as cache:
+        with StatementCounter(base_ormar_config) as counter:
+            first = await Author.objects.get(pk=author.pk)
+            second = await Author.objects.get(pk=author.pk)
+            posts = await Post.objects.select_related("author").all()
+            again = await Post.objects.select_related("author").all()
+            await Author.objects.prefetch_related("posts").all()
+            await Author.objects.prefetch_related("posts").all()
+            await asyncio.gather(*[Author.objects.all() for _ in range(2)])
+        assert len(counter.selects) == 4
+        assert first is not second
+        assert first == second
+        assert [post.title for post in again] == [post.title for post in posts]
+        assert cache.hits >= 3
+
+        with ormar.request_cache() as nested:
+            assert nested is cache
+
+    assert get_request_cache() is None
+    assert len(cache) == 0
+    with StatementCounter(base_ormar_config) as counter:
+        await Author.objects.get(pk=author.pk)
+        await Author.objects.get(pk=author.pk)
+    assert len(counter.selects) == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_in_scope_invalidate_memoized_rows(author):
+    with ormar.request_cache():
+        assert (await Author.objects.get(pk=author.pk)).name == "Ann"
+        await Post.objects.all()
+
+        await Author.objects.filter(pk=author.pk).update(name="Bob")
+        with StatementCounter(base_ormar_config) as counter:
+            assert (await Author.objects.get(pk=author.pk)).name == "Bob"
+            await Post.objects.all()
+        assert len(counter.selects) == 1
+
+        posts = await Post.objects.select_related("author").all()
+        await posts[0].update(title="changed")
+        titles = [post.title for post in await Post.objects.order_by("id").all()]
+        assert titles == ["changed", "second"]
+
+        bob = await Author.objects.get(pk=author.pk)
+        bob.name = "Bobby"
+        await Author.objects.bulk_update([bob], columns=["name"])
+        assert (await Author.objects.get(pk=author.pk)).name == "Bobby"
+
+        async with base_ormar_config.database.transaction():
+            with StatementCounter(base_ormar_config) as counter:
+                await Author.objects.get(pk=author.pk)
+                await Author.objects.get(pk=author.pk)
+            assert len(counter.selects) == 2
+            await Author.objects.create(name="Cecil")
+        assert await Author.objects.count() == 2
+
+
+@pytest.mark.asyncio
+async def test_middleware_opens_scope_per_request(author):
+    app = FastAPI()
+    app.add_middleware(ormar.RequestCacheMiddleware)
+
+    @app.get("/authors/{author_id}")
+    async def get_author(author_id: int) -> dict:
+        await Author.objects.get(pk=author_id)
+        loaded = await Author.objects.get(pk=author_id)
+        cache = get_request_cache()
+        assert cache is not None
+        return {"name": loaded.name, "hits": cache.hits}
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        with StatementCounter(base_ormar_config) as counter:
+            for _ in range(2):
+                response = await client.get(f"/authors/{author.pk}")
+                assert response.json() == {"name": "Ann", "hits": 1}
+        assert len(counter.selects) == 2
+    assert get_request_cache() is None
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+import ormar
+from ormar.databases.single_flight import SingleFlight
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config(single_flight=True)
+
+
+class Currency(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="sf_currencies")
+
+    id: int = ormar.Integer(primary_key=True)
+    code: str = ormar.String(max_length=3)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest_asyncio.fixture()
+async def currencies():
+    async with base_ormar_config.database:
+        created = [
+            await Currency.objects.create(code=code) for code in ("EUR", "USD", "PLN")
+        ]
+        yield created
+        await Currency.objects.delete(each=True)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_queries_share_one_execution(currencies):
+    single_flight = base_ormar_config.database.single_flight
+    with StatementCounter(base_ormar_config) as counter:
+        results = await asyncio.gather(
+            *[Currency.objects.get(pk=currencies[0].pk) for _ in range(10)],
+            *[Currency.objects.order_by("code").all() for _ in range(5)],
+        )
+    assert len(counter.selects) == 2
+    assert single_flight.shared >= 13
+    assert len(single_flight) == 0
+
+    singles, listings = results[:10], results[10:]
+    assert all(currency.code == "EUR" for currency in singles)
+    assert len({id(currency) for currency in singles}) == 10
+    assert all(
+        [currency.code for currency in listing] == ["EUR", "PLN", "USD"]
+        for listing in listings
+    )
+    assert listings[0][0] is not listings[1][0]
+
+    with StatementCounter(base_ormar_config) as counter:
+        await asyncio.gather(
+            Currency.objects.get(pk=currencies[0].pk),
+            Currency.objects.get(pk=currencies[1].pk),
+        )
+    assert len(counter.selects) == 2
+
+
+@pytest.mark.asyncio
+async def test_queries_in_transaction_are_not_shared(currencies):
+    async with base_ormar_config.database.transaction():
+        with StatementCounter(base_ormar_config) as counter:
+            for _ in range(2):
+                await Currency.objects.get(pk=currencies[0].pk)
+        assert len(counter.selects) == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_errors_and_survives_cancellation():
+    single_flight = SingleFlight()
+    calls = []
+
+    async def failing() -> None:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        *[single_flight.do("key", failing) for _ in range(3)], return_exceptions=True
+    )
+    assert len(calls) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+    async def slow() -> str:
+        await asyncio.sleep(0.01)
+        return "done"
+
+    first = asyncio.ensure_future(single_flight.do("slow", slow))
+    second = asyncio.ensure_future(single_flight.do("slow", slow))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == "done"
+    assert len(single_flight) == 0
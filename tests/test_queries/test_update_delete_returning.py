@@ -0,0 +1,117 @@
+from typing import Optional
+
+import pytest
+
+import ormar
+from ormar.exceptions import QueryDefinitionError
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Category(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="ret_categories")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Task(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="ret_tasks")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100, name="task_title")
+    priority: int = ormar.Integer(default=0)
+    done: bool = ormar.Boolean(default=False)
+    category: Optional[Category] = ormar.ForeignKey(Category)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.mark.asyncio
+async def test_update_returning_returns_updated_models():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            category = await Category.objects.create(name="home")
+            await Task.objects.create(title="a", priority=1, category=category)
+            await Task.objects.create(title="b", priority=5)
+            await Task.objects.create(title="c", priority=7)
+
+            with StatementCounter(base_ormar_config) as counter:
+                tasks = await Task.objects.filter(priority__lt=6).update_returning(
+                    done=True, priority=Task.priority + 10
+                )
+            assert len(counter.statements) == 1
+            assert "RETURNING" in counter.statements[0]
+
+            tasks = sorted(tasks, key=lambda t: t.title)
+            assert [t.title for t in tasks] == ["a", "b"]
+            assert [t.priority for t in tasks] == [11, 15]
+            assert all(t.done and t.saved for t in tasks)
+            assert tasks[0].category.pk == category.pk
+            assert tasks[1].category is None
+
+            not_updated = await Task.objects.get(title="c")
+            assert not not_updated.done
+
+            tasks = await Task.objects.filter(title="missing").update_returning(
+                done=False
+            )
+            assert tasks == []
+
+            with pytest.raises(QueryDefinitionError):
+                await Task.objects.update_returning(done=False)
+
+
+@pytest.mark.asyncio
+async def test_delete_returning_returns_deleted_models():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await Task.objects.create(title="a", priority=1)
+            await Task.objects.create(title="b", priority=5)
+            await Task.objects.create(title="c", priority=7)
+
+            with StatementCounter(base_ormar_config) as counter:
+                deleted = await Task.objects.delete_returning(priority__gt=3)
+            assert len(counter.statements) == 1
+            assert sorted(t.title for t in deleted) == ["b", "c"]
+            assert not any(t.saved for t in deleted)
+            assert await Task.objects.count() == 1
+
+            with pytest.raises(QueryDefinitionError):
+                await Task.objects.delete_returning()
+
+            deleted = await Task.objects.delete_returning(each=True)
+            assert [t.title for t in deleted] == ["a"]
+            assert await Task.objects.count() == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_returning_discards_models_from_identity_map():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            task = await Task.objects.create(title="a", priority=1)
+            with ormar.identity_map() as identity_map:
+                loaded = await Task.objects.get(pk=task.pk)
+                assert identity_map.get(Task, task.pk) is loaded
+
+                await Task.objects.delete_returning(pk=task.pk)
+                assert identity_map.get(Task, task.pk) is None
+
+                recreated = await Task.objects.create(id=task.pk, title="b")
+                assert (await Task.objects.get(pk=task.pk)).title == "b"
+                assert recreated is not loaded
+
+
+@pytest.mark.asyncio
+async def test_returning_not_supported(monkeypatch):
+    async with base_ormar_config.database:
+        dialect = base_ormar_config.database.dialect
+        monkeypatch.setattr(dialect, "update_returning", False)
+        monkeypatch.setattr(dialect, "delete_returning", False)
+        with pytest.raises(QueryDefinitionError, match="RETURNING"):
+            await Task.objects.update_returning(each=True, done=True)
+        with pytest.raises(QueryDefinitionError, match="RETURNING"):
+            await Task.objects.delete_returning(each=True)
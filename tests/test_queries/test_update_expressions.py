@@ -0,0 +1,112 @@
+from typing import Optional
+
+import pytest
+
+import ormar
+from ormar.exceptions import QueryDefinitionError
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Author(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="expr_authors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=100)
+
+
+class Post(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="expr_posts")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=100)
+    views: int = ormar.Integer(default=0, name="view_count")
+    likes: int = ormar.Integer(default=0)
+    revision: int = ormar.Integer(default=1, on_update=2)
+    author: Optional[Author] = ormar.ForeignKey(Author)
+
+
+class OrderLine(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="expr_order_lines")
+
+    id: int = ormar.Integer(primary_key=True)
+    price: float = ormar.Float()
+    quantity: int = ormar.Integer()
+    total: float = ormar.Float(default=0)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.mark.asyncio
+async def test_queryset_update_with_expressions():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            await Post.objects.create(title="a", views=1, likes=3)
+            await Post.objects.create(title="b", views=5, likes=1)
+
+            updated = await Post.objects.filter(title="a").update(
+                views=Post.views + 1, likes=2 * Post.likes - 1
+            )
+            assert updated == 1
+            post = await Post.objects.get(title="a")
+            assert post.views == 2
+            assert post.likes == 5
+            assert post.revision == 2
+
+            await Post.objects.update(each=True, likes=Post.views)
+            posts = await Post.objects.order_by("title").all()
+            assert [p.likes for p in posts] == [2, 5]
+
+            await OrderLine.objects.create(price=2.5, quantity=4)
+            await OrderLine.objects.update(
+                each=True, total=OrderLine.price * OrderLine.quantity
+            )
+            line = await OrderLine.objects.get()
+            assert line.total == 10.0
+
+            await OrderLine.objects.update(each=True, total=OrderLine.total / 4)
+            line = await OrderLine.objects.get()
+            assert line.total == 2.5
+
+
+@pytest.mark.asyncio
+async def test_model_update_and_increment_refresh_only_changed_column():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            post = await Post.objects.create(title="a", views=10)
+            await Post.objects.filter(id=post.id).update(views=Post.views + 5)
+
+            with StatementCounter(base_ormar_config) as counter:
+                await post.increment("views")
+            assert len(counter.statements) == 1
+            assert post.views == 16
+            assert post.revision == 2
+            assert post.saved
+
+            await post.increment("views", by=-6)
+            assert post.views == 10
+
+            await post.update(title="b", likes=Post.likes + Post.views)
+            assert post.likes == 10
+            loaded = await Post.objects.get(id=post.id)
+            assert loaded.title == "b"
+            assert loaded.likes == 10
+            assert loaded.views == 10
+
+
+@pytest.mark.asyncio
+async def test_expressions_have_to_use_own_fields():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            post = await Post.objects.create(title="a")
+            with pytest.raises(QueryDefinitionError):
+                await Post.objects.update(each=True, views=Post.author.id + 1)
+            with pytest.raises(QueryDefinitionError):
+                await Post.objects.update(each=True, views=OrderLine.quantity + 1)
+            with pytest.raises(QueryDefinitionError):
+                await Post.objects.update(each=True, views=Author.id + 1)
+            with pytest.raises(QueryDefinitionError):
+                await post.update(author=Post.views + 1)
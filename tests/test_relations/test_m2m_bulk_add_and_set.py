@@ -0,0 +1,175 @@
+from typing import Optional
+
+import pytest
+
+import ormar
+from ormar.exceptions import ModelPersistenceError, RelationshipInstanceError
+from tests.lifespan import StatementCounter, init_tests
+from tests.settings import create_config
+
+base_ormar_config = create_config()
+
+
+class Author(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="bulk_m2m_authors")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=80)
+
+
+class Tag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="bulk_m2m_tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    name: str = ormar.String(max_length=40)
+
+
+class PostTag(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="bulk_m2m_posts_tags")
+
+    id: int = ormar.Integer(primary_key=True)
+    source: str = ormar.String(max_length=20, default="manual")
+
+
+class Post(ormar.Model):
+    ormar_config = base_ormar_config.copy(tablename="bulk_m2m_posts")
+
+    id: int = ormar.Integer(primary_key=True)
+    title: str = ormar.String(max_length=200)
+    tags: Optional[list[Tag]] = ormar.ManyToMany(Tag, through=PostTag)
+    author: Optional[Author] = ormar.ForeignKey(Author)
+
+
+create_test_database = init_tests(base_ormar_config)
+
+
+@pytest.mark.asyncio
+async def test_add_many_inserts_through_rows_at_once():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            post = await Post.objects.create(title="Hello")
+            tags = [await Tag.objects.create(name=f"tag{i}") for i in range(5)]
+
+            with StatementCounter(base_ormar_config) as counter:
+                await post.tags.add_many(tags + tags[:2], source="import")
+            assert len(counter.writes) == 1
+            assert len(post.tags) == 5
+            assert all(post in tag.posts for tag in tags)
+
+            await post.tags.add_many(tags[:3])
+            assert len(post.tags) == 5
+
+            loaded = await Post.objects.select_related("tags").get(pk=post.pk)
+            assert sorted(t.name for t in loaded.tags) == [f"tag{i}" for i in range(5)]
+            assert all(t.posttag.source == "import" for t in loaded.tags)
+
+            with pytest.raises(ModelPersistenceError):
+                await post.tags.add_many([Tag(name="unsaved")])
+
+
+@pytest.mark.asyncio
+async def test_set_writes_only_the_difference():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            post = await Post.objects.create(title="Hello")
+            tags = [await Tag.objects.create(name=f"tag{i}") for i in range(6)]
+            await post.tags.add_many(tags[:4])
+
+            post = await Post.objects.get(pk=post.pk)
+            await post.tags.all()
+            with StatementCounter(base_ormar_config) as counter:
+                await post.tags.set(tags[2:])
+            assert len(counter.writes) == 2
+            assert sorted(t.name for t in post.tags) == [
+                "tag2",
+                "tag3",
+                "tag4",
+                "tag5",
+            ]
+
+            loaded = await Post.objects.select_related("tags").get(pk=post.pk)
+            assert sorted(t.name for t in loaded.tags) == [
+                "tag2",
+                "tag3",
+                "tag4",
+                "tag5",
+            ]
+
+            with StatementCounter(base_ormar_config) as counter:
+                await post.tags.set(tags[2:])
+            assert counter.writes == []
+
+            await post.tags.set([])
+            assert len(post.tags) == 0
+            assert await PostTag.objects.count() == 0
+
+
+@pytest.mark.asyncio
+async def test_set_sends_signals_for_not_loaded_children():
+    events = []
+
+    @ormar.pre_relation_remove(Post)
+    async def before_remove(sender, instance, child, relation_name, **kwargs):
+        events.append(("remove", child.pk))
+
+    @ormar.post_relation_add(Post)
+    async def after_add(sender, instance, child, relation_name, **kwargs):
+        events.append(("add", child.pk))
+
+    try:
+        async with base_ormar_config.database:
+            async with base_ormar_config.database.transaction(force_rollback=True):
+                post = await Post.objects.create(title="Hello")
+                tags = [await Tag.objects.create(name=f"tag{i}") for i in range(3)]
+                await post.tags.add_many(tags[:2])
+                events.clear()
+
+                post = await Post.objects.get(pk=post.pk)
+                await post.tags.set(tags[1:])
+                assert sorted(events) == [("add", tags[2].pk), ("remove", tags[0].pk)]
+    finally:
+        Post.ormar_config.signals.pre_relation_remove.disconnect(before_remove)
+        Post.ormar_config.signals.post_relation_add.disconnect(after_add)
+
+
+@pytest.mark.asyncio
+async def test_unsaved_children_are_rejected_before_signals():
+    events = []
+
+    @ormar.pre_relation_add(Post)
+    async def before_add(sender, instance, child, relation_name, **kwargs):
+        events.append(("add", child.name))
+
+    @ormar.pre_relation_remove(Post)
+    async def before_remove(sender, instance, child, relation_name, **kwargs):
+        events.append(("remove", child.pk))
+
+    try:
+        async with base_ormar_config.database:
+            async with base_ormar_config.database.transaction(force_rollback=True):
+                post = await Post.objects.create(title="Hello")
+                saved = await Tag.objects.create(name="saved")
+                await post.tags.add_many([saved])
+                events.clear()
+
+                with pytest.raises(ModelPersistenceError):
+                    await post.tags.add_many([Tag(name="unsaved")])
+                with pytest.raises(ModelPersistenceError):
+                    await post.tags.set([Tag(name="unsaved")])
+                assert events == []
+                assert await PostTag.objects.count() == 1
+    finally:
+        Post.ormar_config.signals.pre_relation_add.disconnect(before_add)
+        Post.ormar_config.signals.pre_relation_remove.disconnect(before_remove)
+
+
+@pytest.mark.asyncio
+async def test_bulk_methods_require_many_to_many():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            author = await Author.objects.create(name="Guido")
+            post = await Post.objects.create(title="Hello")
+            with pytest.raises(RelationshipInstanceError):
+                await author.posts.add_many([post])
+            with pytest.raises(RelationshipInstanceError):
+                await author.posts.set([post])
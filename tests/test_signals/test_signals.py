@@ -5,6 +5,7 @@ import pytest
 
 import ormar
 from ormar import (
+    post_bulk_create,
     post_bulk_update,
     post_delete,
     post_save,
@@ -365,3 +366,19 @@ async def test_custom_signal():
             assert not album.is_best_seller
 
             Album.ormar_config.signals.custom.disconnect(after_update)
+
+
+@pytest.mark.asyncio
+async def test_post_bulk_create_signal():
+    async with base_ormar_config.database:
+        async with base_ormar_config.database.transaction(force_rollback=True):
+            created = []
+
+            @post_bulk_create(Cover)
+            async def after_bulk_create(sender, instances, **kwargs):
+                created.append((sender, [cover.title for cover in instances]))
+
+            await Cover.objects.bulk_create([Cover(title="A"), Cover(title="B")])
+            assert created == [(Cover, ["A", "B"])]
+
+            Cover.ormar_config.signals.post_bulk_create.disconnect(after_bulk_create)